@@ -31,6 +31,7 @@ from ciscoconfparse.ciscoconfparse import *
 from ciscoconfparse.ccp_util import IPv4Obj
 from ciscoconfparse.ccp_util import IPv6Obj
 from ciscoconfparse.ccp_util import CiscoIOSInterface, CiscoIOSXRInterface
+from ciscoconfparse.ccp_util import FrozenCiscoIOSInterface
 from ciscoconfparse.ccp_util import CiscoRange
 from ciscoconfparse.ccp_util import run_this_posix_command
 from ciscoconfparse.ccp_util import ccp_logger_control
@@ -45,6 +46,10 @@ from ciscoconfparse.ccp_util import _get_ipv4
 from ciscoconfparse.ccp_util import _get_ipv6
 from ciscoconfparse.ccp_util import ip_factory
 from ciscoconfparse.ccp_util import collapse_addresses
+from ciscoconfparse.ccp_util import IPPrefixTrie
+from ciscoconfparse.ccp_util import IPAddressSpace
+from ciscoconfparse.ccp_util import configure_ip_intern_cache
+from ciscoconfparse.ccp_util import ip_intern_cache_info
 from ciscoconfparse.ccp_util import L4Object
 from ciscoconfparse.ccp_util import DNSResponse
 from ciscoconfparse.ccp_util import dns_query
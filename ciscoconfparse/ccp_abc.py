@@ -19,6 +19,7 @@ r""" ccp_abc.py - Parse, Query, Build, and Modify IOS-style configurations
 """
 
 from abc import ABCMeta
+from functools import lru_cache
 import warnings
 import inspect
 import re
@@ -29,6 +30,31 @@ from loguru import logger
 
 DEFAULT_TEXT = "__undefined__"
 
+# An anchored childspec such as r'^\s+shutdown' can only match children whose
+#     first word starts with its literal prefix ('shutdown')
+_CHILDSPEC_KEYWORD_RE = re.compile(r"^\^(?:\\s[+*]?| [+*]?)?([\w-]+)(.?)")
+
+
+# do NOT wrap with @logger.catch(...)
+@lru_cache(maxsize=256)
+def _childspec_keyword(childspec):
+    """Return the literal prefix which must start the first word of any line matching `childspec`, or None if `childspec` does not have one."""
+    if isinstance(childspec, re.Pattern):
+        if childspec.flags & (re.IGNORECASE | re.VERBOSE):
+            return None
+        childspec = childspec.pattern
+    if not isinstance(childspec, str) or "|" in childspec or "(?" in childspec:
+        return None
+
+    mm = _CHILDSPEC_KEYWORD_RE.search(childspec)
+    if mm is None:
+        return None
+    keyword, next_char = mm.groups()
+    if next_char in ("?", "*", "{"):
+        # The last literal character is optional...
+        keyword = keyword[:-1]
+    return keyword or None
+
 #
 # -------------  Config Line ABC
 #
@@ -49,6 +75,8 @@ class BaseCfgLine(metaclass=ABCMeta):
     text = DEFAULT_TEXT  # Use self.text setter method to set this value
 
     _line_id = None
+    _diff_id_cache = None
+    _child_keyword_cache = None
     diff_rendered = None
     diff_linenum = -1
     _diff_word = ""  # diff_word: 'keep', 'remove', 'unchanged', 'add'
@@ -84,7 +112,9 @@ class BaseCfgLine(metaclass=ABCMeta):
         self.all_text = all_lines
         self.text = line  # Use self.text setter method to set this value
 
-        self._line_id = None
+        # self._line_id is set by the self.text setter method
+        self._diff_id_cache = None
+        self._child_keyword_cache = None
         self.diff_rendered = None
         self.diff_linenum = -1
         self._diff_word = ""  # diff_word: 'keep', 'remove', 'unchanged', 'add'
@@ -216,7 +246,7 @@ class BaseCfgLine(metaclass=ABCMeta):
         """Set the .is_comment attribute for this object."""
         delimiters = set(self.comment_delimiter)
         ## Use this instead of a regex... nontrivial speed enhancement
-        tmp = self.text.lstrip()
+        tmp = self._text.lstrip()
         for delimit_char in delimiters:
             if len(tmp) > 0 and (delimit_char == tmp[len(delimit_char) - 1]):
                 self.is_comment = True
@@ -241,15 +271,15 @@ class BaseCfgLine(metaclass=ABCMeta):
         The `hash()` of `self.text` is used to build a numerical identity
         for a given BaseCfgLine().
 
-        Do NOT cache this value.  It must be recalculated when self._text
-        changes.
+        The self.text setter stores this value in self.line_id; it must be
+        recalculated when self._text changes.
         """
         indent = self.indent
 
         # Do NOT make changes to _line_id.  This hash() value built from
         #     _line_id is the glue that holds `ciscoconfparse.HDiff()`
         #     together.
-        _line_id = hash(" " * indent + " ".join(self.text.strip().split()))
+        _line_id = hash(" " * indent + " ".join(self._text.strip().split()))
 
         if bool([]): # Do not execute this code...
             ##################################################################
@@ -287,28 +317,37 @@ class BaseCfgLine(metaclass=ABCMeta):
 
         object id integers are NOT the same between script runs.
         """
-        retval = []
-        len_geneology = len(self.geneology)
-
-        for idx, obj in enumerate(self.geneology):
-            # W0212: Access to a protected attribute (i.e. with leading underscore)
-            obj._line_id = obj.calculate_line_id() # noqa: W0212
-
-            # idx = 0 is the oldest ancestor
-            if idx == 0:
-                # This object is NOT a child
-                retval.insert(0, obj._line_id)
-
-            elif idx <= len_geneology - 1:
-                # This object is a child of self.parent
-                retval.insert(0, obj._line_id)
-
         # retval usually looks like this (example with a single parent obj):
         #
         #                          [-1387406312585020591, 3965133112392387338]
         #  root / oldest _line_id:                        ^^^^^^^^^^^^^^^^^^^
         #  child object _line_id:   ^^^^^^^^^^^^^^^^^^^^
-        return retval
+        return list(self.diff_id_tuple())
+
+    # do NOT wrap with @logger.catch(...)
+    # On BaseCfgLine()
+    def diff_id_tuple(self):
+        """
+        Return :attr:`diff_id_list` as a tuple.
+
+        The tuple is cached on this object.  The cache is checked against
+        self.line_id and the parent's tuple on each call, so it is rebuilt
+        after the text or the parent of this object (or any ancestor) changes.
+        """
+        if self._line_id is None:
+            self._line_id = self.calculate_line_id()
+
+        parent = self.parent
+        if parent is self or parent is None:
+            parent_ids = ()
+        else:
+            parent_ids = parent.diff_id_tuple()
+
+        cache = self._diff_id_cache
+        if cache is None or cache[0] is not parent_ids or cache[1] != self._line_id:
+            cache = (parent_ids, self._line_id, (self._line_id,) + parent_ids)
+            self._diff_id_cache = cache
+        return cache[2]
 
     # On BaseCfgLine()
     @property
@@ -419,6 +458,10 @@ class BaseCfgLine(metaclass=ABCMeta):
         # self._text = self.indent * " " + " ".join([ii.strip() for ii in _newtext_.split()])
         self._text = newtext_
         self.line_id = self.calculate_line_id()
+        # The parent's keyword index may have filed this object under
+        #     the old first word...
+        if self.parent is not None:
+            self.parent._child_keyword_cache = None
 
         self.set_comment_bool()
         if self.is_comment is True:
@@ -670,55 +713,12 @@ class BaseCfgLine(metaclass=ABCMeta):
         if self.confobj.debug >= 1:
             logger.info("{}.delete(recurse={}) was called.".format(self, recurse))
 
-        # Build a set of all IOSCfgLine() object instances to be deleted...
-        delete_these = set(
-            {
-                self,
-            }
-        )
-
-        if recurse is True:
-            if self.confobj.debug >= 1:
-                logger.debug(
-                    "Executing <IOSCfgLine line #{}>.delete(recurse=True)".format(
-                        self.linenum
-                    )
-                )
-
-            # NOTE - 1.5.30 changed this from iterating over self.children
-            #        to self.all_children
-            for child in self.all_children:
-                delete_these.add(child)
-
-            # reverse is important here so we can delete a range of line numbers
-            # without clobbering the line numbers that haven't been deleted
-            # yet...
-            for obj in sorted(delete_these, reverse=True):
-                linenum = obj.linenum
-                if self.confobj.debug >= 1:
-                    logger.debug(
-                        "    Deleting <IOSCfgLine(line # {})>.".format(linenum)
-                    )
-                del self.confobj._list[linenum]
-
-        else:
-            if self.confobj.debug >= 1:
-                logger.debug(
-                    "Executing <IOSCfgLine line #{}>.delete(recurse=False)".format(
-                        self.linenum
-                    )
-                )
-            ## Consistency check to refuse deletion of the wrong object...
-            ##    only delete if the line numbers are consistent
-            text = self.text
-            linenum = self.linenum
-            assert self.confobj._list[linenum].text == text
-
-            if self.confobj.debug >= 1:
-                logger.debug("    Deleting <IOSCfgLine(line # {})>.".format(linenum))
-            del self.confobj._list[linenum]
-
-        self.confobj.reassign_linenums()
+        # bulk_delete() walks the children once and compacts the list with
+        #     one pass; sorting self.all_children and calling del for
+        #     each object was quadratic for large families.  Objects are
+        #     matched by identity, so a stale linenum can never delete the
+        #     wrong object (the old recurse=False linenum assert is not needed)
+        self.confobj.bulk_delete([self], recurse=recurse)
         return True
 
     # On BaseCfgLine()
@@ -770,10 +770,14 @@ class BaseCfgLine(metaclass=ABCMeta):
            !
            >>>
         """
-        # if / else in a list comprehension... ref ---> https://stackoverflow.com/a/9442777/667301
+        # Delete all matching children with one pass over the config...
+        matches = [bool(obj.re_search(linespec)) for obj in self.children]
         retval = [
-            (obj.delete() if obj.re_search(linespec) else obj) for obj in self.children
+            (True if matched else obj) for obj, matched in zip(self.children, matches)
         ]
+        victims = [obj for obj, matched in zip(self.children, matches) if matched]
+        if len(victims) > 0:
+            self.confobj.bulk_delete(victims, recurse=True)
         return retval
 
     # On BaseCfgLine()
@@ -785,11 +789,76 @@ class BaseCfgLine(metaclass=ABCMeta):
         # TODO - check whether using re_match_iter_typed() is faster than this:
         ll = linespec
         if all_children is False:
+            candidates = self._keyword_candidate_children(ll, substring=True)
+            if candidates is not None:
+                return bool(len([ll for cobj in candidates if cobj.re_search(ll)]))
             offspring = self.children
         else:
             offspring = self.all_children
         return bool(len([ll for cobj in offspring if cobj.re_search(ll)]))
 
+    # On BaseCfgLine()
+    def child_keyword_index(self):
+        """
+        Return a dict of this object's children, keyed by the first word of
+        each child's text (i.e. 'switchport', 'ip' or 'shutdown').  Each value
+        is a list of children, in config order.
+
+        The index is built on first use and cached on this object.  The cache
+        is checked against self.children on each call, and the text setter
+        clears the parent's cache, so it is rebuilt after children are added,
+        removed or modified.
+        """
+        return {word: list(bucket) for word, bucket in self._child_keyword_index()[1].items()}
+
+    # On BaseCfgLine()
+    def _child_keyword_index(self):
+        """Return a cached (children snapshot, keyword dict, joined children text, keyword prefix dict) tuple"""
+        children = self.children
+        cache = self._child_keyword_cache
+        # list != list compares by identity first, so this is a fast check...
+        if cache is None or cache[0] != children:
+            keywords = {}
+            for cobj in children:
+                words = cobj._text.split(None, 1)
+                keywords.setdefault(words[0] if words else "", []).append(cobj)
+            cache = (list(children), keywords, "\n".join([cobj._text for cobj in children]), {})
+            self._child_keyword_cache = cache
+        return cache
+
+    # On BaseCfgLine()
+    def _keyword_candidate_children(self, regex, substring=False):
+        """Return the children which could match `regex`, in config order, from the keyword index.  Return None if `regex` has no literal keyword, and all children must be searched.  Set `substring` True for re_search(), which also matches children containing `regex` as a plain substring."""
+        keyword = _childspec_keyword(regex)
+        if keyword is None:
+            return None
+
+        children, keywords, joined_text, prefixes = self._child_keyword_index()
+        if len(children) > 0:
+            # Raise re.error for a bad regex, as searching all children would
+            re.compile(regex)
+        if substring is True and isinstance(regex, str):
+            if "\n" in regex or regex in joined_text:
+                # re_search() could match any child with a substring...
+                return None
+
+        retval = prefixes.get(keyword, None)
+        if retval is None:
+            buckets = [bucket for word, bucket in keywords.items() if word.startswith(keyword)]
+            if len(buckets) == 0:
+                retval = []
+            elif len(buckets) == 1:
+                retval = buckets[0]
+            else:
+                # Restore config order across several buckets...
+                position = {id(cobj): idx for idx, cobj in enumerate(children)}
+                retval = sorted(
+                    (cobj for bucket in buckets for cobj in bucket),
+                    key=lambda cobj: position[id(cobj)],
+                )
+            prefixes[keyword] = retval
+        return retval
+
     # On BaseCfgLine()
     @junos_unsupported
     def insert_before(self, insertstr=None):
@@ -1089,7 +1158,14 @@ class BaseCfgLine(metaclass=ABCMeta):
             self.delete()
             return
 
+        # Unchanged text keeps its line_id and comment state...
+        if retval == self._text:
+            return retval
+
         self._text = retval
+        self.line_id = self.calculate_line_id()
+        if self.parent is not None:
+            self.parent._child_keyword_cache = None
         self.set_comment_bool()
         return retval
 
@@ -1186,7 +1262,11 @@ class BaseCfgLine(metaclass=ABCMeta):
             A list of matching :class:`~models_cisco.IOSCfgLine` objects which matched.  If there is no match, an empty :py:func:`list` is returned.
         """
         if recurse is False:
-            return [cobj for cobj in self.children if cobj.re_search(regex)]
+            # Literal-prefixed regex only search children in one keyword bucket
+            candidates = self._keyword_candidate_children(regex, substring=True)
+            if candidates is None:
+                candidates = self.children
+            return [cobj for cobj in candidates if cobj.re_search(regex)]
         else:
             return [cobj for cobj in self.all_children if cobj.re_search(regex)]
 
@@ -1349,7 +1429,10 @@ class BaseCfgLine(metaclass=ABCMeta):
                 return result_type(mm.group(group))
 
             if recurse is False:
-                for cobj in self.children:
+                candidates = self._keyword_candidate_children(regex)
+                if candidates is None:
+                    candidates = self.children
+                for cobj in candidates:
                     if debug is True:
                         logger.debug(f"    {self}.re_match_iter_typed() is checking match of r'''{regex}''' on -->{cobj}<--")
                     mm = re.search(regex, cobj.text)
@@ -37,11 +37,13 @@
 #pragma warning disable S6395
 
 from operator import attrgetter
-from functools import wraps
+from bisect import bisect_right
+from functools import wraps, lru_cache
 import subprocess
 import locale
 import socket
 import shlex
+import warnings
 import time
 import copy
 import sys
@@ -50,7 +52,6 @@ import os
 
 from collections.abc import MutableSequence, Sequence
 from ipaddress import IPv4Network, IPv6Network, IPv4Address, IPv6Address
-from ipaddress import collapse_addresses as ipaddr_collapse_addresses
 from ipaddress import AddressValueError
 
 from dns.exception import DNSException
@@ -838,45 +839,191 @@ def ip_factory(val="", stdlib=False, mode="auto_detect", debug=0):
 @logger.catch(reraise=True)
 def collapse_addresses(network_list):
     """
-    This is a ciscoconfparse proxy for ipaddress.collapse_addresses()
+    This is a ciscoconfparse replacement for ipaddress.collapse_addresses()
 
     It attempts to summarize network_list into the closest network(s)
     containing prefixes in `network_list`.
 
     Return an iterator of the collapsed IPv4Network or IPv6Network objects.
-    addresses is an iterator of IPv4Network or IPv6Network objects. A
-    TypeError is raised if addresses contains mixed version objects.
+    network_list is a sequence of IPv4Obj, IPv6Obj, IPv4Network or
+    IPv6Network objects; IPv4 and IPv6 inputs may be mixed, and collapsed
+    IPv4 networks are returned before IPv6 networks.  See
+    :class:`~ccp_util.IPAddressSpace` for the summarization engine.
     """
     if not isinstance(network_list, Sequence):
         raise ValueError
 
-    @logger.catch(reraise=True)
-    def ip_net(arg):
-        if isinstance(arg, IPv4Obj):
-            return arg.network
-        elif isinstance(arg, IPv4Network):
-            return arg
-        elif isinstance(arg, IPv6Obj):
-            return arg.network
-        elif isinstance(arg, IPv6Network):
-            return arg
-        else:
+    for arg in network_list:
+        if not isinstance(arg, (IPv4Obj, IPv4Network, IPv6Obj, IPv6Network)):
             raise ValueError("collapse_addresses() isn't sure how to handle %s" % arg)
 
-    return ipaddr_collapse_addresses([ip_net(ii) for ii in network_list])
+    return iter(IPAddressSpace(network_list).collapse(stdlib=True))
+
+
+# do NOT wrap with @logger.catch(...)
+def _parse_ipv4_str(v4input):
+    """Parse an IPv4 address string, with an optional netmask or masklength, into an (integer_address, prefixlen) tuple"""
+    v4_str_rgx = _RGX_IPV4ADDR_WITH_MASK.search(v4input.strip())
+    if v4_str_rgx is not None:
+        v4_groupdict = v4_str_rgx.groupdict()
+    else:
+        v4_groupdict = {}
+
+    v4addr_nomask = v4_groupdict.get("v4addr_nomask", None) or ""
+    v4addr_netmask = v4_groupdict.get("v4addr_netmask", None) or ""
+    v4addr_prefixlen = v4_groupdict.get("v4addr_prefixlen", None) or ""
+    netmask = v4_groupdict.get("netmask", None) or ""
+    prefixlen = v4_groupdict.get("masklen", None) or ""
+
+    # There is a bug here... if I don't use this if condition, address
+    #     parsing fails
+    if netmask == "" and prefixlen == "":
+        prefixlen = "32"
+
+    # Fix parsing problems...
+    if not re.search(r"^\d+$", prefixlen.strip()):
+        prefixlen = ""
+    if not re.search(r"^\d+\.\d+\.\d+\.\d+$", netmask.strip()):
+        netmask = ""
+
+    # Fix a tricky parsing error above... both netmask and prefixlen should
+    #     not be defined...
+    if netmask != "" and prefixlen != "":
+        prefixlen = ""
+
+    v4addr = f"{v4addr_nomask}{v4addr_netmask}{v4addr_prefixlen}"
+    mask_prefixlen = f"{netmask}{prefixlen}"
+    if re.search(r"\d+\.\d+\.\d+\.\d+", v4addr):
+        addr = int(IPv4Address(v4addr))
+        network_object = IPv4Network(f"{v4addr}/{mask_prefixlen}", strict=False)
+        return addr, network_object.prefixlen
+    elif v4addr == "dhcp":
+        raise DynamicAddressException("Cannot parse address from a DHCP string.")
+    else:
+        raise AddressValueError(
+            f"Could not parse '{v4input}' {type(v4input)} into an IPv4 Address"
+        )
+
+
+# do NOT wrap with @logger.catch(...)
+def _parse_ipv6_str(v6addr_prefixlen):
+    """Parse an IPv6 address string, with an optional masklength, into an (integer_address, prefixlen) tuple"""
+    if len(v6addr_prefixlen) > IPV6_MAXSTR_LEN:
+        raise RequirementFailure()
+
+    tmp = re.split(r"\s+", v6addr_prefixlen.strip())
+    if len(tmp) == 2:
+        v6addr_prefixlen = "/".join(tmp)
+    elif len(tmp) == 1:
+        v6addr_prefixlen = tmp[0]
+    else:
+        raise NotImplementedError(v6addr_prefixlen.strip())
+
+    v6_str_rgx = _RGX_IPV6ADDR.search(v6addr_prefixlen.strip())
+    # Example 'v6_groupdict'
+    #     v6_groupdict = {'addr': '2b00:cd80:14:10::1', 'opt1': None, 'opt2': None, 'opt3': None, 'opt4': None, 'opt5': '2b00:cd80:14:10::1', 'opt6': None, 'opt7': None, 'opt8': None, 'opt9': None, 'opt10': None, 'masklen': '64'}
+    v6_groupdict = v6_str_rgx.groupdict()
+    for key in ["addr", "opt1", "opt2", "opt3", "opt4", "opt5", "opt6", "opt7", "opt8", "opt9", "opt10", "opt11"]:
+        _ipv6 = v6_groupdict[key]
+        if _ipv6 is not None:
+            break
+    else:
+        _ipv6 = "::1"
+    if _ipv6 is None:
+        raise RequirementFailure()
+
+    addr = int(IPv6Address(_ipv6))
+    if isinstance(v6_groupdict["masklen"], str):
+        netstr = _ipv6 + "/" + v6_groupdict["masklen"]
+    # FIXME - this probably should be removed...
+    #elif isinstance(v6_groupdict["netmask"], str):
+    #    netstr = ipv6 + "/" + v6_groupdict["netmask"]
+    else:
+        netstr = _ipv6 + "/128"
+    return addr, IPv6Network(netstr, strict=False).prefixlen
+
+
+# do NOT wrap with @logger.catch(...)
+@lru_cache(maxsize=128)
+def _ipv4_mask_prefixlen(str_mask):
+    """Return the prefixlen of an IPv4 netmask, hostmask or masklength string.  There are very few valid masks, so the results are always cached."""
+    return IPv4Network(f"0.0.0.0/{str_mask.strip()}").prefixlen
+
+
+# do NOT wrap with @logger.catch(...)
+@lru_cache(maxsize=256)
+def _ipv6_mask_prefixlen(str_masklen):
+    """Return the prefixlen of an IPv6 masklength string."""
+    return IPv6Network(f"::/{str_masklen.strip()}").prefixlen
+
+
+# do NOT wrap with @logger.catch(...)
+def _warn_network_object_setter(ipobj, network, network_class):
+    """Warn if `network` is not the network of `ipobj` at the new prefixlen; IPv4Obj() and IPv6Obj() no longer store a separate network_object, so only the prefixlen of `network` is kept"""
+    if ipobj.empty is True:
+        return
+    if network_class((ipobj._ip, network.prefixlen), strict=False) != network:
+        warnings.warn(
+            f"{ipobj.dna}().network_object = {network} only sets the prefixlen; the address {ipobj.ip_object} is retained, so the network is {network_class((ipobj._ip, network.prefixlen), strict=False)}",
+            DeprecationWarning,
+            stacklevel=3,
+        )
+
+
+# IPv4Obj() and IPv6Obj() parse strings with these; configure_ip_intern_cache()
+#     swaps them for bounded lru_cache() wrappers
+_IPV4_STR_PARSER = _parse_ipv4_str
+_IPV6_STR_PARSER = _parse_ipv6_str
+
+
+@logger.catch(reraise=True)
+def configure_ip_intern_cache(maxsize=4096):
+    """
+    Enable (or disable) a bounded cache of parsed IPv4Obj() and IPv6Obj()
+    address strings.
+
+    When enabled, the same address string (i.e. '192.0.2.1/24' on thousands
+    of devices) is only parsed once; later IPv4Obj() / IPv6Obj() instances
+    reuse the cached integer address and prefixlen.  Each object is still a
+    new, independently mutable instance.
+
+    Set `maxsize` to the maximum number of cached strings per address
+    family; `maxsize=0` disables the cache (which is the default).
+    """
+    global _IPV4_STR_PARSER
+    global _IPV6_STR_PARSER
+
+    if not isinstance(maxsize, int) or isinstance(maxsize, bool) or maxsize < 0:
+        error = f"configure_ip_intern_cache(maxsize={maxsize}) requires a non-negative integer"
+        logger.error(error)
+        raise ValueError(error)
+
+    if maxsize == 0:
+        _IPV4_STR_PARSER = _parse_ipv4_str
+        _IPV6_STR_PARSER = _parse_ipv6_str
+    else:
+        _IPV4_STR_PARSER = lru_cache(maxsize=maxsize)(_parse_ipv4_str)
+        _IPV6_STR_PARSER = lru_cache(maxsize=maxsize)(_parse_ipv6_str)
+
+
+@logger.catch(reraise=True)
+def ip_intern_cache_info():
+    """Return a dict with the `functools.lru_cache()` statistics of the IPv4Obj() and IPv6Obj() intern caches; values are None when the cache is disabled."""
+    return {
+        "ipv4": getattr(_IPV4_STR_PARSER, "cache_info", lambda: None)(),
+        "ipv6": getattr(_IPV6_STR_PARSER, "cache_info", lambda: None)(),
+    }
 
 
 # Build a wrapper around ipaddress classes to mimic the behavior of network
 # interfaces (such as persisting host-bits when the intf masklen changes) and
 # add custom @properties
 class IPv4Obj(object):
+    # Only store an integer address and an integer prefixlen; ip_object,
+    #     network_object and friends are derived from them on demand
+    __slots__ = ("_ip", "_prefixlen", "strict", "debug", "empty")
+
     dna = "IPv4Obj"
-    ip_object = None
-    network_object = None
-    strict = False
-    debug = 0
-    finished_parsing = False
-    empty = False
 
     # This method is on IPv4Obj().  @logger.catch() breaks the __init__() method.
     #@logger.catch(reraise=True)
@@ -1021,6 +1168,9 @@ class IPv4Obj(object):
 
         self.strict = strict
         self.debug = debug
+        self.empty = False
+        self._ip = None
+        self._prefixlen = None
 
         #################################### NEW
 
@@ -1028,66 +1178,82 @@ class IPv4Obj(object):
             self.empty = True
 
         elif isinstance(v4input, str):
-            v4_str_rgx = _RGX_IPV4ADDR_WITH_MASK.search(v4input.strip())
-            if v4_str_rgx is not None:
-                v4_groupdict = v4_str_rgx.groupdict()
-            else:
-                v4_groupdict = {}
-
-            v4addr_nomask = v4_groupdict.get("v4addr_nomask", None) or ""
-            v4addr_netmask = v4_groupdict.get("v4addr_netmask", None) or ""
-            v4addr_prefixlen = v4_groupdict.get("v4addr_prefixlen", None) or ""
-            netmask = v4_groupdict.get("netmask", None) or ""
-            prefixlen = v4_groupdict.get("masklen", None) or ""
-
-            # There is a bug here... if I don't use this if condition, address
-            #     parsing fails
-            if netmask == "" and prefixlen == "":
-                prefixlen = "32"
-
-            # Fix parsing problems...
-            if not re.search(r"^\d+$", prefixlen.strip()):
-                prefixlen = ""
-            if not re.search(r"^\d+\.\d+\.\d+\.\d+$", netmask.strip()):
-                netmask = ""
-
-            # Fix a tricky parsing error above... both netmask and prefixlen should
-            #     not be defined...
-            if netmask != "" and prefixlen != "":
-                prefixlen = ""
-
-            v4addr = f"{v4addr_nomask}{v4addr_netmask}{v4addr_prefixlen}"
-            mask_prefixlen = f"{netmask}{prefixlen}"
-            if re.search(r"\d+\.\d+\.\d+\.\d+", v4addr):
-                self.ip_object = IPv4Address(v4addr)
-                self.network_object = IPv4Network(f"{v4addr}/{mask_prefixlen}", strict=False)
-                self.prefixlen = self.network_object.prefixlen
-            elif v4addr == "dhcp":
-                raise DynamicAddressException("Cannot parse address from a DHCP string.")
-            else:
-                raise AddressValueError(
-                    f"Could not parse '{v4input}' {type(v4input)} into an IPv4 Address"
-                )
-
-            self.finished_parsing = True
+            self._set_int_prefixlen(*_IPV4_STR_PARSER(v4input))
 
         elif isinstance(v4input, int):
             if not (0 <= v4input <= IPV4_MAXINT):
                 raise RequirementFailure()
-            self.ip_object = IPv4Address(v4input)
-            self.network_object = IPv4Network(v4input, strict=False)
-            self.finished_parsing = True
+            self._set_int_prefixlen(v4input, IPV4_MAX_PREFIXLEN)
 
         elif isinstance(v4input, IPv4Obj):
-            self.ip_object = IPv4Address(v4input.ip)
-            self.network_object = IPv4Network(v4input.as_cidr_net, strict=False)
-            self.finished_parsing = True
+            self._set_int_prefixlen(v4input.as_decimal, v4input.prefixlen)
 
         else:
             raise AddressValueError(
                 f"Could not parse '{v4input}' {type(v4input)} into an IPv4 Address"
             )
 
+    # do NOT wrap with @logger.catch(...)
+    # On IPv4Obj()
+    def _set_int_prefixlen(self, addr, prefixlen):
+        """Store the integer address and prefixlen on this object; the caller must have validated both values."""
+        self._ip = addr
+        self._prefixlen = prefixlen
+
+    # do NOT wrap with @logger.catch(...)
+    # On IPv4Obj()
+    @classmethod
+    def _from_int_unchecked(cls, addr, prefixlen):
+        """Build a new object without calling :meth:`__init__`; the caller must have validated both values."""
+        retval = cls.__new__(cls)
+        retval.strict = False
+        retval.debug = 0
+        retval.empty = False
+        retval._ip = addr
+        retval._prefixlen = prefixlen
+        return retval
+
+    # do NOT wrap with @logger.catch(...)
+    # On IPv4Obj()
+    @classmethod
+    def from_int(cls, addr, prefixlen=IPV4_MAX_PREFIXLEN):
+        """Return an :class:`~ccp_util.IPv4Obj` built directly from an integer address and an integer prefixlen.  This skips all of the string format detection in :meth:`__init__`.
+
+        Examples
+        --------
+        >>> IPv4Obj.from_int(3221225985, 24)
+        <IPv4Obj 192.0.2.1/24>
+        >>>
+        """
+        if not (isinstance(addr, int) and 0 <= addr <= IPV4_MAXINT):
+            raise AddressValueError(f"IPv4Obj.from_int() cannot use addr={addr}")
+        if not (isinstance(prefixlen, int) and 0 <= prefixlen <= IPV4_MAX_PREFIXLEN):
+            raise AddressValueError(f"IPv4Obj.from_int() cannot use prefixlen={prefixlen}")
+        return cls._from_int_unchecked(addr, prefixlen)
+
+    # do NOT wrap with @logger.catch(...)
+    # On IPv4Obj()
+    @classmethod
+    def from_parts(cls, str_addr, str_mask=str(IPV4_MAX_PREFIXLEN)):
+        """Return an :class:`~ccp_util.IPv4Obj` built from a dotted-quad address string and a separate netmask (or masklength) string, such as the two fields of ``ip address 192.0.2.1 255.255.255.0``.  This skips all of the string format detection in :meth:`__init__`.
+
+        Examples
+        --------
+        >>> IPv4Obj.from_parts("192.0.2.1", "255.255.255.0")
+        <IPv4Obj 192.0.2.1/24>
+        >>> IPv4Obj.from_parts("192.0.2.1", "24")
+        <IPv4Obj 192.0.2.1/24>
+        >>>
+        """
+        try:
+            addr = int(IPv4Address(str_addr.strip()))
+            prefixlen = _ipv4_mask_prefixlen(str(str_mask))
+        except (AttributeError, ValueError) as eee:
+            raise AddressValueError(
+                f"IPv4Obj.from_parts() could not parse '{str_addr}' '{str_mask}': {eee}"
+            )
+        return cls._from_int_unchecked(addr, prefixlen)
+
     #################################### NEW
     # do NOT wrap with @logger.catch(...)
     # On IPv4Obj()
@@ -1173,8 +1339,10 @@ class IPv4Obj(object):
     # do NOT wrap with @logger.catch(...)
     # On IPv4Obj()
     def __eq__(self, val):
-        if isinstance(val, IPv4Obj) and (self.empty is True or val.empty is True):
-            return self.empty == val.empty
+        if isinstance(val, IPv4Obj):
+            if self.empty is True or val.empty is True:
+                return self.empty == val.empty
+            return self._ip == val._ip and self._prefixlen == val._prefixlen
         try:
             # Code to fix Github issue #180
             for obj in [self, val]:
@@ -1208,6 +1376,9 @@ class IPv4Obj(object):
     # do NOT wrap with @logger.catch(...)
     # On IPv4Obj()
     def __gt__(self, val):
+        if isinstance(val, IPv4Obj) and self.empty is False and val.empty is False:
+            # Sort by network, then prefixlen, then host address...
+            return self._sort_tuple > val._sort_tuple
         try:
             for obj in [self, val]:
                 for attr_name in ["as_decimal", "as_decimal_network", "prefixlen"]:
@@ -1242,6 +1413,9 @@ class IPv4Obj(object):
     # do NOT wrap with @logger.catch(...)
     # On IPv4Obj()
     def __lt__(self, val):
+        if isinstance(val, IPv4Obj) and self.empty is False and val.empty is False:
+            # Sort by network, then prefixlen, then host address...
+            return self._sort_tuple < val._sort_tuple
         try:
             for obj in [self, val]:
                 for attr_name in ["as_decimal", "as_decimal_network", "prefixlen"]:
@@ -1308,9 +1482,7 @@ class IPv4Obj(object):
             raise RequirementFailure("Max IPv4 integer exceeded")
         if total < 0:
             raise RequirementFailure("Min IPv4 integer exceeded")
-        retval = IPv4Obj(total)
-        retval.prefixlen = orig_prefixlen
-        return retval
+        return IPv4Obj._from_int_unchecked(total, orig_prefixlen)
 
     # do NOT wrap with @logger.catch(...)
     # On IPv4Obj()
@@ -1325,9 +1497,7 @@ class IPv4Obj(object):
             raise RequirementFailure("Max IPv4 integer exceeded")
         if total < 0:
             raise RequirementFailure("Min IPv4 integer exceeded")
-        retval = IPv4Obj(total)
-        retval.prefixlen = orig_prefixlen
-        return retval
+        return IPv4Obj._from_int_unchecked(total, orig_prefixlen)
 
     # do NOT wrap with @logger.catch(...)
     # On IPv4Obj()
@@ -1340,9 +1510,9 @@ class IPv4Obj(object):
 
         # For all other cases, see below...
         try:
-            if self.network_object.prefixlen == 0:
+            if self._prefixlen == 0:
                 return True
-            elif self.network_object.prefixlen > val.network_object.prefixlen:
+            elif self._prefixlen > val.prefixlen:
                 # obvious shortcut... if this object's mask is longer than
                 #    val, this object cannot contain val
                 return False
@@ -1365,7 +1535,7 @@ class IPv4Obj(object):
     def __hash__(self):
         # Python3 needs __hash__()
         if self.empty is False:
-            return hash(str(self.ip_object)) + hash(str(self.prefixlen))
+            return hash((self._ip, self._prefixlen))
         else:
             return hash(None)
 
@@ -1395,15 +1565,6 @@ class IPv4Obj(object):
         """
         return self.version
 
-    # do NOT wrap with @logger.catch(...)
-    # On IPv4Obj()
-    @property
-    def _prefixlen(self):
-        """
-        Fix github issue #203... build a `_prefixlen` attribute...
-        """
-        return self.prefixlen
-
     # do NOT wrap with @logger.catch(...)
     # On IPv4Obj()
     @property
@@ -1422,9 +1583,50 @@ class IPv4Obj(object):
     # do NOT wrap with @logger.catch(...)
     # On IPv4Obj()
     @property
-    def _ip(self):
-        """Returns the address as an integer.  This property exists for compatibility with ipaddress.IPv4Address() in stdlib"""
-        return int(self.ip_object)
+    def _sort_tuple(self):
+        """Returns a (network, prefixlen, address) integer tuple, which orders objects the same way as :meth:`__lt__`"""
+        return (self._ip & (IPV4_MAXINT ^ (IPV4_MAXINT >> self._prefixlen)), self._prefixlen, self._ip)
+
+    # do NOT wrap with @logger.catch(...)
+    # On IPv4Obj()
+    @property
+    def ip_object(self):
+        """Returns the address as an :class:`ipaddress.IPv4Address` object."""
+        if self.empty is True:
+            return None
+        return IPv4Address(self._ip)
+
+    # do NOT wrap with @logger.catch(...)
+    # On IPv4Obj()
+    @ip_object.setter
+    def ip_object(self, arg):
+        """ip_object setter method; the prefixlen is not modified"""
+        self._ip = int(IPv4Address(arg))
+
+    # do NOT wrap with @logger.catch(...)
+    # On IPv4Obj()
+    @property
+    def network_object(self):
+        """Returns an :class:`ipaddress.IPv4Network` object, which represents this network."""
+        if self.empty is True:
+            return None
+        return IPv4Network((self._ip, self._prefixlen), strict=False)
+
+    # do NOT wrap with @logger.catch(...)
+    # On IPv4Obj()
+    @network_object.setter
+    def network_object(self, arg):
+        """network_object setter method; only the prefixlen of `arg` is used, which retains the host-bits of this object"""
+        network = IPv4Network(arg, strict=False)
+        _warn_network_object_setter(self, network, IPv4Network)
+        self._prefixlen = network.prefixlen
+
+    # do NOT wrap with @logger.catch(...)
+    # On IPv4Obj()
+    @property
+    def finished_parsing(self):
+        """Returns True if this object holds an address; read-only, for compatibility with the former instance attribute"""
+        return self.empty is False
 
     # do NOT wrap with @logger.catch(...)
     # On IPv4Obj()
@@ -1445,23 +1647,21 @@ class IPv4Obj(object):
     @property
     def netmask(self):
         """Returns the network mask as an :class:`ipaddress.IPv4Address` object."""
-        return self.network_object.netmask
+        return IPv4Address(IPV4_MAXINT ^ (IPV4_MAXINT >> self._prefixlen))
 
     # do NOT wrap with @logger.catch(...)
     # On IPv4Obj()
     @property
     def masklen(self):
         """Returns the length of the network mask as an integer."""
-        return int(self.network_object.prefixlen)
+        return self._prefixlen
 
     # do NOT wrap with @logger.catch(...)
     # On IPv4Obj()
     @masklen.setter
     def masklen(self, arg):
         """masklen setter method"""
-        self.network_object = IPv4Network(
-            f"{str(self.ip_object)}/{arg}", strict=False
-        )
+        self._prefixlen = _ipv4_mask_prefixlen(str(arg))
 
     # do NOT wrap with @logger.catch(...)
     # On IPv4Obj()
@@ -1475,28 +1675,21 @@ class IPv4Obj(object):
     @masklength.setter
     def masklength(self, arg):
         """masklen setter method"""
-        self.network_object = IPv4Network(
-            f"{str(self.ip_object)}/{arg}", strict=False
-        )
+        self._prefixlen = _ipv4_mask_prefixlen(str(arg))
 
     # do NOT wrap with @logger.catch(...)
     # On IPv4Obj()
     @property
     def prefixlen(self):
         """Returns the length of the network mask as an integer."""
-        if self.empty is False:
-            return int(self.network_object.prefixlen)
-        else:
-            return None
+        return self._prefixlen
 
     # do NOT wrap with @logger.catch(...)
     # On IPv4Obj()
     @prefixlen.setter
     def prefixlen(self, arg):
         """prefixlen setter method"""
-        self.network_object = IPv4Network(
-            f"{str(self.ip_object)}/{arg}", strict=False
-        )
+        self._prefixlen = _ipv4_mask_prefixlen(str(arg))
 
     # do NOT wrap with @logger.catch(...)
     # On IPv4Obj()
@@ -1510,9 +1703,7 @@ class IPv4Obj(object):
     @prefixlength.setter
     def prefixlength(self, arg):
         """prefixlength setter method"""
-        self.network_object = IPv4Network(
-            f"{str(self.ip_object)}/{arg}", strict=False
-        )
+        self._prefixlen = _ipv4_mask_prefixlen(str(arg))
 
     # do NOT wrap with @logger.catch(...)
     # On IPv4Obj()
@@ -1533,21 +1724,14 @@ class IPv4Obj(object):
     @property
     def broadcast(self):
         """Returns the broadcast address as an :class:`ipaddress.IPv4Address` object."""
-        if sys.version_info[0] < 3:
-            return self.network_object.broadcast
-        else:
-            return self.network_object.broadcast_address
+        return IPv4Address(self.as_decimal_broadcast)
 
     # do NOT wrap with @logger.catch(...)
     # On IPv4Obj()
     @property
     def network(self):
         """Returns an :class:`ipaddress.IPv4Network` object, which represents this network."""
-        if sys.version_info[0] < 3:
-            return self.network_object.network
-        else:
-            ## The ipaddress module returns an "IPAddress" object in Python3...
-            return IPv4Network(f"{self.network_object.compressed}", strict=False)
+        return IPv4Network((self.as_decimal_network, self._prefixlen))
 
     # do NOT wrap with @logger.catch(...)
     # On IPv4Obj()
@@ -1581,7 +1765,7 @@ class IPv4Obj(object):
             # get the max offset for this subnet...
             max_offset = self.as_decimal_broadcast - self.as_decimal_network
             if arg <= max_offset:
-                self.ip_object = IPv4Address(self.as_decimal_network + arg)
+                self._ip = self.as_decimal_network + arg
             else:
                 raise AddressValueError(f"{self}.network_offset({arg=}) exceeds the boundaries of '{self.as_cidr_net}'")
         else:
@@ -1601,7 +1785,7 @@ class IPv4Obj(object):
     @property
     def hostmask(self):
         """Returns the host mask as an :class:`ipaddress.IPv4Address` object."""
-        return self.network_object.hostmask
+        return IPv4Address(IPV4_MAXINT >> self._prefixlen)
 
     # do NOT wrap with @logger.catch(...)
     # On IPv4Obj()
@@ -1615,7 +1799,7 @@ class IPv4Obj(object):
     @property
     def inverse_netmask(self):
         """Returns the host mask as an :class:`ipaddress.IPv4Address` object."""
-        return self.network_object.hostmask
+        return IPv4Address(IPV4_MAXINT >> self._prefixlen)
 
     # do NOT wrap with @logger.catch(...)
     # On IPv4Obj()
@@ -1629,7 +1813,7 @@ class IPv4Obj(object):
     def numhosts(self):
         """Returns the total number of IP addresses in this network, including broadcast and the "subnet zero" address"""
         if self.prefixlength <= 30:
-            return 2 ** (IPV4_MAX_PREFIXLEN - self.network_object.prefixlen) - 2
+            return 2 ** (IPV4_MAX_PREFIXLEN - self._prefixlen) - 2
         elif self.prefixlength == 31:
             # special case... /31 subnet has no broadcast address
             return 2
@@ -1644,26 +1828,21 @@ class IPv4Obj(object):
     @property
     def as_decimal(self):
         """Returns the IP address as a decimal integer"""
-        num_strings = str(self.ip).split(".")
-        num_strings.reverse()  # reverse the order
-        return sum(int(num) * (256**idx) for idx, num in enumerate(num_strings))
+        return self._ip
 
     # do NOT wrap with @logger.catch(...)
     # On IPv4Obj()
     @property
     def as_decimal_network(self):
         """Returns the integer value of the IP network as a decimal integer; explicitly, if this object represents 1.1.1.5/24, 'as_decimal_network' returns the integer value of 1.1.1.0/24"""
-        num_strings = str(self.network).split("/")[0].split(".")
-        num_strings.reverse()  # reverse the order
-        return sum(int(num) * (256**idx) for idx, num in enumerate(num_strings))
+        return self._ip & (IPV4_MAXINT ^ (IPV4_MAXINT >> self._prefixlen))
 
     # do NOT wrap with @logger.catch(...)
     # On IPv4Obj()
     @property
     def as_decimal_broadcast(self):
         """Returns the integer value of the IP broadcast as a decimal integer; explicitly, if this object represents 1.1.1.5/24, 'as_decimal_broadcast' returns the integer value of 1.1.1.255"""
-        broadcast_offset = 2 ** (IPV4_MAX_PREFIXLEN - self.network_object.prefixlen) - 1
-        return self.as_decimal_network + broadcast_offset
+        return self._ip | (IPV4_MAXINT >> self._prefixlen)
 
     # do NOT wrap with @logger.catch(...)
     # On IPv4Obj()
@@ -1722,10 +1901,7 @@ class IPv4Obj(object):
     @property
     def as_cidr_net(self):
         """Returns a string with the network in CIDR notation"""
-        if sys.version_info[0] < 3:
-            return str(self.network) + "/" + str(self.prefixlen)
-        else:
-            return str(self.network)
+        return str(self.network)
 
     # do NOT wrap with @logger.catch(...)
     # On IPv4Obj()
@@ -1753,13 +1929,11 @@ class IPv4Obj(object):
 # interfaces (such as persisting host-bits when the intf masklen changes) and
 # add custom @properties
 class IPv6Obj(object):
+    # Only store an integer address and an integer prefixlen; ip_object,
+    #     network_object and friends are derived from them on demand
+    __slots__ = ("_ip", "_prefixlen", "strict", "debug", "empty")
+
     dna = "IPv6Obj"
-    ip_object = None
-    network_object = None
-    strict = False
-    debug = 0
-    finished_parsing = False
-    empty = False
 
     # This method is on IPv6Obj().  @logger.catch() breaks the __init__() method.
     def __init__(self, v6addr_prefixlen=None, strict=False, debug=0):
@@ -1845,10 +2019,8 @@ class IPv6Obj(object):
                 logger.error(error)
                 raise AddressValueError(error)
 
-        self.v6addr_prefixlen = v6addr_prefixlen
-        self.dna = "IPv6Obj"
-        self.ip_object = None
-        self.network_object = None
+        self._ip = None
+        self._prefixlen = None
         self.strict = strict
         self.debug = debug
         self.empty = False
@@ -1856,53 +2028,76 @@ class IPv6Obj(object):
         if v6addr_prefixlen is None:
             self.empty = True
         elif isinstance(v6addr_prefixlen, str):
-            if len(v6addr_prefixlen) > IPV6_MAXSTR_LEN:
-                raise RequirementFailure()
-
-            tmp = re.split(r"\s+", v6addr_prefixlen.strip())
-            if len(tmp) == 2:
-                v6addr_prefixlen = "/".join(tmp)
-            elif len(tmp) == 1:
-                v6addr_prefixlen = tmp[0]
-            else:
-                raise NotImplementedError(v6addr_prefixlen.strip())
-
-            v6_str_rgx = _RGX_IPV6ADDR.search(v6addr_prefixlen.strip())
-            # Example 'v6_groupdict'
-            #     v6_groupdict = {'addr': '2b00:cd80:14:10::1', 'opt1': None, 'opt2': None, 'opt3': None, 'opt4': None, 'opt5': '2b00:cd80:14:10::1', 'opt6': None, 'opt7': None, 'opt8': None, 'opt9': None, 'opt10': None, 'masklen': '64'}
-            v6_groupdict = v6_str_rgx.groupdict()
-            for key in ["addr", "opt1", "opt2", "opt3", "opt4", "opt5", "opt6", "opt7", "opt8", "opt9", "opt10", "opt11"]:
-                _ipv6 = v6_groupdict[key]
-                if _ipv6 is not None:
-                    break
-            else:
-                _ipv6 = "::1"
-            if _ipv6 is None:
-                raise RequirementFailure()
-
-            self.ip_object = IPv6Address(_ipv6)
-            if isinstance(v6_groupdict["masklen"], str):
-                netstr = _ipv6 + "/" + v6_groupdict["masklen"]
-            # FIXME - this probably should be removed...
-            #elif isinstance(v6_groupdict["netmask"], str):
-            #    netstr = ipv6 + "/" + v6_groupdict["netmask"]
-            else:
-                netstr = _ipv6 + "/128"
-            self.network_object = IPv6Network(netstr, strict=False)
+            self._set_int_prefixlen(*_IPV6_STR_PARSER(v6addr_prefixlen))
 
         elif isinstance(v6addr_prefixlen, int):
             if not (0 <= v6addr_prefixlen <= IPV6_MAXINT):
                 raise RequirementFailure()
-            self.ip_object = IPv6Address(v6addr_prefixlen)
-            self.network_object = IPv6Network(v6addr_prefixlen, strict=False)
+            self._set_int_prefixlen(v6addr_prefixlen, IPV6_MAX_PREFIXLEN)
 
         elif isinstance(v6addr_prefixlen, IPv6Obj):
-            self.ip_object = IPv6Address(v6addr_prefixlen.ip)
-            self.network_object = IPv6Network(v6addr_prefixlen.as_cidr_net, strict=False)
+            self._set_int_prefixlen(v6addr_prefixlen.as_decimal, v6addr_prefixlen.prefixlen)
 
         else:
             raise AddressValueError(f"Could not parse '{v6addr_prefixlen}' {type(v6addr_prefixlen)} into an IPv6 Address")
 
+    # On IPv6Obj()
+    def _set_int_prefixlen(self, addr, prefixlen):
+        """Store the integer address and prefixlen on this object; the caller must have validated both values."""
+        self._ip = addr
+        self._prefixlen = prefixlen
+
+    # On IPv6Obj()
+    @classmethod
+    def _from_int_unchecked(cls, addr, prefixlen):
+        """Build a new object without calling :meth:`__init__`; the caller must have validated both values."""
+        retval = cls.__new__(cls)
+        retval.strict = False
+        retval.debug = 0
+        retval.empty = False
+        retval._ip = addr
+        retval._prefixlen = prefixlen
+        return retval
+
+    # On IPv6Obj()
+    @classmethod
+    def from_int(cls, addr, prefixlen=IPV6_MAX_PREFIXLEN):
+        """Return an :class:`~ccp_util.IPv6Obj` built directly from an integer address and an integer prefixlen.  This skips all of the string format detection in :meth:`__init__`.
+
+        Examples
+        --------
+        >>> IPv6Obj.from_int(42540766411282592856903984951653826561, 64)
+        <IPv6Obj 2001:db8::1/64>
+        >>>
+        """
+        if not (isinstance(addr, int) and 0 <= addr <= IPV6_MAXINT):
+            raise AddressValueError(f"IPv6Obj.from_int() cannot use addr={addr}")
+        if not (isinstance(prefixlen, int) and 0 <= prefixlen <= IPV6_MAX_PREFIXLEN):
+            raise AddressValueError(f"IPv6Obj.from_int() cannot use prefixlen={prefixlen}")
+        return cls._from_int_unchecked(addr, prefixlen)
+
+    # On IPv6Obj()
+    @classmethod
+    def from_parts(cls, str_addr, str_masklen=str(IPV6_MAX_PREFIXLEN)):
+        """Return an :class:`~ccp_util.IPv6Obj` built from an IPv6 address string and a separate masklength string.  This skips all of the string format detection in :meth:`__init__`.
+
+        Examples
+        --------
+        >>> IPv6Obj.from_parts("2001:db8::1", "64")
+        <IPv6Obj 2001:db8::1/64>
+        >>>
+        """
+        try:
+            addr = int(IPv6Address(str_addr.strip()))
+            prefixlen = int(str_masklen)
+        except (AttributeError, ValueError) as eee:
+            raise AddressValueError(
+                f"IPv6Obj.from_parts() could not parse '{str_addr}' '{str_masklen}': {eee}"
+            )
+        if not (0 <= prefixlen <= IPV6_MAX_PREFIXLEN):
+            raise AddressValueError(f"IPv6Obj.from_parts() cannot use masklen={str_masklen}")
+        return cls._from_int_unchecked(addr, prefixlen)
+
     # On IPv6Obj()
     def __repr__(self):
         # Detect IPv4_mapped IPv6 addresses...
@@ -1920,6 +2115,8 @@ class IPv6Obj(object):
                 return True
             else:
                 return False
+        if isinstance(val, IPv6Obj) and val.empty is False:
+            return self._ip == val._ip and self._prefixlen == val._prefixlen
         try:
             for obj in [self, val]:
                 for attr_name in ["as_decimal", "prefixlen"]:
@@ -1940,6 +2137,9 @@ class IPv6Obj(object):
 
     # On IPv6Obj()
     def __gt__(self, val):
+        if isinstance(val, IPv6Obj) and self.empty is False and val.empty is False:
+            # Sort by network, then prefixlen, then host address...
+            return self._sort_tuple > val._sort_tuple
         try:
             for obj in [self, val]:
                 for attr_name in ["as_decimal", "as_decimal_network", "prefixlen"]:
@@ -1970,6 +2170,9 @@ class IPv6Obj(object):
 
     # On IPv6Obj()
     def __lt__(self, val):
+        if isinstance(val, IPv6Obj) and self.empty is False and val.empty is False:
+            # Sort by network, then prefixlen, then host address...
+            return self._sort_tuple < val._sort_tuple
         try:
             for obj in [self, val]:
                 for attr_name in ["as_decimal", "prefixlen"]:
@@ -2026,9 +2229,7 @@ class IPv6Obj(object):
             raise RequirementFailure("Max IPv6 integer exceeded")
         if total < 0:
             raise RequirementFailure("Min IPv6 integer exceeded")
-        retval = IPv6Obj(total)
-        retval.prefixlen = orig_prefixlen
-        return retval
+        return IPv6Obj._from_int_unchecked(total, orig_prefixlen)
 
     # On IPv6Obj()
     def __sub__(self, val):
@@ -2042,17 +2243,15 @@ class IPv6Obj(object):
             raise RequirementFailure("Max IPv6 integer exceeded")
         if total < 0:
             raise RequirementFailure("Min IPv6 integer exceeded")
-        retval = IPv6Obj(total)
-        retval.prefixlen = orig_prefixlen
-        return retval
+        return IPv6Obj._from_int_unchecked(total, orig_prefixlen)
 
     # On IPv6Obj()
     def __contains__(self, val):
         # Used for "foo in bar"... python calls bar.__contains__(foo)
         try:
-            if self.network_object.prefixlen == 0:
+            if self._prefixlen == 0:
                 return True
-            elif self.network_object.prefixlen > val.network_object.prefixlen:
+            elif self._prefixlen > val.prefixlen:
                 # obvious shortcut... if this object's mask is longer than
                 #    val, this object cannot contain val
                 return False
@@ -2068,7 +2267,10 @@ class IPv6Obj(object):
     # On IPv6Obj()
     def __hash__(self):
         # Python3 needs __hash__()
-        return hash(str(self.ip_object)) + hash(str(self.prefixlen))
+        if self.empty is False:
+            return hash((self._ip, self._prefixlen))
+        else:
+            return hash(None)
 
     # On IPv6Obj()
     def __iter__(self):
@@ -2097,14 +2299,6 @@ class IPv6Obj(object):
         """
         return self.version
 
-    # On IPv6Obj()
-    @property
-    def _prefixlen(self):
-        """
-        Fix github issue #203... build a `_prefixlen` attribute...
-        """
-        return self.prefixlen
-
     # On IPv6Obj()
     @property
     def _max_prefixlen(self):
@@ -2123,15 +2317,60 @@ class IPv6Obj(object):
         #     https://datatracker.ietf.org/doc/html/rfc5156#section-2.2
         #
         # if self.ip in IPv6Network("::ffff:0:0/96", strict=False):
-        if IPv6Network("::ffff:0:0/96").__contains__(self.ip):
+        if (self._ip >> 32) == 0xFFFF:
             return True
         return False
 
     # On IPv6Obj()
     @property
-    def _ip(self):
-        """Returns the address as an integer.  This property exists for compatibility with ipaddress.IPv6Address() in stdlib"""
-        return int(self.ip_object)
+    def _sort_tuple(self):
+        """Returns a (network, prefixlen, address) integer tuple, which orders objects the same way as :meth:`__lt__`"""
+        return (self._ip & (IPV6_MAXINT ^ (IPV6_MAXINT >> self._prefixlen)), self._prefixlen, self._ip)
+
+    # On IPv6Obj()
+    @property
+    def ip_object(self):
+        """Returns the address as an :class:`ipaddress.IPv6Address` object."""
+        if self.empty is True:
+            return None
+        return IPv6Address(self._ip)
+
+    # On IPv6Obj()
+    @ip_object.setter
+    def ip_object(self, arg):
+        """ip_object setter method; the prefixlen is not modified"""
+        self._ip = int(IPv6Address(arg))
+
+    # On IPv6Obj()
+    @property
+    def network_object(self):
+        """Returns an :class:`ipaddress.IPv6Network` object, which represents this network."""
+        if self.empty is True:
+            return None
+        return IPv6Network((self._ip, self._prefixlen), strict=False)
+
+    # On IPv6Obj()
+    @network_object.setter
+    def network_object(self, arg):
+        """network_object setter method; only the prefixlen of `arg` is used, which retains the host-bits of this object"""
+        network = IPv6Network(arg, strict=False)
+        _warn_network_object_setter(self, network, IPv6Network)
+        self._prefixlen = network.prefixlen
+
+    # On IPv6Obj()
+    @property
+    def finished_parsing(self):
+        """Returns True if this object holds an address; read-only, for compatibility with the former instance attribute"""
+        return self.empty is False
+
+    # On IPv6Obj()
+    @property
+    @deprecated(reason="IPv6Obj().v6addr_prefixlen is obsolete; use as_cidr_addr instead.  The constructor argument is no longer stored", version='1.9.52')
+    def v6addr_prefixlen(self):
+        """Returns the address and prefixlen as a string (i.e. '2001:db8::1/64'), or None if this object is empty; read-only, for compatibility with the former instance attribute"""
+        if self.empty is True:
+            return None
+        return self.as_cidr_addr
 
     # On IPv6Obj()
     @property
@@ -2149,21 +2388,19 @@ class IPv6Obj(object):
     @property
     def netmask(self):
         """Returns the network mask as an :class:`ipaddress.IPv6Address` object."""
-        return self.network_object.netmask
+        return IPv6Address(IPV6_MAXINT ^ (IPV6_MAXINT >> self._prefixlen))
 
     # On IPv6Obj()
     @property
     def masklen(self):
         """Returns the length of the network mask as an integer."""
-        return int(self.network_object.prefixlen)
+        return self._prefixlen
 
     # On IPv6Obj()
     @masklen.setter
     def masklen(self, arg):
         """masklen setter method"""
-        self.network_object = IPv6Network(
-            f"{str(self.ip_object)}/{arg}", strict=False
-        )
+        self._prefixlen = _ipv6_mask_prefixlen(str(arg))
 
     # On IPv6Obj()
     @property
@@ -2175,23 +2412,19 @@ class IPv6Obj(object):
     @masklength.setter
     def masklength(self, arg):
         """masklength setter method"""
-        self.network_object = IPv6Network(
-            f"{str(self.ip_object)}/{arg}", strict=False
-        )
+        self._prefixlen = _ipv6_mask_prefixlen(str(arg))
 
     # On IPv6Obj()
     @property
     def prefixlen(self):
         """Returns the length of the network mask as an integer."""
-        return int(self.network_object.prefixlen)
+        return self._prefixlen
 
     # On IPv6Obj()
     @prefixlen.setter
     def prefixlen(self, arg):
         """prefixlen setter method"""
-        self.network_object = IPv6Network(
-            f"{str(self.ip_object)}/{arg}", strict=False
-        )
+        self._prefixlen = _ipv6_mask_prefixlen(str(arg))
 
     # On IPv6Obj()
     @property
@@ -2226,8 +2459,7 @@ class IPv6Obj(object):
     @property
     def network(self):
         """Returns an :class:`ipaddress.IPv6Network` object, which represents this network."""
-        ## The ipaddress module returns an "IPAddress" object in Python3...
-        return IPv6Network(f"{self.network_object.compressed}")
+        return IPv6Network((self.as_decimal_network, self._prefixlen))
 
     # do NOT wrap with @logger.catch(...)
     # On IPv6Obj()
@@ -2261,7 +2493,7 @@ class IPv6Obj(object):
             # get the max offset for this subnet...
             max_offset = self.as_decimal_network_maxint - self.as_decimal_network
             if arg <= max_offset:
-                self.ip_object = IPv6Address(self.as_decimal_network + arg)
+                self._ip = self.as_decimal_network + arg
             else:
                 raise AddressValueError(f"{self}.network_offset({arg=}) exceeds the boundaries of '{self.as_cidr_net}'")
         else:
@@ -2271,11 +2503,7 @@ class IPv6Obj(object):
     @property
     def as_decimal_network(self):
         """Returns the integer value of the IP network as a decimal integer; explicitly, if this object represents 2b00:cd80:14:10::1/64, 'as_decimal_network' returns the integer value of 2b00:cd80:14:10::0/64"""
-        num_strings = str(self.network.exploded).split("/")[0].split(":")
-        num_strings.reverse()  # reverse the order
-        return sum(
-            int(num, 16) * (65536**idx) for idx, num in enumerate(num_strings)
-        )
+        return self._ip & (IPV6_MAXINT ^ (IPV6_MAXINT >> self._prefixlen))
 
     # do NOT wrap with @logger.catch(...)
     # On IPv6Obj()
@@ -2289,14 +2517,13 @@ class IPv6Obj(object):
     @property
     def as_decimal_network_maxint(self):
         """Returns the integer value of the maximum value of an IPv6 subnet as a decimal integer; explicitly, if this object represents 2b00:cd80:14:10::0/64, 'as_decimal_network_maxint' returns the integer value of 2b00:cd80:14:10:ffff:ffff:ffff:ffff"""
-        network_maxint_offset = 2 ** (IPV6_MAX_PREFIXLEN - self.network_object.prefixlen) - 1
-        return self.as_decimal_network + network_maxint_offset
+        return self._ip | (IPV6_MAXINT >> self._prefixlen)
 
     # On IPv6Obj()
     @property
     def hostmask(self):
         """Returns the host mask as an :class:`ipaddress.IPv6Address` object."""
-        return self.network_object.hostmask
+        return IPv6Address(IPV6_MAXINT >> self._prefixlen)
 
     # On IPv6Obj()
     @property
@@ -2308,7 +2535,7 @@ class IPv6Obj(object):
     @property
     def inverse_netmask(self):
         """Returns the host mask as an :class:`ipaddress.IPv6Address` object."""
-        return self.network_object.hostmask
+        return IPv6Address(IPV6_MAXINT >> self._prefixlen)
 
     # On IPv6Obj()
     @property
@@ -2321,7 +2548,7 @@ class IPv6Obj(object):
     def numhosts(self):
         """Returns the total number of IP addresses in this network, including broadcast and the "subnet zero" address"""
         if self.prefixlength <= 126:
-            return 2 ** (IPV6_MAX_PREFIXLEN - self.network_object.prefixlen) - 2
+            return 2 ** (IPV6_MAX_PREFIXLEN - self._prefixlen) - 2
         elif self.prefixlength == 127:
             # special case... /127 subnet has no broadcast address
             return 2
@@ -2335,11 +2562,7 @@ class IPv6Obj(object):
     @property
     def as_decimal(self):
         """Returns the IP address as a decimal integer"""
-        num_strings = str(self.ip.exploded).split(":")
-        num_strings.reverse()  # reverse the order
-        return sum(
-            int(num, 16) * (65536**idx) for idx, num in enumerate(num_strings)
-        )
+        return self._ip
 
     # On IPv6Obj()
     def as_int(self):
@@ -2376,10 +2599,7 @@ class IPv6Obj(object):
     @property
     def as_cidr_net(self):
         """Returns a string with the network in CIDR notation"""
-        if sys.version_info[0] < 3:
-            return str(self.network) + "/" + str(self.prefixlen)
-        else:
-            return str(self.network)
+        return str(self.network)
 
     # On IPv6Obj()
     @property
@@ -2429,6 +2649,501 @@ class IPv6Obj(object):
         return self.network_object.sixtofour
 
 
+# do NOT wrap with @logger.catch(...)
+def _ip_int_prefixlen(val):
+    """Return a tuple of (version, network_as_int, prefixlen) for `val`, which may be an IPv4Obj, IPv6Obj, a stdlib ipaddress network / address, or an address string."""
+    if isinstance(val, (IPv4Obj, IPv6Obj)):
+        if val.empty is True:
+            raise ValueError(f"Cannot use an empty {val} as a prefix")
+        return val.version, val.as_decimal_network, val.prefixlen
+    elif isinstance(val, (IPv4Network, IPv6Network)):
+        net = val
+    elif isinstance(val, (IPv4Address, IPv6Address)):
+        return val.version, int(val), val.max_prefixlen
+    elif isinstance(val, str):
+        # Try the fast-path constructors before ip_factory()
+        parts = val.replace("/", " ").split()
+        if len(parts) in {1, 2}:
+            try:
+                if ":" in parts[0]:
+                    return _ip_int_prefixlen(IPv6Obj.from_parts(*parts))
+                return _ip_int_prefixlen(IPv4Obj.from_parts(*parts))
+            except AddressValueError:
+                pass
+        return _ip_int_prefixlen(ip_factory(val))
+    else:
+        raise ValueError(f"Cannot use '{val}' {type(val)} as an IP prefix")
+    return net.version, int(net.network_address), net.prefixlen
+
+
+class _PrefixTrieNode(object):
+    """One node in a :class:`~ccp_util.IPPrefixTrie`.  `values` is None for internal nodes that only join two branches together."""
+
+    __slots__ = ("network", "prefixlen", "values", "children")
+
+    def __init__(self, network=0, prefixlen=0, values=None):
+        self.network = network
+        self.prefixlen = prefixlen
+        self.values = values
+        self.children = [None, None]
+
+
+class IPPrefixTrie(object):
+    """A path-compressed binary (Patricia) trie of IPv4 and IPv6 prefixes.
+
+    Each prefix stores a list of values (usually the route objects which
+    installed the prefix).  Lookups walk at most one node per prefix bit, so
+    a longest-prefix-match costs O(prefix-length) regardless of how many
+    prefixes are in the trie.
+
+    Parameters
+    ----------
+    prefixes : iterable
+        An optional iterable of prefixes to insert.  Prefixes may be :class:`~ccp_util.IPv4Obj`, :class:`~ccp_util.IPv6Obj`, :class:`ipaddress.IPv4Network`, :class:`ipaddress.IPv6Network` or a prefix string such as '192.0.2.0/24'.
+
+    Examples
+    --------
+    >>> from ciscoconfparse import CiscoConfParse
+    >>> from ciscoconfparse.ccp_util import IPPrefixTrie
+    >>> config = [
+    ...     'ip route 0.0.0.0 0.0.0.0 192.0.2.1',
+    ...     'ip route 10.0.0.0 255.0.0.0 192.0.2.2',
+    ...     'ip route 10.1.2.0 255.255.255.0 192.0.2.3',
+    ...     ]
+    >>> parse = CiscoConfParse(config, syntax='ios', factory=True)
+    >>> trie = IPPrefixTrie.from_config(parse)
+    >>> trie.longest_match('10.1.2.3')
+    <IPv4Obj 10.1.2.0/24>
+    >>> trie.lookup('10.9.9.9')
+    [<IOSRouteLine # 1 'ip route 10.0.0.0 255.0.0.0 192.0.2.2'>]
+    >>>
+    """
+
+    _WIDTH = {4: IPV4_MAX_PREFIXLEN, 6: IPV6_MAX_PREFIXLEN}
+
+    def __init__(self, prefixes=None):
+        self._roots = {4: _PrefixTrieNode(), 6: _PrefixTrieNode()}
+        self._size = 0
+        if prefixes is not None:
+            for prefix in prefixes:
+                self.insert(prefix)
+
+    # On IPPrefixTrie()
+    @classmethod
+    def from_config(cls, config, vrf=None):
+        """Build an :class:`~ccp_util.IPPrefixTrie` from the static routes in a `CiscoConfParse()` instance (parsed with ``factory=True``) or from a list of route objects.  Each prefix stores the list of route objects which installed it.  If `vrf` is not None, only routes in that vrf are indexed ('' is the global table)."""
+        objs = getattr(config, "objs", config)
+        trie = cls()
+        for obj in objs:
+            if not obj.classname.endswith("RouteLine"):
+                continue
+            if vrf is not None:
+                try:
+                    if (obj.vrf or "") != vrf:
+                        continue
+                except NotImplementedError:
+                    continue
+            prefix = obj.network_object
+            if prefix is None:
+                continue
+            trie.insert(prefix, obj)
+        return trie
+
+    # On IPPrefixTrie()
+    def __repr__(self):
+        return f"<IPPrefixTrie prefixes: {self._size}>"
+
+    # On IPPrefixTrie()
+    def __len__(self):
+        return self._size
+
+    # On IPPrefixTrie()
+    def __contains__(self, prefix):
+        return self._exact_node(prefix) is not None
+
+    # On IPPrefixTrie()
+    def __iter__(self):
+        for prefix, _ in self.items():
+            yield prefix
+
+    # On IPPrefixTrie()
+    def insert(self, prefix, value=None):
+        """Insert `prefix` into the trie and append `value` to the list of values stored for `prefix`."""
+        version, network, prefixlen = _ip_int_prefixlen(prefix)
+        width = self._WIDTH[version]
+        node = self._roots[version]
+
+        while True:
+            if node.prefixlen == prefixlen:
+                if node.values is None:
+                    node.values = []
+                    self._size += 1
+                node.values.append(value)
+                return
+
+            bit = (network >> (width - node.prefixlen - 1)) & 1
+            child = node.children[bit]
+            if child is None:
+                node.children[bit] = _PrefixTrieNode(network, prefixlen, [value])
+                self._size += 1
+                return
+
+            child_shift = width - child.prefixlen
+            if child.prefixlen <= prefixlen and (child.network >> child_shift) == (network >> child_shift):
+                # child contains the new prefix... keep walking down
+                node = child
+                continue
+
+            # Number of leading bits that child and the new prefix share...
+            common = min(
+                width - (child.network ^ network).bit_length(),
+                child.prefixlen,
+                prefixlen,
+            )
+            new = _PrefixTrieNode(network, prefixlen, [value])
+            self._size += 1
+            if common == prefixlen:
+                # The new prefix is a supernet of child...
+                new.children[(child.network >> (width - prefixlen - 1)) & 1] = child
+                node.children[bit] = new
+            else:
+                # child and the new prefix diverge; join them under a glue node
+                glue_network = (network >> (width - common)) << (width - common)
+                glue = _PrefixTrieNode(glue_network, common)
+                glue.children[(child.network >> (width - common - 1)) & 1] = child
+                glue.children[(network >> (width - common - 1)) & 1] = new
+                node.children[bit] = glue
+            return
+
+    # On IPPrefixTrie()
+    def _exact_node(self, prefix):
+        version, network, prefixlen = _ip_int_prefixlen(prefix)
+        for node in self._walk(version, network, prefixlen):
+            if node.prefixlen == prefixlen:
+                return node
+        return None
+
+    # On IPPrefixTrie()
+    def _walk(self, version, network, prefixlen):
+        """Yield every node with values which contains network/prefixlen; shortest prefixes are yielded first."""
+        width = self._WIDTH[version]
+        node = self._roots[version]
+        while node is not None and node.prefixlen <= prefixlen:
+            shift = width - node.prefixlen
+            if (node.network >> shift) != (network >> shift):
+                return
+            if node.values is not None:
+                yield node
+            if node.prefixlen == prefixlen:
+                return
+            node = node.children[(network >> (shift - 1)) & 1]
+
+    # On IPPrefixTrie()
+    def _longest_node(self, addr):
+        best = None
+        for node in self._walk(*_ip_int_prefixlen(addr)):
+            best = node
+        return best
+
+    # On IPPrefixTrie()
+    @staticmethod
+    def _as_prefix_obj(version, network, prefixlen):
+        if version == 4:
+            return IPv4Obj.from_int(network, prefixlen)
+        return IPv6Obj.from_int(network, prefixlen)
+
+    # On IPPrefixTrie()
+    def _node_prefix(self, node, version):
+        return self._as_prefix_obj(version, node.network, node.prefixlen)
+
+    # On IPPrefixTrie()
+    def longest_match(self, addr, default=None):
+        """Return the longest prefix (as an IPv4Obj or IPv6Obj) which contains `addr`; return `default` if no prefix matches."""
+        version = _ip_int_prefixlen(addr)[0]
+        node = self._longest_node(addr)
+        if node is None:
+            return default
+        return self._node_prefix(node, version)
+
+    # On IPPrefixTrie()
+    def lookup(self, addr, default=None):
+        """Return the list of values stored on the longest prefix which contains `addr`; return `default` if no prefix matches."""
+        node = self._longest_node(addr)
+        if node is None:
+            return default
+        return node.values
+
+    # On IPPrefixTrie()
+    def lookup_many(self, addrs, default=None):
+        """Return a list with the result of :meth:`lookup` for each address in `addrs`"""
+        longest_node = self._longest_node
+        retval = []
+        for addr in addrs:
+            node = longest_node(addr)
+            retval.append(default if node is None else node.values)
+        return retval
+
+    # On IPPrefixTrie()
+    def all_matches(self, addr):
+        """Return a list of (prefix, values) tuples for every prefix which contains `addr`, ordered from the shortest to the longest prefix."""
+        version, network, prefixlen = _ip_int_prefixlen(addr)
+        return [
+            (self._node_prefix(node, version), node.values)
+            for node in self._walk(version, network, prefixlen)
+        ]
+
+    # On IPPrefixTrie()
+    def get(self, prefix, default=None):
+        """Return the list of values stored for exactly `prefix`, or `default`"""
+        node = self._exact_node(prefix)
+        if node is None:
+            return default
+        return node.values
+
+    # On IPPrefixTrie()
+    def _iter_nodes(self, version):
+        """Depth-first walk yielding (node, nearest_ancestor_with_values) in IPv4Obj / IPv6Obj sort order."""
+        stack = [(self._roots[version], None)]
+        while stack:
+            node, ancestor = stack.pop()
+            if node.values is not None:
+                yield node, ancestor
+                ancestor = node
+            for child in reversed(node.children):
+                if child is not None:
+                    stack.append((child, ancestor))
+
+    # On IPPrefixTrie()
+    def items(self):
+        """Yield (prefix, values) tuples for all prefixes, IPv4 prefixes first; each family is sorted the same way as IPv4Obj / IPv6Obj."""
+        for version in (4, 6):
+            for node, _ in self._iter_nodes(version):
+                yield self._node_prefix(node, version), node.values
+
+    # On IPPrefixTrie()
+    def overlapping_prefixes(self):
+        """Return a list of (covering_prefix, covered_prefix) tuples; each covered prefix is paired with the nearest shorter prefix which contains it."""
+        retval = []
+        for version in (4, 6):
+            for node, ancestor in self._iter_nodes(version):
+                if ancestor is not None:
+                    retval.append((
+                        self._node_prefix(ancestor, version),
+                        self._node_prefix(node, version),
+                    ))
+        return retval
+
+    # On IPPrefixTrie()
+    def duplicate_prefixes(self):
+        """Return a list of (prefix, values) tuples for prefixes installed more than once (i.e. floating or ECMP static routes)."""
+        return [(prefix, values) for prefix, values in self.items() if len(values) > 1]
+
+    # On IPPrefixTrie()
+    def shadowed_prefixes(self):
+        """Return a list of prefixes which can never be the longest match because more-specific prefixes completely cover them."""
+        retval = []
+        for version in (4, 6):
+            width = self._WIDTH[version]
+            self._mark_shadowed(self._roots[version], version, width, retval)
+        return sorted(retval)
+
+    # On IPPrefixTrie()
+    def _mark_shadowed(self, node, version, width, retval):
+        """Return True if every address inside node's prefix is covered by a prefix at or below node.  Append shadowed prefixes to retval."""
+        children_full = [
+            (child is not None)
+            and self._mark_shadowed(child, version, width, retval)
+            and child.prefixlen == node.prefixlen + 1
+            for child in node.children
+        ]
+        both_halves_full = node.prefixlen < width and all(children_full)
+        if node.values is not None:
+            if both_halves_full:
+                retval.append(self._node_prefix(node, version))
+            return True
+        return both_halves_full
+
+
+# do NOT wrap with @logger.catch(...)
+def _merge_int_ranges(ranges):
+    """Return a sorted list of (first, last) integer ranges; overlapping and adjacent ranges are merged together."""
+    retval = []
+    for first, last in sorted(ranges):
+        if retval and first <= retval[-1][1] + 1:
+            if last > retval[-1][1]:
+                retval[-1][1] = last
+        else:
+            retval.append([first, last])
+    return [tuple(ii) for ii in retval]
+
+
+# do NOT wrap with @logger.catch(...)
+def _intersect_int_ranges(aa, bb):
+    """Return the (first, last) integer ranges which are in both aa and bb; both inputs must be sorted and merged."""
+    retval = []
+    ii, jj = 0, 0
+    while ii < len(aa) and jj < len(bb):
+        first = max(aa[ii][0], bb[jj][0])
+        last = min(aa[ii][1], bb[jj][1])
+        if first <= last:
+            retval.append((first, last))
+        if aa[ii][1] < bb[jj][1]:
+            ii += 1
+        else:
+            jj += 1
+    return retval
+
+
+# do NOT wrap with @logger.catch(...)
+def _subtract_int_ranges(aa, bb):
+    """Return the (first, last) integer ranges which are in aa but not in bb; both inputs must be sorted and merged."""
+    retval = []
+    jj = 0
+    for first, last in aa:
+        while jj < len(bb) and bb[jj][1] < first:
+            jj += 1
+        kk = jj
+        while kk < len(bb) and bb[kk][0] <= last:
+            if bb[kk][0] > first:
+                retval.append((first, bb[kk][0] - 1))
+            first = bb[kk][1] + 1
+            kk += 1
+        if first <= last:
+            retval.append((first, last))
+    return retval
+
+
+# do NOT wrap with @logger.catch(...)
+def _int_range_to_prefixes(first, last, width):
+    """Yield (network, prefixlen) tuples for the minimal list of CIDR prefixes which exactly cover the integers first through last."""
+    while first <= last:
+        # The largest block which starts on `first` and does not pass `last`
+        size = min(first & -first or 1 << width, 1 << ((last - first + 1).bit_length() - 1))
+        yield first, width - size.bit_length() + 1
+        first += size
+
+
+class IPAddressSpace(object):
+    """A set of IPv4 and IPv6 addresses, stored as sorted and merged integer ranges.
+
+    Any mix of :class:`~ccp_util.IPv4Obj`, :class:`~ccp_util.IPv6Obj`, stdlib
+    ipaddress networks / addresses and address strings may be added.  Ranges
+    are only sorted and merged when they are read, so adding n networks
+    costs O(n log n) in total.
+
+    Parameters
+    ----------
+    networks : iterable
+        An optional iterable of networks to add.
+
+    Examples
+    --------
+    >>> from ciscoconfparse.ccp_util import IPAddressSpace
+    >>> space = IPAddressSpace(['192.0.2.0/25', '192.0.2.128/25', '2001:db8::/33', '2001:db8:8000::/33'])
+    >>> space.collapse()
+    [<IPv4Obj 192.0.2.0/24>, <IPv6Obj 2001:db8::/32>]
+    >>> space.num_addresses(version=4)
+    256
+    >>> '192.0.2.77' in space
+    True
+    >>>
+    """
+
+    _WIDTH = {4: IPV4_MAX_PREFIXLEN, 6: IPV6_MAX_PREFIXLEN}
+
+    def __init__(self, networks=None):
+        self._pending = {4: [], 6: []}
+        self._ranges = {4: [], 6: []}
+        self._firsts = {4: [], 6: []}
+        if networks is not None:
+            self.update(networks)
+
+    # On IPAddressSpace()
+    def __repr__(self):
+        return f"<IPAddressSpace ipv4_ranges: {len(self.ranges(4))} ipv6_ranges: {len(self.ranges(6))}>"
+
+    # On IPAddressSpace()
+    def __contains__(self, val):
+        version, network, prefixlen = _ip_int_prefixlen(val)
+        ranges = self.ranges(version)
+        idx = bisect_right(self._firsts[version], network) - 1
+        if idx < 0:
+            return False
+        last = network | ((1 << (self._WIDTH[version] - prefixlen)) - 1)
+        return ranges[idx][1] >= last
+
+    # On IPAddressSpace()
+    def add(self, network):
+        """Add an IPv4 or IPv6 network (or address) to the address space"""
+        version, first, prefixlen = _ip_int_prefixlen(network)
+        last = first | ((1 << (self._WIDTH[version] - prefixlen)) - 1)
+        self._pending[version].append((first, last))
+
+    # On IPAddressSpace()
+    def add_range(self, first, last):
+        """Add every address from `first` through `last` (inclusive), such as an ASA ``range 192.0.2.10 192.0.2.20`` network object."""
+        first_version, first_int, _ = _ip_int_prefixlen(first)
+        last_version, last_int, _ = _ip_int_prefixlen(last)
+        if first_version != last_version or first_int > last_int:
+            error = f"Cannot add an address range from '{first}' to '{last}'"
+            logger.error(error)
+            raise ValueError(error)
+        self._pending[first_version].append((first_int, last_int))
+
+    # On IPAddressSpace()
+    def update(self, networks):
+        """Add all networks in the `networks` iterable to the address space"""
+        for network in networks:
+            self.add(network)
+
+    # On IPAddressSpace()
+    def ranges(self, version=4):
+        """Return a sorted list of merged (first, last) integer ranges for the IP `version`"""
+        if self._pending[version]:
+            self._ranges[version] = _merge_int_ranges(self._ranges[version] + self._pending[version])
+            self._firsts[version] = [ii[0] for ii in self._ranges[version]]
+            self._pending[version] = []
+        return self._ranges[version]
+
+    # On IPAddressSpace()
+    def collapse(self, stdlib=False):
+        """Return the minimal sorted list of prefixes which exactly cover the address space; IPv4 prefixes are listed first.  Set stdlib=True to return :class:`ipaddress.IPv4Network` / :class:`ipaddress.IPv6Network` objects instead of IPv4Obj / IPv6Obj."""
+        if stdlib is True:
+            factories = {4: IPv4Network, 6: IPv6Network}
+        else:
+            factories = {
+                4: lambda arg: IPv4Obj._from_int_unchecked(*arg),
+                6: lambda arg: IPv6Obj._from_int_unchecked(*arg),
+            }
+        retval = []
+        for version in (4, 6):
+            width = self._WIDTH[version]
+            factory = factories[version]
+            for first, last in self.ranges(version):
+                retval.extend(factory(ii) for ii in _int_range_to_prefixes(first, last, width))
+        return retval
+
+    # On IPAddressSpace()
+    def num_addresses(self, version=None):
+        """Return the number of addresses in the address space.  If `version` is None, IPv4 and IPv6 addresses are counted together."""
+        if version is None:
+            return self.num_addresses(4) + self.num_addresses(6)
+        return sum(last - first + 1 for first, last in self.ranges(version))
+
+    # On IPAddressSpace()
+    def coverage(self):
+        """Return a dict summarizing the address space; for instance, {'ipv4_addresses': 256, 'ipv4_percent': 5.96e-06, 'ipv4_ranges': 1, 'ipv4_prefixes': 1, ...}"""
+        retval = {}
+        collapsed = self.collapse(stdlib=True)
+        for version in (4, 6):
+            num_addresses = self.num_addresses(version)
+            retval[f"ipv{version}_addresses"] = num_addresses
+            retval[f"ipv{version}_percent"] = 100.0 * num_addresses / (1 << self._WIDTH[version])
+            retval[f"ipv{version}_ranges"] = len(self.ranges(version))
+            retval[f"ipv{version}_prefixes"] = len([ii for ii in collapsed if ii.version == version])
+        return retval
+
+
 class L4Object(object):
     """Object for Transport-layer protocols; the object ensures that logical operators (such as le, gt, eq, and ne) are parsed correctly, as well as mapping service names to port numbers
 
@@ -2955,6 +3670,14 @@ def reverse_dns_lookup(input_str, timeout=3.0, server="4.2.2.2", proto="udp"):
     return retval
 
 
+# do NOT wrap with @logger.catch(...)
+@lru_cache(maxsize=4096)
+def _parse_ios_interface_name(interface_name):
+    """Return the CiscoIOSInterface().parse_single_interface() results for `interface_name` as a tuple of (key, value) pairs.  The same interface names recur across configs, so the parse results are cached."""
+    parser = CiscoIOSInterface.__new__(CiscoIOSInterface)
+    return tuple(parser.parse_single_interface(interface_name).items())
+
+
 class CiscoIOSInterface(object):
     interface_name = None
     interface_dict = None
@@ -2969,6 +3692,7 @@ class CiscoIOSInterface(object):
     _subinterface = None
     _channel = None
     _interface_class = None
+    _sort_key = None
 
     # This method is on CiscoIOSInterface()
     @logger.catch(reraise=True)
@@ -3034,7 +3758,10 @@ class CiscoIOSInterface(object):
         self.dump_internal_state()
 
         if isinstance(interface_name, str):
-            intf_dict = self.parse_single_interface(interface_name, debug=debug)
+            if debug is True:
+                intf_dict = self.parse_single_interface(interface_name, debug=debug)
+            else:
+                intf_dict = dict(_parse_ios_interface_name(interface_name))
             if debug is True:
                 logger.success(f"    CiscoIOSInterface().check_interface_dict({intf_dict}) succeeded")
                 logger.debug(f"    Calling CiscoIOSInterface().update_internal_state({intf_dict})")
@@ -3144,11 +3871,12 @@ class CiscoIOSInterface(object):
         self.interface_class = intf_dict["interface_class"]
 
         ######################################################################
-        # Always update sort_list
+        # Always update sort_list and the cached sort_key
         ######################################################################
         if debug is True:
-            logger.info("    CiscoIOSInterface().update_internal_state() is calling CiscoIOSInterface().update_sort_list()")
-        self.update_sort_list()
+            logger.info("    CiscoIOSInterface().update_internal_state() is calling CiscoIOSInterface()._build_sort_key()")
+        self._sort_key = None
+        self._sort_key = self._build_sort_key()
 
     # This method is on CiscoIOSInterface()
     @logger.catch(reraise=True)
@@ -3491,21 +4219,17 @@ class CiscoIOSInterface(object):
         except Exception:
             return False
 
+    # do NOT wrap with @logger.catch(...)
     # This method is on CiscoIOSInterface()
-    @logger.catch(reraise=True)
     def __gt__(self, other):
         # Ref: http://stackoverflow.com/a/7152796/667301
-        if self.sort_list > other.sort_list:
-            return True
-        return False
+        return self.sort_key > other.sort_key
 
+    # do NOT wrap with @logger.catch(...)
     # This method is on CiscoIOSInterface()
-    @logger.catch(reraise=True)
     def __lt__(self, other):
         # Ref: http://stackoverflow.com/a/7152796/667301
-        if self.sort_list < other.sort_list:
-            return True
-        return False
+        return self.sort_key < other.sort_key
 
     # This method is on CiscoIOSInterface()
     @logger.catch(reraise=True)
@@ -3682,6 +4406,7 @@ class CiscoIOSInterface(object):
     @slot.setter
     @logger.catch(reraise=True)
     def slot(self, value):
+        self._sort_key = None
         if isinstance(value, (int, str)):
             self._slot = int(value)
         elif value is None:
@@ -3705,6 +4430,7 @@ class CiscoIOSInterface(object):
     @card.setter
     @logger.catch(reraise=True)
     def card(self, value):
+        self._sort_key = None
         if isinstance(value, (int, str)):
             self._card = int(value)
         elif value is None:
@@ -3728,6 +4454,7 @@ class CiscoIOSInterface(object):
     @port.setter
     @logger.catch(reraise=True)
     def port(self, value):
+        self._sort_key = None
         if isinstance(value, (int, str)):
             self._port = int(value)
         elif value is None:
@@ -3748,6 +4475,7 @@ class CiscoIOSInterface(object):
     @subinterface.setter
     @logger.catch(reraise=True)
     def subinterface(self, value):
+        self._sort_key = None
         if isinstance(value, (int, str)):
             self._subinterface = int(value)
         elif value is None:
@@ -3768,6 +4496,7 @@ class CiscoIOSInterface(object):
     @channel.setter
     @logger.catch(reraise=True)
     def channel(self, value):
+        self._sort_key = None
         if isinstance(value, (int, str)):
             self._channel = int(value)
         elif value is None:
@@ -3791,6 +4520,7 @@ class CiscoIOSInterface(object):
     @interface_class.setter
     @logger.catch(reraise=True)
     def interface_class(self, value):
+        self._sort_key = None
         if isinstance(value, str):
             self._interface_class = str(value.strip())
         elif value is None:
@@ -3807,6 +4537,24 @@ class CiscoIOSInterface(object):
         "Return the sort_list"
         return self.update_sort_list()
 
+    # do NOT wrap with @logger.catch(...)
+    # This method is on CiscoIOSInterface()
+    @property
+    def sort_key(self):
+        """Return a tuple which sorts CiscoIOSInterface() instances in the same order as sort_list; use it with sorted(..., key=operator.attrgetter("sort_key")).  Missing slot / card / port / subinterface / channel values sort as -1 and a missing interface_class sorts as ''.  The tuple is cached until an interface component changes."""
+        if self._sort_key is None:
+            self._sort_key = self._build_sort_key()
+        return self._sort_key
+
+    # do NOT wrap with @logger.catch(...)
+    # This method is on CiscoIOSInterface()
+    def _build_sort_key(self):
+        """Return a new sort_key tuple from sort_list"""
+        return tuple(
+            (-1 if ii is None else ii) if idx < 5 else (ii or "")
+            for idx, ii in enumerate(self.update_sort_list())
+        )
+
     # This method is on CiscoIOSInterface()
     @sort_list.setter
     @logger.catch(reraise=True)
@@ -3819,6 +4567,90 @@ class CiscoIOSInterface(object):
             raise ValueError(error)
 
 
+class FrozenCiscoIOSInterface(CiscoIOSInterface):
+    """An immutable and hashable CiscoIOSInterface().  The rendered number, sort_list and hash are computed once, so FrozenCiscoIOSInterface() instances are cheap to sort and can be shared across configs and CiscoRange() instances.
+
+    Examples
+    --------
+
+    >>> from ciscoconfparse.ccp_util import FrozenCiscoIOSInterface
+    >>> intf = FrozenCiscoIOSInterface.intern("GigabitEthernet1/0/1")
+    >>> intf is FrozenCiscoIOSInterface.intern("GigabitEthernet1/0/1")
+    True
+    >>> intf.port
+    1
+    >>> intf.port = 2
+    Traceback (most recent call last):
+      ...
+    AttributeError: FrozenCiscoIOSInterface() is immutable; cannot set port
+    >>>
+    """
+    _frozen = False
+    _frozen_sort_list = None
+    _frozen_hash = None
+
+    # This method is on FrozenCiscoIOSInterface()
+    @logger.catch(reraise=True)
+    def __init__(self, interface_name=None, interface_dict=None, debug=False):
+        super().__init__(interface_name=interface_name, interface_dict=interface_dict, debug=debug)
+        # CiscoIOSInterface().number caches its value in self._number
+        CiscoIOSInterface.number.fget(self)
+        self._frozen_sort_list = tuple(self.update_sort_list())
+        self._frozen_hash = super().__hash__()
+        self._frozen = True
+
+    # This method is on FrozenCiscoIOSInterface()
+    @classmethod
+    def intern(cls, interface_name):
+        """Return a shared FrozenCiscoIOSInterface() instance for the `interface_name` string"""
+        return _frozen_ios_interface(interface_name)
+
+    # This method is on FrozenCiscoIOSInterface()
+    def __setattr__(self, name, value):
+        if self._frozen is True:
+            error = f"FrozenCiscoIOSInterface() is immutable; cannot set {name}"
+            logger.error(error)
+            raise AttributeError(error)
+        super().__setattr__(name, value)
+
+    # This method is on FrozenCiscoIOSInterface()
+    def __hash__(self):
+        return self._frozen_hash
+
+    # This method is on FrozenCiscoIOSInterface()
+    def __copy__(self):
+        return self
+
+    # This method is on FrozenCiscoIOSInterface()
+    def __deepcopy__(self, memo):
+        return self
+
+    # This method is on FrozenCiscoIOSInterface()
+    def __repr__(self):
+        return f"""<FrozenCiscoIOSInterface {self.__str__()}>"""
+
+    # This method is on FrozenCiscoIOSInterface()
+    @property
+    def number(self):
+        "Return '2/1/8' if self.interface_name is 'Serial 2/1/8.3:6'"
+        return self._number
+
+    # This method is on FrozenCiscoIOSInterface()
+    @property
+    def sort_list(self):
+        "Return the sort_list"
+        if self._frozen_sort_list is None:
+            return self.update_sort_list()
+        return list(self._frozen_sort_list)
+
+
+# do NOT wrap with @logger.catch(...)
+@lru_cache(maxsize=4096)
+def _frozen_ios_interface(interface_name):
+    """Return a shared FrozenCiscoIOSInterface() for `interface_name`"""
+    return FrozenCiscoIOSInterface(interface_name)
+
+
 class CiscoIOSXRInterface(object):
     ##########################################################################
     ### FIXME CiscoIOSXRInterface() is fundamentally broken.
@@ -4735,10 +5567,17 @@ class CiscoRange(MutableSequence):
     begin_obj = None
     this_obj = None
     iterate_attribute = None
-    _list = []
+    _members = None
+    _intervals = None
     range_str = None
     """Explode Cisco ranges into a list of explicit items... examples below...
 
+    Integer ranges, such as vlan lists, are stored as sorted (first, last)
+    intervals; membership checks, union(), intersection(), difference() and
+    as_compressed_str() do not expand the range.  Members are only expanded
+    into a list when an integer CiscoRange() is indexed or modified through
+    the list API.
+
     Examples
     --------
 
@@ -4758,6 +5597,11 @@ class CiscoRange(MutableSequence):
     <CiscoRange Eth2/1-3,7>
     >>> CiscoRange(text="1,3,5", result_type=int)
     <CiscoRange [1, 3, 5]>
+    >>> vlans = CiscoRange("1-4094", result_type=int)
+    >>> 911 in vlans
+    True
+    >>> vlans.difference(CiscoRange("2-1000", result_type=int)).as_compressed_str()
+    '1,1001-4094'
     """
 
     # This method is on CiscoRange()
@@ -4801,20 +5645,46 @@ class CiscoRange(MutableSequence):
             elif result_type is CiscoIOSXRInterface:
                 self._list = self.parse_cisco_interfaces(text, result_type=CiscoIOSXRInterface, debug=debug)
             elif result_type is int:
-                self._list = self.parse_integers(text, debug=debug)
+                self._intervals = self.parse_integer_intervals(text, debug=debug)
             elif result_type is float:
                 self._list = self.parse_floats(text, debug=debug)
             elif result_type is str:
                 self._list = self.parse_strings(text, debug=debug)
+        elif result_type is int:
+            self._intervals = []
         else:
             self._list = []
 
+    # This method is on CiscoRange()
+    @property
+    def _list(self):
+        """Return the members of this CiscoRange() as a list; integer intervals are expanded into a list the first time _list is used"""
+        if self._members is None:
+            if self._intervals is None:
+                self._members = []
+            else:
+                self._members = [ii for first, last in self._intervals for ii in range(first, last + 1)]
+                self._intervals = None
+        return self._members
+
+    # This method is on CiscoRange()
+    @_list.setter
+    def _list(self, val):
+        self._members = val
+        self._intervals = None
+
     # This method is on CiscoRange()
     @logger.catch(reraise=True)
     def parse_integers(self, text, debug=False):
         """Parse text input to CiscoRange(), such as CiscoRange('1-5,7', result_type=int).  '1-5,7 will be parsed.  By default, integers are used when CiscoRange(result_type=int) is parsed.'  An error is raised if the CiscoRange() cannot be parsed"""
+        return [ii for first, last in self.parse_integer_intervals(text, debug=debug) for ii in range(first, last + 1)]
+
+    # This method is on CiscoRange()
+    @logger.catch(reraise=True)
+    def parse_integer_intervals(self, text, debug=False):
+        """Parse text input to CiscoRange(), such as CiscoRange('1-5,7', result_type=int) and return a sorted list of merged (first, last) integer intervals, such as [(1, 5), (7, 7)].  An error is raised if the CiscoRange() cannot be parsed"""
         self.result_type = int
-        integers = []
+        intervals = []
         csv_parts = text.split(",")
         for idx, _csv_part in enumerate(csv_parts):
             if "-" in _csv_part:
@@ -4835,27 +5705,32 @@ class CiscoRange(MutableSequence):
                 if debug is True:
                     logger.info(f"CiscoRange(text={text}, debug=True) : end_ordinal={end_ordinal}")
             ##############################################################
-            # Handle incrementing channel numbers
+            # Handle integer intervals
             ##############################################################
             if end_ordinal is not None:
-                for ii in range(begin_ordinal, end_ordinal + 1):
-                    # Use deepcopy to avoid problems with the same object
-                    #     instance appended multiple times
-                    if debug is True:
-                        logger.info(f"    idx: {idx} at point01, Appending {ii}{os.linesep}")
-                    # WAS DEEPCOPY
-                    integers.append(int(ii))
-                    continue
+                if debug is True:
+                    logger.info(f"    idx: {idx} at point01, Appending {begin_ordinal}-{end_ordinal}{os.linesep}")
+                if begin_ordinal <= end_ordinal:
+                    intervals.append((begin_ordinal, end_ordinal))
             else:
                 # Append a single integer
                 if debug is True:
-                    logger.info(f"    idx: {idx} at point02, Appending {self.this_obj}{os.linesep}")
-                # WAS DEEPCOPY
-                integers.append(int(begin_ordinal))
-                continue
+                    logger.info(f"    idx: {idx} at point02, Appending {begin_ordinal}{os.linesep}")
+                intervals.append((begin_ordinal, begin_ordinal))
+
+        # De-duplicate and merge the integer intervals...
+        return _merge_int_ranges(intervals)
 
-        # De-duplicate the list of integers and return it...
-        return list(set([int(ii) for ii in integers]))
+    # This method is on CiscoRange()
+    def _int_intervals(self):
+        """Return the members of this CiscoRange() as sorted and merged (first, last) integer intervals.  Return None if the members are not integers"""
+        if self._intervals is not None:
+            return self._intervals
+        elif len(self._members or []) == 0:
+            return [] if self.result_type is int else None
+        elif all(type(ii) is int for ii in self._members):
+            return _merge_int_ranges((ii, ii) for ii in self._members)
+        return None
 
     # This method is on CiscoRange()
     @logger.catch(reraise=True)
@@ -5139,6 +6014,8 @@ class CiscoRange(MutableSequence):
     @logger.catch(reraise=True)
     def __eq__(self, other):
         if isinstance(other, CiscoRange):
+            if self._intervals is not None and other._intervals is not None:
+                return self._intervals == other._intervals
             return self._list == other._list
         else:
             return False
@@ -5162,14 +6039,28 @@ class CiscoRange(MutableSequence):
     @logger.catch(reraise=True)
     def __len__(self):
         """Return the length of this CiscoRange()"""
+        if self._intervals is not None:
+            return sum(last - first + 1 for first, last in self._intervals)
         return len(self._list)
 
     # This method is on CiscoRange()
     @logger.catch(reraise=True)
     def __iter__(self):
         """Return an iterator for this CiscoRange().  If CiscoRange().__iter__() is not implemented, many CiscoRnage() index errors are generated by other methods accessing an index that is off by one."""
+        if self._intervals is not None:
+            return (ii for first, last in self._intervals for ii in range(first, last + 1))
         return iter(self._list)
 
+    # This method is on CiscoRange()
+    @logger.catch(reraise=True)
+    def __contains__(self, val):
+        """Return True if `val` is a member of this CiscoRange().  Integer intervals are searched with a bisect instead of a linear scan."""
+        if self._intervals is not None and type(val) is int:
+            # (val + 1,) sorts after every interval which begins at or before val
+            idx = bisect_right(self._intervals, (val + 1,)) - 1
+            return idx >= 0 and self._intervals[idx][1] >= val
+        return val in self._list
+
     # This method is on CiscoRange()
     @logger.catch(reraise=True)
     def __getitem__(self, ii):
@@ -5205,6 +6096,11 @@ class CiscoRange(MutableSequence):
 
     def __add__(self, other):
         if isinstance(other, CiscoRange):
+            self_intervals, other_intervals = self._int_intervals(), other._int_intervals()
+            if self_intervals is not None and other_intervals is not None:
+                self._intervals = _merge_int_ranges(self_intervals + other_intervals)
+                self._members = None
+                return self
             self._list.extend(other._list)
             self._list = sorted(set(self._list))
             return self
@@ -5215,6 +6111,11 @@ class CiscoRange(MutableSequence):
 
     def __sub__(self, other):
         if isinstance(other, CiscoRange):
+            self_intervals, other_intervals = self._int_intervals(), other._int_intervals()
+            if self_intervals is not None and other_intervals is not None:
+                self._intervals = _subtract_int_ranges(self_intervals, other_intervals)
+                self._members = None
+                return self
             for ii in other._list:
                 try:
                     self._list.remove(ii)
@@ -5227,6 +6128,44 @@ class CiscoRange(MutableSequence):
             logger.error(error)
             raise InvalidCiscoRange(error)
 
+    # This method is on CiscoRange()
+    @logger.catch(reraise=True)
+    def union(self, other):
+        """Return a new CiscoRange() with the members of this CiscoRange() and the members of `other`"""
+        return self._set_operation(other, lambda aa, bb: _merge_int_ranges(aa + bb), set.union)
+
+    # This method is on CiscoRange()
+    @logger.catch(reraise=True)
+    def intersection(self, other):
+        """Return a new CiscoRange() with the members which are in both this CiscoRange() and `other`"""
+        return self._set_operation(other, _intersect_int_ranges, set.intersection)
+
+    # This method is on CiscoRange()
+    @logger.catch(reraise=True)
+    def difference(self, other):
+        """Return a new CiscoRange() with the members of this CiscoRange() which are not in `other`"""
+        return self._set_operation(other, _subtract_int_ranges, set.difference)
+
+    # This method is on CiscoRange()
+    def _set_operation(self, other, interval_func, set_func):
+        """Return a new CiscoRange() built with interval_func() if both CiscoRange() instances are integers; otherwise use set_func() on the members"""
+        if not isinstance(other, CiscoRange):
+            error = f'`{other}` must be a CiscoRange() instance; the received argument was {type(other)} instead of a CiscoRange()'
+            logger.error(error)
+            raise InvalidCiscoRange(error)
+
+        self_intervals, other_intervals = self._int_intervals(), other._int_intervals()
+        if self_intervals is not None and other_intervals is not None:
+            retval = CiscoRange(result_type=int, reverse=self.reverse)
+            retval._intervals = interval_func(self_intervals, other_intervals)
+            return retval
+
+        retval = CiscoRange(result_type=self.result_type, reverse=self.reverse)
+        members = list(set_func(set(self._list), set(other._list)))
+        if len(members) > 0:
+            retval._list = self.attribute_sort(members, attribute="sort_list", reverse=False)
+        return retval
+
     # This method is on CiscoRange()
     @logger.catch(reraise=True)
     def attribute_sort(self, target_list=None, attribute="sort_list", reverse=False):
@@ -5242,7 +6181,10 @@ class CiscoRange(MutableSequence):
         else:
             if len(target_list) > 0:
                 if isinstance(target_list, list):
-                    if isinstance(target_list[0], (CiscoIOSInterface, CiscoIOSXRInterface)):
+                    if isinstance(target_list[0], CiscoIOSInterface) and attribute == "sort_list":
+                        # Sort CiscoIOSInterface() members with their cached sort_key tuple
+                        new_list = sorted(target_list, key=attrgetter("sort_key"), reverse=reverse)
+                    elif isinstance(target_list[0], (CiscoIOSInterface, CiscoIOSXRInterface)):
                         # Sort CiscoIOSInterface() or CiscoIOSXRInterface members
                         new_list = sorted(target_list, key=lambda x: getattr(x, attribute), reverse=reverse)
                     elif isinstance(target_list[0], (int, float)):
@@ -5266,7 +6208,9 @@ class CiscoRange(MutableSequence):
     @logger.catch(reraise=True)
     def member_type(self):
         """Return the member type of this CiscoRange().  The type is always based off the first member"""
-        if len(self._list) > 0:
+        if self._intervals:
+            return int
+        elif self._intervals is None and len(self._list) > 0:
             return type(self._list[0])
         else:
             error = "An empty CiscoRange() has no type"
@@ -5278,6 +6222,16 @@ class CiscoRange(MutableSequence):
     def append(self, val, sort=True, ignore_errors=False, debug=False):
         """Append a member which matches the type of CiscoRange()._list[0]."""
 
+        if self._intervals is not None and type(val) is int:
+            if val in self:
+                if ignore_errors is False:
+                    error = f'Requested to append {val} {type(val)}; however, CiscoRange() already contains {val}'
+                    logger.error(error)
+                    raise DuplicateMember(error)
+            else:
+                self._intervals = _merge_int_ranges(self._intervals + [(val, val)])
+            return self
+
         arg_type = type(val)
         if len(self._list) > 0 and arg_type is not type(self._list[0]) and ignore_errors is False:
             error = f'Requested to append {val} {type(val)}; however, CiscoRange() expected {self.member_type}'
@@ -5323,6 +6277,13 @@ class CiscoRange(MutableSequence):
     # This method is on CiscoRange()
     @logger.catch(reraise=True)
     def remove(self, arg, ignore_errors=False, debug=False):
+        if self._intervals is not None and type(arg) is int:
+            if arg in self:
+                self._intervals = _subtract_int_ranges(self._intervals, [(arg, arg)])
+                return self
+            elif ignore_errors is True:
+                return self
+
         length_before = len(self._list)
         # WAS DEEPCOPY
         list_before = copy.deepcopy(self._list)
@@ -5437,7 +6398,7 @@ class CiscoRange(MutableSequence):
     @logger.catch(reraise=True)
     def as_set(self, result_type="auto"):
         """Return an unsorted set({}) components.  Use this method instead of `.as_list` whenever possible to avoid the requirement for elements needing a `.sort_list` attribute."""
-        retval = set(self._list)
+        retval = set(self)
         if result_type == "auto":
             if len(self._list) > 0:
                 result_type = type(self.as_list[0])
@@ -5472,7 +6433,18 @@ class CiscoRange(MutableSequence):
         '1,3,5-7'
         >>>
         """
-        if len(self._list) == 0:
+        if self._intervals is not None:
+            # Compress integer intervals without expanding them...
+            retval = list()
+            for first, last in self._intervals:
+                if first == last:
+                    retval.append(str(first))
+                elif last == first + 1:
+                    retval.extend([str(first), str(last)])
+                else:
+                    retval.append(f"{first}-{last}")
+            return ",".join(retval)
+        elif len(self._list) == 0:
             return ""
         else:
             retval = list()
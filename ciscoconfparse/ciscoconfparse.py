@@ -27,16 +27,17 @@ If you need to contact the author, you can do so by emailing:
 mike [~at~] pennington [.dot.] net
 """
 
-from collections.abc import MutableSequence, Sequence
+from collections.abc import MutableSequence, Sequence, Mapping
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from datetime import datetime
 from functools import partial
-from operator import is_not
+from operator import is_not, itemgetter
 import warnings
+import threading
 import inspect
 import pathlib
 import locale
 import time
-import copy
 import sys
 import re
 import os
@@ -89,6 +90,7 @@ from ciscoconfparse.models_asa import ASAAclLine
 from ciscoconfparse.models_junos import JunosCfgLine
 
 from ciscoconfparse.ccp_abc import BaseCfgLine
+from ciscoconfparse.ccp_abc import _childspec_keyword
 
 from ciscoconfparse.ccp_util import fix_repeated_words
 from ciscoconfparse.ccp_util import enforce_valid_types
@@ -284,38 +286,70 @@ def initialize_ciscoconfparse(read_only=False, debug=0):
 _, ACTIVE_LOGURU_HANDLERS = initialize_ciscoconfparse()
 
 
-@logger.catch(reraise=True)
-def parse_line_braces(line_txt=None, comment_delimiter=None) -> tuple:
-    """Internal helper-method for brace-delimited configs (typically JunOS, syntax='junos')."""
-    # Removed config parameter assertions in 1.7.2...
-
-    retval = ()
-
-    enforce_valid_types(line_txt, (str,), "line_txt parameter must be a string.")
-    enforce_valid_types(
-        comment_delimiter, (str,), "comment_delimiter parameter must be a string."
-    )
-    if len(comment_delimiter) > 1:
-        raise ValueError("len(comment_delimiter) must be one.")
-
-    child_indent = 0
-    this_line_indent = 0
-
-    junos_re_str = r"""^
+# parse_line_braces() fallback regex, only used for the rare text which
+#     _tokenize_brace_line() cannot scan (embedded newlines)
+_JUNOS_BRACE_RE = re.compile(
+    r"""^
     (?:\s*
         (?P<braces_close_left>\})*(?P<line1>.*?)(?P<braces_open_right>\{)*;*
         |(?P<line2>[^\{\}]*?)(?P<braces_open_left>\{)(?P<condition2>.*?)(?P<braces_close_right>\});*\s*
         |(?P<line3>[^\{\}]*?);*\s*
     )\s*$
-    """
-    brace_re = re.compile(junos_re_str, re.VERBOSE)
+    """,
+    re.VERBOSE,
+)
+_JUNOS_EMPTY_BRACES_RE = re.compile(r"\s*\{\s*\}\s*")
+
+
+# do NOT wrap with @logger.catch(...)
+def _tokenize_brace_line(line_txt, comment_delimiter):
+    """Return a (this_line_indent, child_indent, text) tuple for one brace-delimited config line.  This scans the brace and semicolon characters at either end of the line (instead of matching `_JUNOS_BRACE_RE`) and returns the same values as the regex; the caller is responsible for type-checking the inputs."""
+    line_txt = line_txt.strip()
+    if "\n" in line_txt or comment_delimiter == "":
+        return _parse_line_braces_regex(line_txt, comment_delimiter)
+
+    # Comments are a run of delimiters, which is not followed by another
+    #     delimiter... i.e. '## foo' is a comment, but '# foo # bar' is not
+    if line_txt[:1] == comment_delimiter and comment_delimiter not in line_txt.lstrip(comment_delimiter):
+        return (0, 0, line_txt)
+
+    # Scan leading close-braces, then scan backwards over trailing
+    #     semicolons and open-braces...
+    body = line_txt.lstrip("}")
+    rest = body.rstrip(";")
+    line1 = rest.rstrip("{")
+    braces_close_left = len(body) < len(line_txt)
+    braces_open_right = len(line1) < len(rest)
+
+    if braces_close_left and braces_open_right:
+        #     } elseif { bar baz } {
+        return (-1, 0, line1)
+    elif braces_close_left:
+        #   }
+        return (-1, -1, "")
+    elif braces_open_right:
+        #   this that foo {
+        return (0, 1, line1)
+    elif "{" in line1:
+        # Strip empty braces here
+        return (0, 0, _JUNOS_EMPTY_BRACES_RE.sub("", line1.strip()))
+    #     address 1.1.1.1
+    return (0, 0, line1.strip())
+
+
+@logger.catch(reraise=True)
+def _parse_line_braces_regex(line_txt, comment_delimiter):
+    """Regex implementation of parse_line_braces(); `_tokenize_brace_line()` falls back to this for text it cannot scan."""
+    this_line_indent = 0
+    child_indent = 0
+
     comment_re = re.compile(
         r"^\s*(?P<delimiter>[{0}]+)(?P<comment>[^{0}]*)$".format(
             re.escape(comment_delimiter)
         )
     )
 
-    brace_match = brace_re.search(line_txt.strip())
+    brace_match = _JUNOS_BRACE_RE.search(line_txt.strip())
     comment_match = comment_re.search(line_txt.strip())
 
     if isinstance(comment_match, re.Match):
@@ -358,7 +392,7 @@ def parse_line_braces(line_txt=None, comment_delimiter=None) -> tuple:
             child_indent += 0
             _line1 = results.get("line1", "").strip()
             # Strip empty braces here
-            line1 = re.sub(r"\s*\{\s*\}\s*", "", _line1)
+            line1 = _JUNOS_EMPTY_BRACES_RE.sub("", _line1)
             retval = (this_line_indent, child_indent, line1)
 
         elif (line1_str == "") and (braces_close_left is False) and (braces_open_right is False):
@@ -414,6 +448,21 @@ def parse_line_braces(line_txt=None, comment_delimiter=None) -> tuple:
     return retval
 
 
+@logger.catch(reraise=True)
+def parse_line_braces(line_txt=None, comment_delimiter=None) -> tuple:
+    """Internal helper-method for brace-delimited configs (typically JunOS, syntax='junos')."""
+    # Removed config parameter assertions in 1.7.2...
+
+    enforce_valid_types(line_txt, (str,), "line_txt parameter must be a string.")
+    enforce_valid_types(
+        comment_delimiter, (str,), "comment_delimiter parameter must be a string."
+    )
+    if len(comment_delimiter) > 1:
+        raise ValueError("len(comment_delimiter) must be one.")
+
+    return _tokenize_brace_line(line_txt, comment_delimiter)
+
+
 # This method was on ConfigList()
 @logger.catch(reraise=True)
 def cfgobj_from_text(
@@ -480,6 +529,11 @@ def cfgobj_from_text(
     return obj
 
 
+# req_cfgspec_all_diff(ignore_ws=True) only uses a set lookup for cfgspec
+#     lines without these regex characters
+_CFGSPEC_REGEX_CHARS_RE = re.compile(r"[\\^$*+?{}\[\]|()]")
+
+
 @logger.catch(reraise=True)
 def build_space_tolerant_regex(linespec):
     r"""SEMI-PRIVATE: Accept a string, and return a string with all spaces replaced with '\s+'."""
@@ -578,21 +632,25 @@ def convert_junos_to_ios(input_list=None, stop_width=4, comment_delimiter="!", d
     input_condition_01 = isinstance(input_list, list) and len(input_list) > 0
     input_condition_02 = "{" not in set(comment_delimiter)
     input_condition_03 = "}" not in set(comment_delimiter)
-    if not (input_condition_01 and input_condition_02 and input_condition_03):
+    input_condition_04 = len(comment_delimiter) <= 1
+    if not (input_condition_01 and input_condition_02 and input_condition_03 and input_condition_04):
         error = "convert_junos_to_ios() input conditions failed"
         logger.error(error)
         raise ValueError(error)
 
     lines = []
+    append = lines.append
     offset = 0
     STOP_WIDTH = stop_width
     for idx, tmp in enumerate(input_list):
         if debug > 0:
             logger.debug(f"Parse line {idx + 1}:'{tmp.strip()}'")
-        (this_line_indent, child_indent, line) = parse_line_braces(
-            tmp.strip(), comment_delimiter=comment_delimiter
+        # The arguments were checked above; call the tokenizer directly
+        #     instead of paying for parse_line_braces() checks on every line
+        (this_line_indent, child_indent, line) = _tokenize_brace_line(
+            tmp, comment_delimiter
         )
-        lines.append((" " * STOP_WIDTH * (offset + this_line_indent)) + line.strip())
+        append((" " * STOP_WIDTH * (offset + this_line_indent)) + line.strip())
         offset += child_indent
 
     return lines
@@ -609,6 +667,7 @@ class CiscoConfParse(object):
     ignore_blank_lines = True
     encoding = locale.getpreferredencoding()
     read_only = False
+    stats = None
 
     # This method is on CiscoConfParse()
     @logger.catch(reraise=True)
@@ -623,6 +682,7 @@ class CiscoConfParse(object):
         syntax="ios",
         encoding=locale.getpreferredencoding(),
         read_only=False,
+        stats=None,
     ):
         """
         Initialize CiscoConfParse.
@@ -647,7 +707,8 @@ class CiscoConfParse(object):
             A string holding the coding type.  Default is `locale.getpreferredencoding()`
         read_only : bool
             A bool indicating whether CiscoConfParse should execute read-only.
-
+        stats : bool, callable or :class:`~ciscoconfparse.ParseStats`
+            Set True (or pass a ParseStats() instance) to record per-phase parse timing, line counts, config object classes and regex cache statistics in ``parse.stats``.  A callable is used as the ``ParseStats(callback=...)``, which is called after each parse phase.  Default: None, which disables the statistics.
 
 
         Returns
@@ -689,6 +750,8 @@ class CiscoConfParse(object):
             An alias for `ConfigObjs`
         openargs : dict
             Returns a dictionary of valid arguments for `open()` (these change based on the running python version).
+        stats : :class:`~ciscoconfparse.ParseStats`
+            The parse statistics, or None if ``stats`` was not enabled.
         syntax : str
             A string holding the configuration type.  Default: 'ios'.  Must be one of: 'ios', 'nxos', 'iosxr', 'asa', 'junos'.  Use 'junos' for any brace-delimited network configuration (including F5, Palo Alto, etc...).
 
@@ -725,6 +788,23 @@ class CiscoConfParse(object):
         self.encoding = encoding or ENCODING
         self.read_only = read_only
 
+        if stats is None or stats is False:
+            self.stats = None
+        elif stats is True:
+            self.stats = ParseStats()
+        elif isinstance(stats, ParseStats):
+            self.stats = stats
+        elif callable(stats):
+            self.stats = ParseStats(callback=stats)
+        else:
+            error = f"CiscoConfParse(stats=`{stats}`) must be a bool, a callable or a ParseStats() instance"
+            logger.error(error)
+            raise InvalidParameters(error)
+
+        stats = self.stats
+        if stats is not None:
+            stats.start_cache_info()
+
         if len(config) > 0:
             try:
                 correct_element_types = []
@@ -756,10 +836,14 @@ class CiscoConfParse(object):
             else:
                 tmp_lines = self.read_config_file(filepath=config, linesplit_rgx=r"\r*\n")
         elif isinstance(config, Sequence):
+            if stats is not None:
+                start = time.perf_counter()
             if ignore_blank_lines is True and factory is False:
                 tmp_lines = [ii for ii in config if len(ii) != 0]
             else:
                 tmp_lines = config
+            if stats is not None:
+                stats.record_phase("read", time.perf_counter() - start, len(tmp_lines))
         else:
             error = f"Cannot read config from {config}"
             logger.critical(error)
@@ -767,11 +851,20 @@ class CiscoConfParse(object):
 
         # conditionally strip off junos-config braces and other syntax
         #     parsing issues...
+        if stats is not None:
+            stats.line_counts["input"] = len(tmp_lines)
+            start = time.perf_counter()
         config_lines = self.handle_ccp_brace_syntax(tmp_lines=tmp_lines, syntax=syntax)
+        if stats is not None:
+            stats.record_phase("brace_conversion", time.perf_counter() - start, len(config_lines))
+            stats.line_counts["config"] = len(config_lines)
+            start = time.perf_counter()
         if self.check_ccp_input_good(config=config_lines, logger=logger) is False:
             error = f"Cannot parse config=`{tmp_lines}`"
             logger.critical(error)
             raise ValueError(error)
+        if stats is not None:
+            stats.record_phase("input_check", time.perf_counter() - start, None)
 
         if self.debug > 0:
             logger.info("assigning self.ConfigObjs = ConfigList()")
@@ -786,6 +879,10 @@ class CiscoConfParse(object):
             ccp_ref=self,
         )
 
+        if stats is not None:
+            stats.record_classes(self.ConfigObjs._list)
+            stats.finish_cache_info()
+
         # IMPORTANT this MUST not be a lie :-)...
         self.finished_config_parse = True
 
@@ -892,11 +989,19 @@ class CiscoConfParse(object):
             raise ValueError(error)
 
         # Read the file from disk and return the list of config statements...
+        stats = self.stats
         try:
+            if stats is not None:
+                start = time.perf_counter()
             with open(file=filepath, **self.openargs) as fh:
                 text = fh.read()
+            if stats is not None:
+                stats.record_phase("read", time.perf_counter() - start, None)
+                start = time.perf_counter()
             rgx = re.compile(linesplit_rgx)
             config_lines = rgx.split(text)
+            if stats is not None:
+                stats.record_phase("split", time.perf_counter() - start, len(config_lines))
             return config_lines
 
         except OSError:
@@ -1128,158 +1233,96 @@ class CiscoConfParse(object):
             logger.error(error)
             raise ValueError(error)
 
-        @logger.catch(reraise=True)
-        def list_matching_children(
-            parent_obj,
-            childspec,
-            regex_flags,
-            allow_none=True,
-            debug=0,
-        ):
-            # I'm not using parent_obj.re_search_children() because
-            # re_search_children() doesn't return None for no match...
-
-            # FIXME: Insert debugging here...
-            # print("PARENT "+str(parent_obj))
-
-            # As of version 1.6.16, allow_none must always be True...
-            if allow_none is not True:
-                raise ValueError("allow_none parameter must always be True.")
-
-            if debug > 1:
-                msg = """Calling list_matching_children(
-    parent_obj=%s,
-    childspec=%s,
-    regex_flags=%s,
-    allow_none=%s,
-    debug=%s,
-    )""" % (
-                    parent_obj,
-                    childspec,
-                    regex_flags,
-                    allow_none,
-                    debug,
-                )
-                logger.info(msg)
-
-            # Get the child objects from parent objects
-            if parent_obj is None:
-                children = self._find_line_OBJ(
-                    linespec=childspec,
-                    exactmatch=False,
-                )
-            else:
-                children = parent_obj.children
-
-            # Find all child objects which match childspec...
-            segment_list = [
-                cobj
-                for cobj in children
-                if re.search(childspec, cobj.text, regex_flags)
-            ]
-            # Return [None] if no children matched...
-            if len(segment_list) == 0:
-                segment_list = [None]
+        # Compile each branchspec term once; re.compile() raises the same
+        #     ValueError as re.search() for compiled patterns with flags...
+        branchspec_re = [re.compile(spec, regex_flags) for spec in branchspec]
+        # The root and regex_groups searches never used regex_flags...
+        if regex_flags:
+            unflagged_re = [re.compile(spec) for spec in branchspec]
+        else:
+            unflagged_re = branchspec_re
+
+        # Each branch is a linked (parent_node, obj, re.Match) node, so
+        #     branches which fork share their common prefix instead of
+        #     copying it at every level.  Unmatched levels are (node, None, None).
+        #     Search `_text` directly; the `text` property getter is wrapped
+        #     by @logger.catch
+        root_re = branchspec_re[0]
+        root_unflagged_re = unflagged_re[0]
+        nodes = [
+            (None, obj, match)
+            for obj in self.ConfigObjs
+            if root_unflagged_re.search(obj._text)
+            for match in (root_re.search(obj._text),)
+            if match is not None
+        ]
+        if len(nodes) == 0:
+            nodes = [(None, None, None)]
+
+        for idx in range(1, len(branchspec)):
+            childspec_re = branchspec_re[idx]
+            new_nodes = []
+            append = new_nodes.append
+            for node in nodes:
+                parent_obj = node[1]
+                matched = False
+                if parent_obj is not None:
+                    # Find children to extend the family branch...
+                    for cobj in parent_obj.children:
+                        match = childspec_re.search(cobj._text)
+                        if match is not None:
+                            append((node, cobj, match))
+                            matched = True
+                if matched is False:
+                    append((node, None, None))
+            nodes = new_nodes
 
-            # FIXME: Insert debugging here...
-            # print("    SEGMENTS "+str(segment_list))
             if debug > 1:
-                logger.info(
-                    "    list_matching_children() returns segment_list=%s"
-                    % segment_list,
-                )
-            return segment_list
+                logger.info(f"    find_object_branches() branchspec[{idx}] has {len(nodes)} branches")
 
+        # Walk each leaf node back to its root to build the branches...
         branches = []
-        # iterate over the regular expressions in branchspec
-        for idx, childspec in enumerate(branchspec):
-            # FIXME: Insert debugging here...
-            # print("CHILDSPEC "+childspec)
-            if idx == 0:
-                # Get matching 'root' objects from the config
-                next_kids = list_matching_children(
-                    parent_obj=None,
-                    childspec=childspec,
-                    regex_flags=regex_flags,
-                    allow_none=True,
-                    debug=debug,
-                )
-                # Start growing branches from the segments we received...
-                branches = [[kid] for kid in next_kids]
-
-            else:
-                new_branches = []
-                for branch in branches:
-                    # Extend existing branches into the new_branches
-                    if branch[-1] is not None:
-                        # Find children to extend the family branch...
-                        next_kids = list_matching_children(
-                            parent_obj=branch[-1],
-                            childspec=childspec,
-                            regex_flags=regex_flags,
-                            allow_none=True,
-                            debug=debug,
-                        )
-
-                        for kid in next_kids:
-                            # Fork off a new branch and add each matching kid...
-                            # Use copy.copy() for a "shallow copy" of branch:
-                            #    https://realpython.com/copying-python-objects/
-                            tmp = copy.copy(branch)
-                            tmp.append(kid)
-                            new_branches.append(tmp)
-                    else:
-                        branch.append(None)
-                        new_branches.append(branch)
-
-                # Ensure we have the most recent branches...
-                branches = new_branches
-
-        branches = new_branches
+        for node in nodes:
+            branch = []
+            while node is not None:
+                branch.append(node)
+                node = node[0]
+            branch.reverse()
+            branches.append(branch)
 
         # If regex_groups is True, assign regexp matches to the return matrix.
         if regex_groups is True:
             return_matrix = []
-            # branchspec = (r"^interfaces", r"\s+(\S+)", r"\s+(unit\s+\d+)", r"family\s+(inet)", r"address\s+(\S+)")
-            # for idx_matrix, row in enumerate(self.find_object_branches(branchspec)):
-            for _, row in enumerate(branches):
-                if not isinstance(row, Sequence):
-                    raise RequirementFailure()
-
-                # Before we check regex capture groups, allocate an "empty return_row"
-                #   of the correct length...
-                return_row = [(None,)] * len(branchspec)
-
-                # Populate the return_row below...
-                #     return_row will be appended to return_matrix...
-                for idx, element in enumerate(row):
+            for branch in branches:
+                return_row = []
+                for idx, (_, element, match) in enumerate(branch):
                     if element is None:
-                        return_row[idx] = (None,)
+                        return_row.append((None,))
+                        continue
 
+                    if regex_flags:
+                        match = unflagged_re[idx].search(element._text)
+
+                    if match is None:
+                        # No regex capture groups b/c of no regex match...
+                        return_row.append((None,))
                     else:
-                        regex_result = re.search(branchspec[idx], element.text)
-                        if regex_result is not None:
-                            # Save all the regex capture groups in matched_capture...
-                            matched_capture = regex_result.groups()
-                            if len(matched_capture) == 0:
-                                # If the branchspec groups() matches are a
-                                # zero-length tuple, populate this return_row
-                                # with the whole element's text
-                                return_row[idx] = (element.text,)
-                            else:
-                                # In this case, we found regex capture groups
-                                return_row[idx] = matched_capture
+                        # Save all the regex capture groups in matched_capture...
+                        matched_capture = match.groups()
+                        if len(matched_capture) == 0:
+                            # If the branchspec groups() matches are a
+                            # zero-length tuple, populate this return_row
+                            # with the whole element's text
+                            return_row.append((element.text,))
                         else:
-                            # No regex capture groups b/c of no regex match...
-                            return_row[idx] = (None,)
+                            # In this case, we found regex capture groups
+                            return_row.append(matched_capture)
 
                 return_matrix.append(return_row)
 
-            branches = return_matrix
+            return return_matrix
 
-        # We could have lost or created an extra branch if these aren't the
-        # same length
-        return branches
+        return [[node[1] for node in branch] for branch in branches]
 
     # This method is on CiscoConfParse()
     @logger.catch(reraise=True)
@@ -2335,6 +2378,64 @@ class CiscoConfParse(object):
             if not obj.re_search_children(childspec, recurse=recurse)
         ]
 
+    # This method is on CiscoConfParse()
+    @ logger.catch(reraise=True)
+    def query(self, query=None, **kwargs):
+        r"""Run a :class:`~ciscoconfparse.ConfigQuery` against this config, and return a list of result dicts in config order.  Checking required, forbidden and optional child regexes in one query replaces chained calls such as :func:`~ciscoconfparse.CiscoConfParse.find_parent_objects` and :func:`~ciscoconfparse.CiscoConfParse.find_parent_objects_wo_child`, which each rescan the config.
+
+        Parameters
+        ----------
+        query : :class:`~ciscoconfparse.ConfigQuery`
+            The query to run.  If `query` is None, a ConfigQuery() is built from `kwargs`.
+
+        Returns
+        -------
+        list
+            A list of result dicts, see :meth:`ciscoconfparse.ConfigQuery.match`
+
+        Examples
+        --------
+        >>> from ciscoconfparse import CiscoConfParse
+        >>> config = [
+        ...     'interface GigabitEthernet1/1',
+        ...     ' switchport mode access',
+        ...     ' spanning-tree portfast',
+        ...     'interface GigabitEthernet1/2',
+        ...     ' switchport mode access',
+        ...     ]
+        >>> parse = CiscoConfParse(config)
+        >>> results = parse.query(parentspec=r'^interface', required=[r'^\s+switchport\s+mode\s+access'], forbidden=[r'^\s+spanning-tree\s+portfast'])
+        >>> [result['parent'] for result in results]
+        [<IOSCfgLine # 3 'interface GigabitEthernet1/2'>]
+        >>>
+        """
+        if query is None:
+            query = ConfigQuery(**kwargs)
+        elif not isinstance(query, ConfigQuery) or len(kwargs) > 0:
+            error = f"query(query=`{query}`) must be a ConfigQuery() instance, without other arguments"
+            logger.error(error)
+            raise InvalidParameters(error)
+        return query.run(self)
+
+    # This method is on CiscoConfParse()
+    @ logger.catch(reraise=True)
+    def profile_queries(self):
+        r"""Return a :class:`~ciscoconfparse.QueryProfiler` context manager, which records the linespec, elapsed time, objects scanned and matches of each ``find_*()`` / ``re_match_iter_typed()`` query on this config inside the ``with`` block.
+
+        Examples
+        --------
+        >>> from ciscoconfparse import CiscoConfParse
+        >>> parse = CiscoConfParse(['interface Vlan1', ' shutdown', 'interface Vlan2'])
+        >>> with parse.profile_queries() as profiler:
+        ...     shutdown_intfs = parse.find_parent_objects(r'^interface', r'^\s+shutdown')
+        ...
+        >>> print(profiler.format_report())  # doctest: +SKIP
+           seconds   calls    scanned   matches  method  spec
+          0.000092       1          3         1  find_parent_objects  ^interface / ^\s+shutdown
+        >>>
+        """
+        return QueryProfiler(self)
+
     # This method is on CiscoConfParse()
     @ logger.catch(reraise=True)
     def find_parents_wo_child(self, parentspec, childspec, ignore_ws=False):
@@ -3061,11 +3162,52 @@ class CiscoConfParse(object):
         """Find all :class:`~models_cisco.IOSCfgLine` objects whose text
         matches linespec, and delete the object"""
         objs = self.find_objects(linespec, exactmatch, ignore_ws)
-        for obj in reversed(objs):
-            # NOTE - 'del self.ConfigObjs...' was replaced in version 1.5.30
-            #    with a simpler approach
-            # del self.ConfigObjs[obj.linenum]
-            obj.delete()
+        # Delete all matches (and their children) in one pass, instead of
+        #    one O(N) obj.delete() per match
+        self.ConfigObjs.bulk_delete(objs, recurse=True)
+
+    # This method is on CiscoConfParse()
+    @ logger.catch(reraise=True)
+    def delete_objects(self, objs, recurse=True):
+        """Delete all :class:`~models_cisco.IOSCfgLine` objects in ``objs`` with one pass over the configuration.  If ``recurse`` is True, the children of each object are also deleted.  Return the number of deleted objects.
+
+        Parameters
+        ----------
+        objs : list
+            A list of configuration objects, such as the return value of :func:`~ciscoconfparse.CiscoConfParse.find_objects`
+        recurse : bool
+            Set True to also delete all children (children, grand children, great grand children, etc...)
+
+        Returns
+        -------
+        int
+            The number of deleted objects
+        """
+        enforce_valid_types(recurse, (bool,), "recurse parameter must be a bool.")
+        return self.ConfigObjs.bulk_delete(list(objs), recurse=recurse)
+
+    # This method is on CiscoConfParse()
+    @ logger.catch(reraise=True)
+    def re_sub_objects(self, objs, regex, replacergx, ignore_rgx=None):
+        """Replace all strings matching ``regex`` with ``replacergx`` in each :class:`~models_cisco.IOSCfgLine` object in ``objs``; objects whose text matches ``ignore_rgx`` are skipped.  This is the same as calling :func:`~models_cisco.IOSCfgLine.re_sub` on each object, but ``regex`` is only compiled once and unchanged objects are not rebuilt.
+
+        Parameters
+        ----------
+        objs : list
+            A list of configuration objects, such as the return value of :func:`~ciscoconfparse.CiscoConfParse.find_objects`
+        regex : str
+            A string or python regular expression, which should be matched.
+        replacergx : str
+            A string or python regular expression, which should replace the text matched by ``regex``.
+        ignore_rgx : str
+            A string or python regular expression; the replacement is skipped on objects whose text matches ``ignore_rgx``.  Defaults to None.
+
+        Returns
+        -------
+        list
+            The new text of each object in ``objs``; None for objects which were deleted because their new text was blank
+        """
+        return self.ConfigObjs.bulk_re_sub(list(objs), regex, replacergx, ignore_rgx=ignore_rgx)
 
     # This method is on CiscoConfParse()
     @ logger.catch(reraise=True)
@@ -3206,16 +3348,17 @@ class CiscoConfParse(object):
            >>>
 
         """
-        retval = list()
         ## Since we are replacing text, we *must* operate on ConfigObjs
         if excludespec:
             excludespec_re = re.compile(excludespec)
 
+        objs = list()
         for obj in self._find_line_OBJ(linespec, exactmatch=exactmatch):
-            if excludespec and excludespec_re.search(obj.text):
+            if excludespec and excludespec_re.search(obj._text):
                 # Exclude replacements on lines which match excludespec
                 continue
-            retval.append(obj.re_sub(linespec, replacestr))
+            objs.append(obj)
+        retval = self.ConfigObjs.bulk_re_sub(objs, linespec, replacestr)
 
         if self.factory and atomic:
             self.ConfigObjs._list = self.ConfigObjs.bootstrap_obj_init_ng(self.ioscfg)
@@ -3287,23 +3430,24 @@ class CiscoConfParse(object):
         One thing to remember about the last example, you *cannot* use a
         regular expression in `replacestr`; just use a normal python string.
         """
-        retval = list()
         ## Since we are replacing text, we *must* operate on ConfigObjs
         childspec_re = re.compile(childspec)
         if excludespec:
             excludespec_re = re.compile(excludespec)
+        objs = list()
         for pobj in self._find_line_OBJ(parentspec, exactmatch=exactmatch):
-            if excludespec and excludespec_re.search(pobj.text):
+            if excludespec and excludespec_re.search(pobj._text):
                 # Exclude replacements on pobj lines which match excludespec
                 continue
             for cobj in pobj.children:
-                if excludespec and excludespec_re.search(cobj.text):
+                if excludespec and excludespec_re.search(cobj._text):
                     # Exclude replacements on pobj lines which match excludespec
                     continue
-                elif childspec_re.search(cobj.text):
-                    retval.append(cobj.re_sub(childspec, replacestr))
+                elif childspec_re.search(cobj._text):
+                    objs.append(cobj)
                 else:
                     pass
+        retval = self.ConfigObjs.bulk_re_sub(objs, childspec_re, replacestr)
 
         if self.factory and atomic:
             self.ConfigObjs._list = self.ConfigObjs.bootstrap_obj_init_ng(self.ioscfg)
@@ -3321,23 +3465,24 @@ class CiscoConfParse(object):
         atomic=False,
     ):
         """Replace lines matching `childspec` within all children (recursive) of lines whilch match `parentspec`"""
-        retval = list()
         ## Since we are replacing text, we *must* operate on ConfigObjs
         childspec_re = re.compile(childspec)
         if excludespec:
             excludespec_re = re.compile(excludespec)
+        objs = list()
         for pobj in self._find_line_OBJ(parentspec, exactmatch=exactmatch):
-            if excludespec and excludespec_re.search(pobj.text):
+            if excludespec and excludespec_re.search(pobj._text):
                 # Exclude replacements on pobj lines which match excludespec
                 continue
             for cobj in self._find_all_child_OBJ(pobj):
-                if excludespec and excludespec_re.search(cobj.text):
+                if excludespec and excludespec_re.search(cobj._text):
                     # Exclude replacements on pobj lines which match excludespec
                     continue
-                elif childspec_re.search(cobj.text):
-                    retval.append(cobj.re_sub(childspec, replacestr))
+                elif childspec_re.search(cobj._text):
+                    objs.append(cobj)
                 else:
                     pass
+        retval = self.ConfigObjs.bulk_re_sub(objs, childspec_re, replacestr)
 
         if self.factory and atomic:
             self.ConfigObjs._list = self.ConfigObjs.bootstrap_obj_init_ng(self.ioscfg)
@@ -3521,30 +3666,40 @@ class CiscoConfParse(object):
         deprecation_warn_str = "`req_cfgspec_all_diff()` will be deprecated and removed in future versions."
         warnings.warn(deprecation_warn_str, DeprecationWarning)
 
-        rgx = dict()
-        if ignore_ws is True:
-            for line in cfgspec:
-                rgx[line] = build_space_tolerant_regex(line)
-
-        skip_cfgspec = dict()
         retval = list()
         matches = self._find_line_OBJ("[a-zA-Z]")
-        # Make a list of unnecessary cfgspec lines
-        for lineobj in matches:
-            for reqline in cfgspec:
-                if ignore_ws:
-                    if re.search(
-                        r"^" + rgx[reqline] + "$",
-                        lineobj.text.strip(),
-                    ):
-                        skip_cfgspec[reqline] = True
-                else:
-                    if lineobj.text.strip() == reqline.strip():
-                        skip_cfgspec[reqline] = True
-        ## Add items to be configured
-        ## TODO: Find a way to add the parent of the missing lines
+        config_lines = [lineobj.text.strip() for lineobj in matches]
+
+        if ignore_ws is False:
+            # Compare stripped lines with a set lookup...
+            config_set = set(config_lines)
+            for line in cfgspec:
+                if line.strip() not in config_set:
+                    retval.append(line)
+            return retval
+
+        # ignore_ws is True; cfgspec lines are space-tolerant regexes.  A
+        # whitespace-normalized set lookup finds lines which only use '.'
+        # as a regex character; use the regex for any other line...
+        config_set = {" ".join(line.split()) for line in config_lines}
+        # Index config lines by their first word...
+        config_words = {}
+        for config_line in config_lines:
+            config_words.setdefault(config_line.split(None, 1)[0], []).append(config_line)
+
         for line in cfgspec:
-            if not skip_cfgspec.get(line, False):
+            candidates = config_lines
+            if line == line.strip() and line != "" and not _CFGSPEC_REGEX_CHARS_RE.search(line):
+                if " ".join(line.split()) in config_set:
+                    continue
+                # The regex must match the first word of a config line...
+                first_word = line.split(None, 1)[0]
+                if "." not in first_word:
+                    candidates = config_words.get(first_word, [])
+            line_re = re.compile(r"^" + build_space_tolerant_regex(line) + "$")
+            if not any(line_re.search(config_line) for config_line in candidates):
+                ## Add items to be configured
+                ## TODO: Find a way to add the parent of the missing lines
                 retval.append(line)
 
         return retval
@@ -3599,21 +3754,22 @@ class CiscoConfParse(object):
 
         violate_objs = list()
         uncfg_objs = list()
-        skip_cfgspec = dict()
         retval = list()
+        # cfgspec_set and accepted hold stripped cfgspec lines...
+        cfgspec_set = {reqline.strip() for reqline in cfgspec}
+        accepted = set()
+        uncfgspec_re = re.compile(uncfgspec)
         matches = self._find_line_OBJ(linespec)
         ## Make a list of lineobject violations
         for lineobj in matches:
             # Look for config lines to unconfigure
-            accept_lineobj = False
-            for reqline in cfgspec:
-                if lineobj.text.strip() == reqline.strip():
-                    accept_lineobj = True
-                    skip_cfgspec[reqline] = True
-            if accept_lineobj is False:
+            text = lineobj.text.strip()
+            if text in cfgspec_set:
+                accepted.add(text)
+            else:
                 # If a violation is found...
                 violate_objs.append(lineobj)
-                result = re.search(uncfgspec, lineobj.text)
+                result = uncfgspec_re.search(lineobj.text)
                 # add uncfgtext to the violator's lineobject
                 lineobj.add_uncfgtext(result.group(0))
         ## Make the list of unconfig objects, recurse through parents
@@ -3626,7 +3782,7 @@ class CiscoConfParse(object):
         ## Add missing lines...
         ## TODO: Find a way to add the parent of the missing lines
         for line in cfgspec:
-            if not skip_cfgspec.get(line, False):
+            if line.strip() not in accepted:
                 retval.append(line)
 
         return retval
@@ -3852,7 +4008,8 @@ class CiscoConfParse(object):
 
         _syntax = syntax or self.syntax
         diff = HDiff(
-            before_config=self.ioscfg, after_config=cfgspec, syntax=_syntax, debug=debug
+            before_config=self.ioscfg, after_config=cfgspec, syntax=_syntax,
+            ordered_diff=not ignore_order, debug=debug,
         )
 
         for tmp in diff.all_output_dicts:
@@ -3872,9 +4029,8 @@ class CiscoConfParse(object):
                     # 'no no ' will become ''...
                     remove_cmd = fix_repeated_words(remove_cmd, word="no")
 
-                    # NOTE: if HDiff().compress_dict_diffs() was working as
-                    # planned, this manual parent handling might not be
-                    # required...
+                    # NOTE: HDiff() output dicts only list the parents of a
+                    # line, so the parent commands are handled manually...
                     #
                     # Append parent remove_cmd command entries (if any...)
                     if False:
@@ -3886,9 +4042,8 @@ class CiscoConfParse(object):
                     raise ValueError(f"Cannot remove the command for syntax={self.syntax}")
 
             elif action == "add":
-                # NOTE: if HDiff().compress_dict_diffs() was working as
-                # planned, this manual parent handling might not be
-                # required...
+                # NOTE: HDiff() output dicts only list the parents of a
+                # line, so the parent commands are handled manually...
                 #
                 # Append parent command entries (if any...)
                 for pcmd in parents:
@@ -3940,7 +4095,7 @@ class CiscoConfParse(object):
             linespec_re = re.compile("^%s$" % linespec)
 
         return list(
-            filter(lambda obj: linespec_re.search(obj.text), self.ConfigObjs),
+            filter(lambda obj: linespec_re.search(obj._text), self.ConfigObjs),
         )
 
     # This method is on CiscoConfParse()
@@ -3963,7 +4118,9 @@ class CiscoConfParse(object):
             if candidate.has_children:
                 for child in candidate.children:
                     retval.add(child)
-        retval = sorted(retval)
+        # sort by linenum without calling BaseCfgLine().__lt__() for each
+        #     comparison...
+        retval = sorted(retval, key=lambda obj: obj.linenum)
         return retval
 
     # This method is on CiscoConfParse()
@@ -4131,11 +4288,11 @@ class HDiff(object):
         before_config : list
             A list of text configuration statements representing the original config. Default value: `None`
         after_config : list
-            A list of text configuration statements representing the most-recent config. Default value: `None`
+            A list of text configuration statements representing the most-recent config, or an :class:`~ciscoconfparse.HDiffTemplate` from :meth:`HDiff.prepare_after`; the output of a template diff is rendered when the HDiff() is built, because the template objects are shared. Default value: `None`
         syntax : str
             A string holding the configuration type.  Default: 'ios'.  Must be one of: 'ios', 'nxos', 'iosxr', 'asa', 'junos'.  Use 'junos' for any brace-delimited network configuration (including F5, Palo Alto, etc...).
         ordered_diff : bool
-            A boolean for whether the returned-diff lines must be ordered.  Default value: `False`
+            A boolean for whether ACL and prefix-list lines are diffed in order (with a Myers diff), so moved entries are removed and added.  Ordered families are the children of ``ip access-list`` / ``ipv6 access-list`` and top-level ``ip prefix-list`` / ``ipv6 prefix-list`` / ``access-list`` (IOS numbered ACL) lines with the same name.  HDiff() only builds diffs for ``syntax='ios'`` and ``syntax='nxos'``.  Default value: `False`
         allow_duplicates : bool
             A boolean for whether the returned-diff lines may be duplicated.  Default value: `False`
         ignore_blank_lines : bool
@@ -4224,8 +4381,9 @@ class HDiff(object):
                 str,
                 Sequence,
                 CiscoConfParse,
+                HDiffTemplate,
             ),
-            "after_config parameter must be a instance of string, collections.abc.Sequence, or CiscoConfParse instance.",
+            "after_config parameter must be a instance of string, collections.abc.Sequence, CiscoConfParse, or HDiffTemplate instance.",
         )
         enforce_valid_types(syntax, (str,), "syntax parameter must be a str.")
         enforce_valid_types(
@@ -4255,8 +4413,13 @@ class HDiff(object):
 
         self.before_obj_list = None
         self.after_obj_list = None
+        # _ordered_scripts and _ordered_objs hold the ordered_diff results
+        self._ordered_scripts = {}
+        self._ordered_objs = set()
         # all_output_dicts contains the diff results as a list of dicts...
-        self.all_output_dicts = []
+        # it is empty unless a diff is built; build_ios_diffs() sets it to
+        # None, and the diff results are rendered on first use
+        self._all_output_dicts = []
         self.debug = debug
 
         if debug > 0:
@@ -4273,24 +4436,191 @@ class HDiff(object):
             # FIXME - I think nxos is not going to work as-expected while using `build_ios_diffs()`
             self.build_ios_diffs()
 
+        # An HDiffTemplate() shares its after objects (and their diff
+        #     state) with every HDiff(); render the output dicts now,
+        #     before another diff of the template overwrites that state
+        if isinstance(after_config, HDiffTemplate) and self._all_output_dicts is None:
+            self._all_output_dicts = list(self.iter_diff_dicts())
+
+    # This method is on HDiff()
+    @classmethod
+    @ logger.catch(reraise=True)
+    def prepare_after(cls, after_config, syntax="ios", ignore_blank_lines=True):
+        """
+        Parse and index ``after_config`` once, and return an
+        :class:`~ciscoconfparse.HDiffTemplate`.  Use the template to diff the
+        same after_config (i.e. a golden config) against many before configs.
+
+        >>> from ciscoconfparse import HDiff
+        >>> template = HDiff.prepare_after(['logging 172.28.26.15'])
+        >>> template.diff_many({'rtr1': ['logging 10.0.0.1']}, output_format='unified')
+        {'rtr1': ['-logging 10.0.0.1', '+logging 172.28.26.15']}
+        >>>
+        """
+        return HDiffTemplate(
+            after_config, syntax=syntax, ignore_blank_lines=ignore_blank_lines,
+        )
+
+    # This method is on HDiff()
+    @classmethod
+    @ logger.catch(reraise=True)
+    def family_diffs(
+        cls,
+        before_config,
+        after_config,
+        syntax="ios",
+        ignore_blank_lines=True,
+        processes=None,
+        executor="process",
+        output_format="dict",
+    ):
+        """
+        Diff ``before_config`` and ``after_config`` by top-level family
+        (such as ``interface X`` or ``router bgp 65000``) in a pool of
+        workers, and return the same output as ``HDiff().all_output_dicts``
+        (or ``HDiff().unified_diffs(header=False)``).
+
+        Top-level families diff independently, so the families are split
+        into balanced partitions; each worker parses and diffs one partition
+        and the results are merged in config order.  Top-level comment lines
+        and blank lines are diffed while merging.  Configs with banners,
+        macros or indented comments are diffed in one partition.
+
+        Parameters
+        ----------
+        before_config : list
+            A list of text configuration statements representing the original config.
+        after_config : list
+            A list of text configuration statements representing the most-recent config.
+        syntax : str
+            Either 'ios' or 'nxos'.  Default: 'ios'
+        ignore_blank_lines : bool
+            A boolean for whether blank lines in the configuration are ignored / removed.
+        processes : int
+            The number of workers.  Default: `os.cpu_count()`
+        executor : str
+            'process' for a ProcessPoolExecutor(), or 'thread' for a ThreadPoolExecutor().  Default: 'process'
+        output_format : str
+            'dict' or 'unified'.  Default: 'dict'
+
+        Returns
+        -------
+        list
+            The diff output dicts, or the unified diff lines.
+        """
+        if isinstance(before_config, CiscoConfParse):
+            before_config = before_config.ioscfg
+        if isinstance(after_config, CiscoConfParse):
+            after_config = after_config.ioscfg
+        enforce_valid_types(before_config, (Sequence,), "before_config parameter must be a collections.abc.Sequence or CiscoConfParse instance.")
+        enforce_valid_types(after_config, (Sequence,), "after_config parameter must be a collections.abc.Sequence or CiscoConfParse instance.")
+        enforce_valid_types(ignore_blank_lines, (bool,), "ignore_blank_lines parameter must be a bool.")
+        if isinstance(before_config, str) or isinstance(after_config, str):
+            raise ValueError("family_diffs() requires a list of config lines")
+        if syntax not in {"ios", "nxos"}:
+            raise ValueError(f"family_diffs() does not support syntax='{syntax}'")
+        if executor not in {"process", "thread"}:
+            raise ValueError(f"executor='{executor}' is not supported")
+        if output_format not in {"dict", "unified"}:
+            raise ValueError(f"output_format='{output_format}' is not supported")
+        if processes is None:
+            processes = os.cpu_count() or 1
+        enforce_valid_types(processes, (int,), "processes parameter must be an int.")
+
+        before_families = _hdiff_families(before_config, ignore_blank_lines)
+        after_families = _hdiff_families(after_config, ignore_blank_lines)
+        if before_families is None or after_families is None:
+            # Fall back to a single partition...
+            retval = HDiff(
+                before_config, after_config, syntax=syntax,
+                ignore_blank_lines=ignore_blank_lines,
+            ).all_output_dicts
+            if output_format == "unified":
+                return _unified_diffs_contents(retval)
+            return retval
+
+        before_families, before_detached = before_families
+        after_families, after_detached = after_families
+
+        # Balance families across partitions; the largest family goes to
+        # the partition with the fewest lines...
+        family_sizes = {}
+        for key, lines in before_families.items():
+            family_sizes[key] = len(lines)
+        for key, lines in after_families.items():
+            family_sizes[key] = family_sizes.get(key, 0) + len(lines)
+        num_partitions = max(1, min(len(family_sizes), processes * 4))
+        partitions = [[0, [], []] for _ in range(num_partitions)]
+        for key in sorted(family_sizes, key=family_sizes.get, reverse=True):
+            partition = min(partitions, key=itemgetter(0))
+            partition[0] += family_sizes[key]
+            partition[1].extend(before_families.get(key, ()))
+            partition[2].extend(after_families.get(key, ()))
+
+        jobs = []
+        for _, before_lines, after_lines in partitions:
+            if len(before_lines) == 0 and len(after_lines) == 0:
+                continue
+            before_lines.sort()
+            after_lines.sort()
+            jobs.append(
+                (
+                    [ii[0] for ii in before_lines],
+                    [ii[1] for ii in before_lines],
+                    [ii[0] for ii in after_lines],
+                    [ii[1] for ii in after_lines],
+                    syntax,
+                    ignore_blank_lines,
+                )
+            )
+
+        # segments is a list of (diff_side_order, linenum, list_of_line_dicts)
+        segments = _hdiff_detached_segments(before_detached, after_detached)
+        pool_class = ProcessPoolExecutor if executor == "process" else ThreadPoolExecutor
+        with pool_class(max_workers=processes) as pool:
+            for job_segments in pool.map(_hdiff_family_worker, jobs):
+                segments.extend(job_segments)
+
+        # Before lines are rendered in before_config order, then after lines
+        # in after_config order...
+        segments.sort(key=itemgetter(0, 1))
+        retval = [line_dict for segment in segments for line_dict in segment[2]]
+        if output_format == "unified":
+            return _unified_diffs_contents(retval)
+        return retval
+
     @ logger.catch(reraise=True)
     def parse_hdiff_configs(self):
 
         if self.debug > 1:
             logger.info("HDiff().before_config={0}{1}".format(os.linesep, '\n'.join(self.before_config)))
-            logger.info("HDiff().after_config={0}{1}".format(os.linesep, '\n'.join(self.after_config)))
+            if isinstance(self.after_config, HDiffTemplate):
+                logger.info("HDiff().after_config={0}{1}".format(os.linesep, '\n'.join(self.after_config.after_lines)))
+            else:
+                logger.info("HDiff().after_config={0}{1}".format(os.linesep, '\n'.join(self.after_config)))
 
         # TODO - incorporate difflib.get_close_matches() to reorder the
         #     diff (in unified format)
-        if not isinstance(self.before_config, CiscoConfParse):
-            self.parse_before = CiscoConfParse(
-                self.before_config, syntax=self.syntax,
-                ignore_blank_lines=self.ignore_blank_lines,
-            )
+        # build_diff_obj_list() normalizes the text of the parsed objects
+        #     in place, so never diff a caller's CiscoConfParse() objects;
+        #     parse a fresh copy of its config, as family_diffs() does
+        before_config = self.before_config
+        if isinstance(before_config, CiscoConfParse):
+            before_config = before_config.ioscfg
+        self.parse_before = CiscoConfParse(
+            before_config, syntax=self.syntax,
+            ignore_blank_lines=self.ignore_blank_lines,
+        )
 
-        if not isinstance(self.after_config, CiscoConfParse):
+        if isinstance(self.after_config, HDiffTemplate):
+            # Reuse the template which was parsed in HDiff.prepare_after()
+            self.parse_after = self.after_config.parse_after
+        else:
+            after_config = self.after_config
+            if isinstance(after_config, CiscoConfParse):
+                after_config = after_config.ioscfg
             self.parse_after = CiscoConfParse(
-                self.after_config, syntax=self.syntax,
+                after_config, syntax=self.syntax,
                 ignore_blank_lines=self.ignore_blank_lines,
             )
 
@@ -4336,7 +4666,12 @@ class HDiff(object):
         retval = []
         for obj in parse.objs:
             # Rewrite obj.text to remove multiple spaces between terms...
-            obj.text = " " * obj.indent + " ".join(obj.text.strip().split())
+            # skip the text setter if obj.text is already normalized (i.e.
+            # a template from HDiff.prepare_after()).  Comments always use
+            # the setter; it makes each comment its own parent
+            text = " " * obj.indent + " ".join(obj.text.strip().split())
+            if text != obj.text or obj.is_comment is True:
+                obj.text = text
 
             # Track whether this term was rendered in the output yet...
             obj.diff_rendered = False
@@ -4348,9 +4683,33 @@ class HDiff(object):
 
         return retval
 
+    # This method is on HDiff()
+    @ logger.catch(reraise=True)
+    def build_diff_id_index(self, before_obj_list):
+        """
+        Return a dict of before objects, keyed by the `diff_id_list` tuple.  If
+        several before objects have the same `diff_id_list`, the first one is
+        indexed.
+        """
+        if not isinstance(before_obj_list, list):
+            raise ValueError
+
+        retval = {}
+        for before_obj in before_obj_list:
+            if not isinstance(before_obj, BaseCfgLine):
+                raise ValueError
+            if before_obj.diff_side != "before":
+                raise RequirementFailure()
+            retval.setdefault(before_obj.diff_id_tuple(), before_obj)
+        return retval
+
     # This method is on HDiff()
     @ logger.catch(reraise=True)
     def build_ios_diffs(self):
+        # Index before objects by diff_id_list so each after_obj is matched
+        # with a dict lookup instead of a scan of before_obj_list...
+        before_index = self.build_diff_id_index(self.before_obj_list)
+
         # Handle add / move / change. change is diff_word: remove + diff_word: add
         for after_obj in self.after_obj_list:
             if not isinstance(after_obj, (BaseCfgLine,)):
@@ -4367,20 +4726,19 @@ class HDiff(object):
             # Check whether we keep the before object, or add a new after object...
             # before_list and after_obj may be rewritten / changed here...
             self.before_obj_list, after_obj = self.find_in_before_obj_list(
-                self.before_obj_list, after_obj
+                self.before_obj_list, after_obj, before_index=before_index
             )
 
             # Ensure that we rewrote after_obj.diff_word from default_diff_word_after
             # NOTE removed in 1.7.15...
             # assert after_obj.diff_word in valid_after_obj_diff_words
 
-        # At this stage, `dict_diffs()` returns duplicate parent lines...
-        tmp_line_dicts = self.dict_diffs(self.before_obj_list, self.after_obj_list)
+        if self.ordered_diff is True:
+            self.build_ordered_diffs()
 
-        # Remove duplicate parent lines with `compress_dict_diffs()`
-        self.all_output_dicts = self.compress_dict_diffs(
-            tmp_line_dicts, debug=self.debug
-        )
+        # The diff_word of every object is known now; render the output
+        # dicts lazily with `iter_diff_dicts()`...
+        self._all_output_dicts = None
 
         if False:
             # status quo sorts before_config lines, then after_config lines...
@@ -4388,6 +4746,210 @@ class HDiff(object):
             # There is no support for special sorting behavior at this point...
             self.sort_lines()
 
+    # This method is on HDiff()
+    @ logger.catch(reraise=True)
+    def ordered_families(self, obj_list):
+        """
+        Return a dict of the ordered_diff families in obj_list; each value
+        is a list of family objects in config order.  The key of an
+        ``ip access-list`` family is the parent's diff_id, and the key of a
+        prefix-list or ``access-list`` family is the normalized list name.
+        """
+        retval = {}
+        # root_keys is indexed by the line_id of a top-level line...
+        root_keys = {}
+        for obj in obj_list:
+            diff_id = obj.diff_id_tuple()
+            if len(diff_id) == 1:
+                key = None
+                if _HDIFF_ORDERED_PARENT_RE.search(obj.text):
+                    key = ("children", diff_id)
+                else:
+                    mm = _HDIFF_ORDERED_LINE_RE.search(obj.text)
+                    if mm is not None:
+                        key = ("lines", " ".join(mm.group(0).split()))
+                        retval.setdefault(key, []).append(obj)
+                root_keys[diff_id[0]] = key
+
+            else:
+                # The last line_id in diff_id belongs to the top-level line
+                key = root_keys.get(diff_id[-1], None)
+                if key is not None:
+                    retval.setdefault(key, []).append(obj)
+        return retval
+
+    # This method is on HDiff()
+    @ logger.catch(reraise=True)
+    def build_ordered_diffs(self):
+        """
+        Diff ordered_diff families (ACLs and prefix-lists) in order.  Lines
+        in the longest common subsequence of the before and after family
+        are kept; all other family lines are removed or added in place.
+        """
+        before_families = self.ordered_families(self.before_obj_list)
+        after_families = self.ordered_families(self.after_obj_list)
+        before_index = None
+
+        for key, before_family in before_families.items():
+            after_family = after_families.get(key, None)
+            # A family on only one side is diffed as usual...
+            if after_family is None:
+                continue
+
+            matches = _myers_matches(
+                [obj.diff_id_tuple() for obj in before_family],
+                [obj.diff_id_tuple() for obj in after_family],
+            )
+
+            # Build the edit script; removes are rendered before adds...
+            script = []
+            ii, jj = 0, 0
+            for match_ii, match_jj in matches + [(len(before_family), len(after_family))]:
+                for bobj in before_family[ii:match_ii]:
+                    bobj.diff_word = "remove"
+                    script.append(bobj)
+                for aobj in after_family[jj:match_jj]:
+                    aobj.diff_word = "add"
+                    script.append(aobj)
+                if match_ii < len(before_family):
+                    before_family[match_ii].diff_word = "keep"
+                    after_family[match_jj].diff_word = "unchanged"
+                    script.append(before_family[match_ii])
+                ii, jj = match_ii + 1, match_jj + 1
+
+            # Render the script after the access-list parent, or in place of
+            # the first line of the family...
+            if key[0] == "children":
+                if before_index is None:
+                    before_index = self.build_diff_id_index(self.before_obj_list)
+                anchor = before_index[key[1]]
+            else:
+                anchor = before_family[0]
+            self._ordered_scripts[id(anchor)] = script
+            self._ordered_objs.update(id(obj) for obj in before_family)
+            self._ordered_objs.update(id(obj) for obj in after_family)
+
+    # This method is on HDiff()
+    @property
+    @ logger.catch(reraise=True)
+    def all_output_dicts(self):
+        """A `list` of all the output dicts; see :meth:`HDiff.iter_diff_dicts`"""
+        if self._all_output_dicts is None:
+            self._all_output_dicts = list(self.iter_diff_dicts())
+        return self._all_output_dicts
+
+    # This method is on HDiff()
+    @all_output_dicts.setter
+    @ logger.catch(reraise=True)
+    def all_output_dicts(self, value):
+        self._all_output_dicts = value
+
+    # This method is on HDiff()
+    def iter_diff_dicts(self):
+        """
+        Yield the HDiff() output dicts one at a time, in the same order as
+        ``all_output_dicts``, without building the whole list.  Each line
+        is rendered when it is yielded, so huge diffs can be written to a
+        file or a socket as they are generated.
+
+        Only a diff_id index of the before and after objects is built
+        before the first dict is yielded.
+        """
+        # do NOT wrap with @logger.catch(...)
+        #     a generator wrapped by logger.catch() is not streamed...
+        if self._all_output_dicts is not None:
+            yield from self._all_output_dicts
+            return
+
+        for obj in self._iter_diff_objs():
+            line_dict = obj.as_diff_dict
+            del line_dict["diff_id_list"]
+            yield line_dict
+
+    # This method is on HDiff()
+    def _iter_diff_objs(self):
+        """Yield the *CfgLine() objects of the diff in output order"""
+        # do NOT wrap with @logger.catch(...)
+        #     a generator wrapped by logger.catch() is not streamed...
+
+        # top_objs holds the top-level diff lines; followers is indexed by
+        # diff_id and each value is a list of the lines which are inserted
+        # directly after that line (oldest first)...
+        top_objs = []
+        followers = {}
+        # ordered_diff family lines are only rendered in their edit script
+        scripts = self._ordered_scripts
+        scripted = self._ordered_objs
+
+        # Every before line is rendered (keep or remove) in before_config
+        # order; duplicate diff_id lines are only rendered once...
+        for bobj in self.before_obj_list:
+            if id(bobj) in scripted:
+                if id(bobj) in scripts:
+                    top_objs.append(bobj)
+                continue
+            diff_id = bobj.diff_id_tuple()
+            if diff_id in followers:
+                continue
+            top_objs.append(bobj)
+            followers[diff_id] = []
+
+        # 'unchanged' after lines always have a matching before line, so
+        # only 'add' after lines are rendered...
+        for aobj in self.after_obj_list:
+            if aobj.diff_word != "add" or id(aobj) in scripted:
+                continue
+            diff_id = aobj.diff_id_tuple()
+            if diff_id in followers:
+                continue
+
+            # The parent of aobj has the same diff_id, without the first
+            # (i.e. aobj's own) line_id...
+            parent_followers = followers.get(diff_id[1:], None)
+            if len(diff_id) > 1 and parent_followers is not None:
+                parent_followers.append(aobj)
+            else:
+                # If there's no parent, add aobj as a completely new
+                # element at the bottom of the diff
+                top_objs.append(aobj)
+            followers[diff_id] = []
+
+        # Each inserted line goes directly after its parent, so the newest
+        # insert is rendered first...
+        stack = top_objs[::-1]
+        while stack:
+            obj = stack.pop()
+            script = scripts.get(id(obj), None)
+            if id(obj) not in scripted:
+                obj.diff_rendered = True
+                if obj.diff_side == "before":
+                    obj.diff_linenum = -1
+                else:
+                    obj.diff_linenum = obj.linenum
+                yield obj
+                stack.extend(followers[obj.diff_id_tuple()])
+
+            if script is not None:
+                for script_obj in script:
+                    script_obj.diff_rendered = True
+                    if script_obj.diff_side == "before":
+                        script_obj.diff_linenum = -1
+                    else:
+                        script_obj.diff_linenum = script_obj.linenum
+                    yield script_obj
+
+    # This method is on HDiff()
+    def iter_unified_diffs(self, header=True):
+        """
+        Yield the unified diff of the before and after HDiff()
+        configurations one line at a time; see :meth:`HDiff.unified_diffs`.
+        """
+        # do NOT wrap with @logger.catch(...)
+        #     a generator wrapped by logger.catch() is not streamed...
+        if header is True:
+            yield from self.unified_diff_header()
+        yield from _iter_unified_diffs_contents(self.iter_diff_dicts())
+
     # This method is on HDiff()
     @ logger.catch(reraise=True)
     def unified_diff_header(self):
@@ -4469,19 +5031,7 @@ class HDiff(object):
         Return a python list of unified diff contents which contain the unified diff of the
         before and after HDiff() configurations.
         """
-        unified_diff_list = []
-        for line_dict in self.all_output_dicts:
-            if not isinstance(line_dict, dict):
-                raise ValueError
-
-            if line_dict["diff_word"] == "add":
-                unified_diff_list.append("+" + line_dict["text"])
-            elif line_dict["diff_word"] == "remove":
-                unified_diff_list.append("-" + line_dict["text"])
-            else:
-                unified_diff_list.append(" " + line_dict["text"])
-
-        return unified_diff_list
+        return _unified_diffs_contents(self.all_output_dicts)
 
     # This method is on HDiff()
     @ logger.catch(reraise=True)
@@ -4506,62 +5056,23 @@ class HDiff(object):
         #
         raise NotImplementedError
 
-    # This method is on HDiff()
-    @ logger.catch(reraise=True)
-    def dict_diffs(self, before_obj_list, after_obj_list):
-        ############################################
-        # Render diffs
-        ############################################
-        all_dict_lines = []
-        for bobj in before_obj_list:
-            if not isinstance(bobj, BaseCfgLine):
-                raise ValueError
-
-            if bobj.diff_side != "before":
-                raise RequirementFailure()
-
-            # FIXME - I am disabling this to prevent redundant rendering of before_obj and after_obj
-            if bobj.diff_word == "keep" and bobj.diff_rendered is False:
-                bobj.diff_rendered = True
-                bobj.diff_linenum = -1
-                all_dict_lines.append(bobj.as_diff_dict)
-                continue
-
-            elif bobj.diff_word == "remove" and bobj.diff_rendered is False:
-                bobj.diff_rendered = True
-                bobj.diff_linenum = -1
-                all_dict_lines.append(bobj.as_diff_dict)
-                continue
-
-            else:
-                raise NotImplementedError()
-
-        # Render all "after" lines we haven't considered yet...
-        tmp_dict_list = list()
-        for aobj in after_obj_list:
-            tmp_dict_list = self.render_after_obj_diffs(aobj)
-            all_dict_lines.extend(tmp_dict_list)
-
-        return all_dict_lines
-
     # This method is on HDiff()
     @ logger.catch(reraise=True)
     def find_in_before_obj_list(
-        self, before_obj_list, after_obj, consider_whitespace=False, debug=0
+        self, before_obj_list, after_obj, consider_whitespace=False, debug=0,
+        before_index=None,
     ):
         """
         Find matches for after_obj in before_obj_list.  If a match found, the
         before_obj.diff_word is 'keep' and after_obj.diff_word is 'unchanged'.
         If no match is found in before_obj_list, after_obj.diff_word is 'add'.
+
+        `before_index` is an optional dict from :meth:`HDiff.build_diff_id_index`;
+        pass it when calling find_in_before_obj_list() repeatedly with the
+        same before_obj_list.
         """
-        # Check before_obj instances...
-        if not isinstance(before_obj_list, list):
-            raise ValueError
-        for before_obj in before_obj_list:
-            if not isinstance(before_obj, BaseCfgLine):
-                raise ValueError
-            if before_obj.diff_side != "before":
-                raise RequirementFailure()
+        if before_index is None:
+            before_index = self.build_diff_id_index(before_obj_list)
 
         # Check after_obj...
         if not isinstance(after_obj, BaseCfgLine):
@@ -4569,7 +5080,7 @@ class HDiff(object):
         if after_obj.diff_side != "after":
             raise RequirementFailure()
 
-        after_id_list = after_obj.diff_id_list
+        after_id_list = after_obj.diff_id_tuple()
         if debug > 0:
             logger.info(
                 "Looking for after_obj in before_obj_list.  after_obj:{} -> id_list: {}".format(
@@ -4577,296 +5088,1092 @@ class HDiff(object):
                 )
             )
 
-        for before_obj in before_obj_list:
-            before_id_list = before_obj.diff_id_list
+        before_obj = before_index.get(after_id_list, None)
+        if before_obj is not None:
+            # We found a case where before_obj.diff_word should be "keep"...
+            if debug > 0:
+                logger.debug("    Keeping before obj:'{}'".format(before_obj))
+            # Walk backwards through before_obj and after_obj and ensure all
+            # parents, grandparents, etc... are kept...
+            for bobj in before_obj.geneology:
+                bobj.diff_word = "keep"
 
-            if debug > 1:
-                logger.debug("    Considering before_obj: {}".format(before_obj))
-                logger.debug(
-                    "        before_obj.diff_id_list = {}".format(before_id_list)
-                )
-                logger.debug(
-                    "        after_obj.diff_id_list  = {}".format(after_id_list)
-                )
+            for aobj in after_obj.geneology:
+                aobj.diff_word = "unchanged"
 
-            # skip before objects we already considered...
-            if before_obj.diff_word == "keep" and (before_id_list != after_id_list):
-                # Mark all ancestors with diff_word="keep"
-                for bobj in before_obj.geneology:
-                    bobj.diff_word = "keep"
-                continue
+            return before_obj_list, after_obj
 
-            elif before_obj.diff_word == "keep" and (before_id_list == after_id_list):
-                # Walk backwards through after_obj and ensure all parents,
-                # grandparents, etc... are kept...
+        if debug > 0:
+            logger.debug("    Adding after_obj:'{}'".format(after_obj))
+        after_obj.diff_word = "add"
 
-                for bobj in before_obj.geneology:
-                    bobj.diff_word = "keep"
+        return before_obj_list, after_obj
 
-                for aobj in after_obj.geneology:
-                    aobj.diff_word = "unchanged"
 
-                return before_obj_list, after_obj
+def _iter_unified_diffs_contents(all_output_dicts):
+    """Yield a unified diff line for each HDiff() output dict"""
+    for line_dict in all_output_dicts:
+        if not isinstance(line_dict, dict):
+            raise ValueError
+
+        if line_dict["diff_word"] == "add":
+            yield "+" + line_dict["text"]
+        elif line_dict["diff_word"] == "remove":
+            yield "-" + line_dict["text"]
+        else:
+            yield " " + line_dict["text"]
 
-            elif before_obj.diff_word == "remove" and (before_id_list != after_id_list):
-                continue
 
-            elif before_obj.diff_word == "remove" and (before_id_list == after_id_list):
-                # We found a case where before_obj.diff_word should be "keep"
-                # instead of before_obj default value of "remove"...
-                if debug > 0:
-                    logger.debug("    Keeping before obj:'{}'".format(before_obj))
-                # Walk backwards through before_obj and ensure all parents,
-                # grandparents, etc... are kept...
-                for bobj in before_obj.geneology:
-                    bobj.diff_word = "keep"
+def _unified_diffs_contents(all_output_dicts):
+    """Return a list of unified diff lines for HDiff() output dicts"""
+    return list(_iter_unified_diffs_contents(all_output_dicts))
 
-                after_obj.diff_word = "unchanged"
-                for aobj in after_obj.geneology:
-                    aobj.diff_word = "unchanged"
 
-                return before_obj_list, after_obj
+# HDiff(ordered_diff=True) diffs the children of these parents in order...
+_HDIFF_ORDERED_PARENT_RE = re.compile(r"^(?:ip|ipv6)\s+access-list\s")
+# ... and top-level lines with the same list name in order (ios / nxos only;
+#     HDiff() does not build diffs for other syntaxes)
+_HDIFF_ORDERED_LINE_RE = re.compile(r"^(?:(?:ip|ipv6)\s+prefix-list|access-list)\s+\S+")
 
+
+def _myers_matches(aa, bb):
+    """
+    Return a list of (ii, jj) index pairs for a longest common subsequence
+    of the sequences aa and bb.  This is a linear-space Myers diff, so the
+    run time is O((N+M)D) for D differences.
+    """
+    retval = []
+    # stack items are either a (left, top, right, bottom) range or an
+    # (ii, jj, length) run of matches; ranges are solved left to right...
+    stack = [(0, 0, len(aa), len(bb))]
+    while stack:
+        item = stack.pop()
+        if len(item) == 3:
+            ii, jj, length = item
+            retval.extend((ii + offset, jj + offset) for offset in range(length))
+            continue
+
+        left, top, right, bottom = item
+        # Trim the common prefix and suffix...
+        start = left
+        while left < right and top < bottom and aa[left] == bb[top]:
+            left += 1
+            top += 1
+        retval.extend((ii, top - left + ii) for ii in range(start, left))
+        suffix = 0
+        while left < right and top < bottom and aa[right - 1] == bb[bottom - 1]:
+            right -= 1
+            bottom -= 1
+            suffix += 1
+        if suffix > 0:
+            stack.append((right, bottom, suffix))
+        if left == right or top == bottom:
+            continue
+
+        start, finish, snake = _myers_middle_snake(aa, bb, left, top, right, bottom)
+        stack.append((finish[0], finish[1], right, bottom))
+        if snake[2] > 0:
+            stack.append(snake)
+        stack.append((left, top, start[0], start[1]))
+    return retval
+
+
+def _myers_middle_snake(aa, bb, left, top, right, bottom):
+    """
+    Return the start, the finish and the (x, y, length) diagonal of the
+    middle snake of a shortest edit script from aa[left:right] to
+    bb[top:bottom].
+    """
+    width, height = right - left, bottom - top
+    delta = width - height
+    odd = delta % 2 == 1
+    dmax = (width + height + 1) // 2
+    # Negative diagonal indices wrap around the end of vf and vb...
+    vf = [0] * (2 * dmax + 2)
+    vb = [0] * (2 * dmax + 2)
+    vf[1] = left
+    vb[1] = bottom
+    for dd in range(dmax + 1):
+        # Search forwards from (left, top)...
+        for kk in range(dd, -dd - 1, -2):
+            cc = kk - delta
+            if kk == -dd or (kk != dd and vf[kk - 1] < vf[kk + 1]):
+                px = xx = vf[kk + 1]
             else:
-                # We should never hit this condition...
-                raise NotImplementedError(
-                    before_obj,
-                    after_obj,
-                )
+                px = vf[kk - 1]
+                xx = px + 1
+            yy = top + (xx - left) - kk
+            py = yy if (dd == 0 or xx != px) else yy - 1
+            sx = xx
+            while xx < right and yy < bottom and aa[xx] == bb[yy]:
+                xx += 1
+                yy += 1
+            vf[kk] = xx
+            if odd and -(dd - 1) <= cc <= dd - 1 and yy >= vb[cc]:
+                return (px, py), (xx, yy), (sx, yy - (xx - sx), xx - sx)
+
+        # Search backwards from (right, bottom)...
+        for cc in range(dd, -dd - 1, -2):
+            kk = cc + delta
+            if cc == -dd or (cc != dd and vb[cc - 1] > vb[cc + 1]):
+                py = yy = vb[cc + 1]
+            else:
+                py = vb[cc - 1]
+                yy = py - 1
+            xx = left + (yy - top) + kk
+            px = xx if (dd == 0 or yy != py) else xx + 1
+            sx = xx
+            while xx > left and yy > top and aa[xx - 1] == bb[yy - 1]:
+                xx -= 1
+                yy -= 1
+            vb[cc] = yy
+            if not odd and -dd <= kk <= dd and xx <= vf[kk]:
+                return (xx, yy), (px, py), (xx, yy, sx - xx)
+    raise ValueError("Cannot find the middle snake")
+
+
+# Lines which are diffed as a single partition by HDiff.family_diffs()
+#     (the parent of an indented comment depends on its neighbors)
+_HDIFF_SINGLE_PARTITION_RE = re.compile(r"^(?:\s*set\s+)*\s*banner\s|^macro\s+name\s|^\s*\}|^\s+!")
+
+
+def _hdiff_families(config_lines, ignore_blank_lines):
+    """
+    Split IOS config_lines into top-level families for HDiff.family_diffs().
 
-        if debug > 0:
-            logger.debug("    Adding after_obj:'{}'".format(after_obj))
-        after_obj.diff_word = "add"
+    Return a tuple of (families, detached); families is a dict of lists of
+    (linenum, line), keyed by the normalized top-level line.  detached is a
+    list of (linenum, normalized_text, indent) for top-level comment and
+    blank lines, which are never a parent in IOS.  Return None if config_lines must be
+    diffed as a single partition.
+    """
+    # Mirror the line numbers assigned by CiscoConfParse()...
+    if ignore_blank_lines is True:
+        config_lines = [ii for ii in config_lines if len(ii) != 0]
+
+    families = {}
+    detached = []
+    # Indented lines before the first top-level line are one family...
+    family = families.setdefault(None, [])
+    for linenum, line in enumerate(config_lines):
+        if not isinstance(line, str):
+            raise ValueError
+        if _HDIFF_SINGLE_PARTITION_RE.search(line):
+            return None
 
-        return before_obj_list, after_obj
+        stripped = line.strip()
+        if stripped == "" or stripped[0] == "!":
+            if stripped == "" and ignore_blank_lines is True:
+                continue
+            indent = len(line.rstrip()) - len(line.lstrip())
+            detached.append((linenum, " " * indent + " ".join(stripped.split()), indent))
+            continue
 
-    # This method is on HDiff()
+        if line[0] not in " \t":
+            family = families.setdefault(" ".join(stripped.split()), [])
+        family.append((linenum, line))
+
+    if len(families[None]) == 0:
+        del families[None]
+    return families, detached
+
+
+def _hdiff_detached_segments(before_detached, after_detached):
+    """
+    Return HDiff.family_diffs() output segments for comment and blank lines.
+    Each detached line is its own top-level diff line, so duplicates are
+    only rendered once.
+    """
+    before_texts = {text for _, text, _ in before_detached}
+    after_texts = {text for _, text, _ in after_detached}
+
+    retval = []
+    rendered = set()
+    for linenum, text, indent in before_detached:
+        if text in rendered:
+            continue
+        rendered.add(text)
+        diff_word = "keep" if text in after_texts else "remove"
+        retval.append((0, linenum, [{
+            "linenum": -1,
+            "diff_side": "before",
+            "diff_word": diff_word,
+            "indent": indent,
+            "parents": [],
+            "text": text,
+        }]))
+
+    for linenum, text, indent in after_detached:
+        if text in rendered or text in before_texts:
+            continue
+        rendered.add(text)
+        retval.append((1, linenum, [{
+            "linenum": linenum,
+            "diff_side": "after",
+            "diff_word": "add",
+            "indent": indent,
+            "parents": [],
+            "text": text,
+        }]))
+    return retval
+
+
+def _hdiff_family_worker(job):
+    """Diff one HDiff.family_diffs() partition; return its output segments"""
+    before_linenums, before_lines, after_linenums, after_lines, syntax, ignore_blank_lines = job
+    diff = HDiff(
+        before_lines, after_lines, syntax=syntax,
+        ignore_blank_lines=ignore_blank_lines,
+    )
+
+    retval = []
+    segment = None
+    for obj in diff._iter_diff_objs():
+        line_dict = obj.as_diff_dict
+        del line_dict["diff_id_list"]
+        # before lines and top-level after lines start a new segment...
+        if obj.diff_side == "before":
+            segment = []
+            retval.append((0, before_linenums[obj.linenum], segment))
+        else:
+            line_dict["linenum"] = after_linenums[obj.linenum]
+            if len(obj.diff_id_tuple()) == 1:
+                segment = []
+                retval.append((1, line_dict["linenum"], segment))
+        segment.append(line_dict)
+    return retval
+
+
+# The HDiffTemplate() used by each ProcessPoolExecutor() worker...
+_hdiff_worker_template = None
+
+
+def _hdiff_worker_init(after_lines, syntax, ignore_blank_lines, debug):
+    """Parse the template once per HDiffTemplate().diff_many() worker process"""
+    global _hdiff_worker_template
+    _hdiff_worker_template = HDiffTemplate(
+        after_lines, syntax=syntax, ignore_blank_lines=ignore_blank_lines,
+        debug=debug,
+    )
+
+
+def _hdiff_worker_diff(before_config, output_format):
+    """Diff one before config against the worker's HDiffTemplate()"""
+    return _hdiff_worker_template.diff_result(before_config, output_format)
+
+
+class HDiffTemplate(object):
+    """A parsed and indexed HDiff() after_config, which is diffed against many before configs.  Build an HDiffTemplate() with :meth:`ciscoconfparse.HDiff.prepare_after`."""
+
+    # This method is on HDiffTemplate()
     @ logger.catch(reraise=True)
-    def render_after_obj_diffs(self, aobj=None):
+    def __init__(self, after_config=None, syntax="ios", ignore_blank_lines=True, debug=0):
         """
-        Print after_obj (aobj) diffs to stdout.  before_obj should not be
-        handled here.
+        Initialize HDiffTemplate().
+
+        Parameters
+        ----------
+        after_config : list
+            A list of text configuration statements representing the desired (template) config.
+        syntax : str
+            A string holding the configuration type.  Default: 'ios'.
+        ignore_blank_lines : bool
+            A boolean for whether blank lines in the configuration are ignored / removed.
+        debug : int
+            HDiff() debug level.  Default: 0
+
+        Attributes
+        ----------
+        parse_after : :class:`~ciscoconfparse.CiscoConfParse`
+            The parsed template; the text of each line is normalized as HDiff() requires.
+        after_lines : list
+            The normalized template text, which is sent to worker processes.
         """
-        if aobj is None:
-            raise RequirementFailure()
-        if not isinstance(aobj, BaseCfgLine):
-            raise ValueError
-        if aobj.diff_word not in ["unchanged", "add"]:
+        enforce_valid_types(
+            after_config,
+            (
+                str,
+                Sequence,
+            ),
+            "after_config parameter must be a instance of string or collections.abc.Sequence.",
+        )
+        enforce_valid_types(syntax, (str,), "syntax parameter must be a str.")
+        enforce_valid_types(
+            ignore_blank_lines, (bool,), "ignore_blank_lines parameter must be a bool."
+        )
+        enforce_valid_types(debug, (int,), "debug parameter must be an int.")
+        if syntax not in set(ALL_VALID_SYNTAX):
             raise RequirementFailure()
 
-        output = list()
+        self.syntax = syntax
+        self.ignore_blank_lines = ignore_blank_lines
+        self.debug = debug
+        self.parse_after = CiscoConfParse(
+            after_config, syntax=syntax, ignore_blank_lines=ignore_blank_lines,
+        )
 
-        if aobj.diff_word == "unchanged" and aobj.diff_rendered is False:
-            # Only render aobj.unchanged if it has children...
-            if len(aobj.children) > 0:
-                aobj.diff_rendered = True
-                aobj.diff_linenum = aobj.linenum
-                # aobj.diff_side = "after"
-                output.append(aobj.as_diff_dict)
+        # Normalize the template text once, and fill each object's
+        # diff_id_list cache so every diff reuses it...
+        for obj in self.parse_after.objs:
+            text = " " * obj.indent + " ".join(obj.text.strip().split())
+            # The text setter also makes each comment its own parent...
+            if text != obj.text or obj.is_comment is True:
+                obj.text = text
+            obj.diff_id_tuple()
+        self.after_lines = [obj.text for obj in self.parse_after.objs]
+
+    # This method is on HDiffTemplate()
+    def __repr__(self):
+        return f"<HDiffTemplate syntax='{self.syntax}' lines={len(self.after_lines)}>"
 
-        elif aobj.diff_word == "unchanged" and aobj.diff_rendered is True:
-            # Adding this because I think this condition can be removed
-            pass
+    # This method is on HDiffTemplate()
+    @ logger.catch(reraise=True)
+    def diff(self, before_config):
+        """
+        Return an :class:`~ciscoconfparse.HDiff` of ``before_config`` against
+        this template.  The template's objects are shared by every HDiff(),
+        so only the most-recent HDiff() has valid ``after_obj_list``
+        diff state; ``all_output_dicts`` is rendered when the HDiff() is
+        built, and remains valid.
+        """
+        return HDiff(
+            before_config=before_config,
+            after_config=self,
+            syntax=self.syntax,
+            ignore_blank_lines=self.ignore_blank_lines,
+            debug=self.debug,
+        )
 
-        elif aobj.diff_word == "add" and aobj.diff_rendered is False:
-            aobj.diff_rendered = True
-            aobj.diff_linenum = aobj.linenum
-            #aobj.diff_side = "after"
-            output.append(aobj.as_diff_dict)
+    # This method is on HDiffTemplate()
+    @ logger.catch(reraise=True)
+    def diff_result(self, before_config, output_format="dict"):
+        """Return the HDiff() results of ``before_config`` in ``output_format`` ('dict' or 'unified')"""
+        all_output_dicts = self.diff(before_config).all_output_dicts
+        if output_format == "dict":
+            return all_output_dicts
+        elif output_format == "unified":
+            return _unified_diffs_contents(all_output_dicts)
+        else:
+            raise ValueError(f"output_format='{output_format}' is not supported")
 
-        elif aobj.diff_word == "add" and aobj.diff_rendered is True:
-            # Adding this because I think this condition can be removed
-            pass
+    # This method is on HDiffTemplate()
+    @ logger.catch(reraise=True)
+    def diff_many(self, before_configs, output_format="dict", processes=None, chunksize=1):
+        """
+        Diff each before config in ``before_configs`` against this template.
 
+        Parameters
+        ----------
+        before_configs : dict or list
+            A dict of device name to before config, or a list of before configs.
+        output_format : str
+            'dict' returns the HDiff() ``all_output_dicts`` for each device, and 'unified' returns the unified diff lines (without a header).  Default: 'dict'
+        processes : int
+            The number of worker processes.  By default (`None`), the diffs run in this process.  Each worker parses the template once.
+        chunksize : int
+            The number of before configs sent to a worker at a time.  Default: 1
+
+        Returns
+        -------
+        dict or list
+            Per-device diff results, with the same keys (or order) as ``before_configs``.
+        """
+        if output_format not in {"dict", "unified"}:
+            raise ValueError(f"output_format='{output_format}' is not supported")
+        enforce_valid_types(
+            before_configs,
+            (
+                Mapping,
+                Sequence,
+            ),
+            "before_configs parameter must be a dict or a list.",
+        )
+        if isinstance(before_configs, str):
+            raise ValueError("before_configs parameter must be a dict or a list.")
+
+        if isinstance(before_configs, Mapping):
+            keys = list(before_configs.keys())
+            configs = [before_configs[key] for key in keys]
         else:
-            raise ValueError("We should not hit this case")
+            keys = None
+            configs = list(before_configs)
 
-        # Return the output list to the caller...
-        return output
+        if processes is None:
+            results = [
+                self.diff_result(config, output_format) for config in configs
+            ]
+        else:
+            enforce_valid_types(processes, (int,), "processes parameter must be an int.")
+            with ProcessPoolExecutor(
+                max_workers=processes,
+                initializer=_hdiff_worker_init,
+                initargs=(self.after_lines, self.syntax, self.ignore_blank_lines, self.debug),
+            ) as executor:
+                results = list(
+                    executor.map(
+                        _hdiff_worker_diff,
+                        configs,
+                        [output_format] * len(configs),
+                        chunksize=chunksize,
+                    )
+                )
 
-    # This method is on HDiff()
+        if keys is None:
+            return results
+        return dict(zip(keys, results))
+
+
+class ConfigQuery(object):
+    r"""A declarative query for parent objects, which is described by the parent's regex, plus required, forbidden and optional child regexes.  Run the query with :meth:`ciscoconfparse.CiscoConfParse.query`.
+
+    All predicates are checked in one pass over the parents.  For each parent, the predicates are planned by the number of children each one must search; anchored child regexes such as ``r'^\s+shutdown'`` only search one bucket of :meth:`~ccp_abc.BaseCfgLine.child_keyword_index`.  A required predicate without any candidate children rejects the parent before any regex runs.
+
+    Examples
+    --------
+    >>> from ciscoconfparse import CiscoConfParse, ConfigQuery
+    >>> config = [
+    ...     'interface GigabitEthernet1/1',
+    ...     ' switchport mode access',
+    ...     ' switchport access vlan 10',
+    ...     ' spanning-tree portfast',
+    ...     'interface GigabitEthernet1/2',
+    ...     ' switchport mode access',
+    ...     ' switchport access vlan 20',
+    ...     'interface Vlan20',
+    ...     ' ip address 192.0.2.1 255.255.255.0',
+    ...     ]
+    >>> parse = CiscoConfParse(config)
+    >>> query = ConfigQuery(
+    ...     r'^interface\s+(\S+)',
+    ...     required=[r'^\s+switchport\s+mode\s+access'],
+    ...     forbidden=[r'^\s+spanning-tree\s+portfast'],
+    ...     optional={'vlan': r'^\s+switchport\s+access\s+vlan\s+(\d+)'},
+    ... )
+    >>> results = parse.query(query)
+    >>> [(result['parent_groups'], result['groups']['vlan']) for result in results]
+    [(('GigabitEthernet1/2',), ('20',))]
+    >>>
+    """
+
+    # This method is on ConfigQuery()
     @ logger.catch(reraise=True)
-    def compress_dict_diffs(self, all_lines=None, debug=0):
+    def __init__(self, parentspec=None, required=None, forbidden=None, optional=None, recurse=False, ignore_ws=False):
         """
-        Summary
-        -------
+        Initialize ConfigQuery().
 
-        - Accept a list of diff dicts (diff dicts are hereafter known as a "line")
-        - Note that duplicate line parent lines may exist in the input
-        - Organize the lines such that diff parent lines (example: interface Foo) are not duplicated.
-        - Return the updated and reorganized line (dict) list.
+        Parameters
+        ----------
+        parentspec : str or re.Pattern
+            A regex which must match the parent's text.
+        required : list or dict
+            Child regexes which must all match at least one child.  Use a dict to name the regexes in the results; a list uses each regex as its own name.
+        forbidden : list or dict
+            Child regexes which must not match any child.
+        optional : list or dict
+            Child regexes whose matches (and capture groups) are returned, but do not filter the parents.
+        recurse : bool
+            Set True to search all children (children, grand children, etc...) instead of the immediate children.  The keyword index is only used when `recurse` is False.
+        ignore_ws : bool
+            Set True to make whitespace in the regexes match any whitespace.
+        """
+        if not isinstance(parentspec, (str, re.Pattern)):
+            error = f"ConfigQuery(parentspec=`{parentspec}`) must be a str or re.Pattern"
+            logger.error(error)
+            raise InvalidParameters(error)
+        enforce_valid_types(recurse, (bool,), "recurse parameter must be a bool.")
+        enforce_valid_types(ignore_ws, (bool,), "ignore_ws parameter must be a bool.")
 
-        A `line` dict will look similar to this:
+        self.recurse = recurse
+        self.ignore_ws = ignore_ws
+        self.parentspec = parentspec
+        self.parent_re = self._compile(parentspec)
+        self.required = self._build_predicates(required, "required")
+        self.forbidden = self._build_predicates(forbidden, "forbidden")
+        self.optional = self._build_predicates(optional, "optional")
 
-        ```
-        {
-            'linenum': -1,          # do not save the before linenum
-            'diff_side': 'before',
-            'diff_word': 'remove',
-            'indent': 1,
-            'parents': [],
-            'text': ' some command here',
-            'diff_id_list': [-7805827718597648250, -565516812775864492]
-        }
-        ```
+    # This method is on ConfigQuery()
+    def __repr__(self):
+        return f"<ConfigQuery parentspec={self.parentspec!r} required={len(self.required)} forbidden={len(self.forbidden)} optional={len(self.optional)}>"
+
+    # This method is on ConfigQuery()
+    def _compile(self, regex):
+        """Return `regex` as a compiled regex"""
+        if isinstance(regex, re.Pattern):
+            return regex
+        if self.ignore_ws is True:
+            regex = build_space_tolerant_regex(regex)
+        return re.compile(regex)
+
+    # This method is on ConfigQuery()
+    def _build_predicates(self, specs, kind):
+        """Return a list of (name, compiled regex) tuples from a list or dict of regexes"""
+        if specs is None:
+            return []
+        elif isinstance(specs, (str, re.Pattern)):
+            specs = [specs]
+
+        if isinstance(specs, Mapping):
+            items = list(specs.items())
+        elif isinstance(specs, Sequence):
+            items = [(spec, spec) for spec in specs]
+        else:
+            error = f"ConfigQuery({kind}=`{specs}`) must be a list or dict of regexes"
+            logger.error(error)
+            raise InvalidParameters(error)
 
-        Note that the `diff_id_list` key above contains a list of `hash()`
-        values which are calculated as a unique identifier for the combination
-        of parent and child objects.  This list of hashes is required because
-        it's possible for multiple parents to have the same child command (for
-        instance the same 'no ip proxy-arp' child on multiple interface parent
-        lines).
+        retval = []
+        for name, spec in items:
+            if not isinstance(spec, (str, re.Pattern)):
+                error = f"ConfigQuery({kind}) regex `{spec}` must be a str or re.Pattern"
+                logger.error(error)
+                raise InvalidParameters(error)
+            retval.append((name, self._compile(spec)))
+        return retval
 
-        Please note that a config command object will not get the same `hash()`
-        value for different script runs of the same code.
+    # This method is on ConfigQuery()
+    # do NOT wrap with @logger.catch(...)
+    def _candidates(self, parent_obj, children, regex):
+        """Return the children which `regex` must search"""
+        if self.recurse is False:
+            candidates = parent_obj._keyword_candidate_children(regex)
+            if candidates is not None:
+                return candidates
+        return children
+
+    # This method is on ConfigQuery()
+    # do NOT wrap with @logger.catch(...)
+    def match(self, parent_obj):
+        """Return a query result dict for `parent_obj`, or None if `parent_obj` does not match this query.
+
+        The result dict has these keys:
+
+        - 'parent': `parent_obj`
+        - 'parent_groups': the capture groups of `parentspec`
+        - 'children': a dict of matching children, keyed by required / optional regex name
+        - 'groups': a dict of the first matching child's capture groups, keyed by required / optional regex name; the value is None if no child matched an optional regex
         """
+        parent_mm = self.parent_re.search(parent_obj._text)
+        if parent_mm is None:
+            return None
 
-        # all_lines must be a python list
-        if not isinstance(all_lines, list):
-            raise ValueError
+        if self.recurse is False:
+            children = parent_obj.children
+        else:
+            children = parent_obj.all_children
+
+        # Plan: a required regex without candidates fails right away, and
+        #     a forbidden regex without candidates always passes.  Search
+        #     the others in order of their number of candidates...
+        plan = []
+        for name, regex in self.required:
+            candidates = self._candidates(parent_obj, children, regex)
+            if len(candidates) == 0:
+                return None
+            plan.append((len(candidates), 0, name, regex, candidates))
+        for name, regex in self.forbidden:
+            candidates = self._candidates(parent_obj, children, regex)
+            if len(candidates) > 0:
+                plan.append((len(candidates), 1, name, regex, candidates))
+        plan.sort(key=itemgetter(0, 1))
+
+        matched_children = {}
+        groups = {}
+        for _, is_forbidden, name, regex, candidates in plan:
+            search = regex.search
+            if is_forbidden:
+                for cobj in candidates:
+                    if search(cobj._text) is not None:
+                        return None
+            else:
+                matches = [(cobj, mm) for cobj in candidates for mm in (search(cobj._text),) if mm is not None]
+                if len(matches) == 0:
+                    return None
+                matched_children[name] = [cobj for cobj, _ in matches]
+                groups[name] = matches[0][1].groups()
+
+        for name, regex in self.optional:
+            search = regex.search
+            matches = [
+                (cobj, mm)
+                for cobj in self._candidates(parent_obj, children, regex)
+                for mm in (search(cobj._text),)
+                if mm is not None
+            ]
+            matched_children[name] = [cobj for cobj, _ in matches]
+            groups[name] = matches[0][1].groups() if matches else None
+
+        return {
+            "parent": parent_obj,
+            "parent_groups": parent_mm.groups(),
+            "children": matched_children,
+            "groups": groups,
+        }
+
+    # This method is on ConfigQuery()
+    @ logger.catch(reraise=True)
+    def run(self, config_objs):
+        """Return a list of query result dicts (see :meth:`match`) for the matching objects in `config_objs`, in config order.  `config_objs` is a :class:`~ciscoconfparse.CiscoConfParse` instance or an iterable of config objects."""
+        if isinstance(config_objs, CiscoConfParse):
+            config_objs = config_objs.ConfigObjs
 
         retval = []
-        lines = {}   # lines, indexed by diff_id
+        match = self.match
+        parent_search = self.parent_re.search
+        for obj in config_objs:
+            # Check the parent regex before the method call...
+            if parent_search(obj._text) is not None:
+                result = match(obj)
+                if result is not None:
+                    retval.append(result)
+        return retval
 
-        if debug > 0:
-            logger.info(
-                "compress_dict_diffs() will iterate over the `all_lines` variable."
-            )
-        for line_dict in all_lines:
-            if not isinstance(line_dict, dict):
-                raise RequirementFailure()
 
-            # Unwrap keywords and values from the line_dict...
-            diff_side = line_dict["diff_side"]
-            diff_word = line_dict["diff_word"]
-            diff_id_list = tuple(line_dict["diff_id_list"])
+class ParseStats(object):
+    """Opt-in parse instrumentation for :class:`~ciscoconfparse.CiscoConfParse`; enable it with ``CiscoConfParse(config, stats=True)`` and read ``parse.stats``.
+
+    ParseStats() records the wall time of each parse phase, line counts, a histogram of the config object classes and the regex cache statistics.  Phases are recorded again (and the times are added) when :meth:`~ciscoconfparse.CiscoConfParse.commit` re-parses the config.  If `callback` is set, it is called as ``callback(phase, seconds, lines)`` after each phase.
+
+    The phases are:
+
+    - 'read': read the config file, or copy the config list
+    - 'split': split the config file into lines
+    - 'brace_conversion': convert junos / brace-delimited lines to indented lines
+    - 'input_check': check the config lines
+    - 'classify': build the config objects; this is the factory classification when ``factory=True``
+    - 'link': link parents and children (and closing braces)
+    - 'banner_mark': mark IOS banner and macro lines
+    - 'blank_filter': remove blank lines
+
+    Examples
+    --------
+    >>> from ciscoconfparse import CiscoConfParse
+    >>> parse = CiscoConfParse(['interface Vlan1', ' no ip address'], stats=True)
+    >>> parse.stats.line_counts
+    {'input': 2, 'config': 2, 'objects': 2, 'parsed': 2}
+    >>> parse.stats.class_histogram
+    {'IOSCfgLine': 2}
+    >>> sorted(parse.stats.as_dict())
+    ['class_histogram', 'line_counts', 'phase_calls', 'phase_seconds', 'regex_cache', 'total_seconds']
+    >>>
+    """
 
-            # Remove some lines from consideration...
-            if lines.get(diff_id_list, None) is not None:
-                continue
+    PHASES = (
+        "read",
+        "split",
+        "brace_conversion",
+        "input_check",
+        "classify",
+        "link",
+        "banner_mark",
+        "blank_filter",
+    )
 
-            if diff_side == "before" and diff_word == "keep":
-                if debug > 0:
-                    logger.info(
-                        "compress_dict_diffs() {0},{1} APPEND-00 {2}".format(
-                            diff_side, diff_word, line_dict
-                        )
-                    )
-                retval.append(line_dict)
-                lines[diff_id_list] = len(retval) - 1
-
-            # We can remove pretty easily... don't do anything...
-            elif diff_side == "before" and diff_word == "remove":
-                if debug > 0:
-                    logger.info(
-                        "compress_dict_diffs() {0},{1} APPEND-01 {2}".format(
-                            diff_side, diff_word, line_dict
-                        )
-                    )
-                retval.append(line_dict)
-                lines[diff_id_list] = len(retval) - 1
-
-            elif diff_side == "after" and diff_word == "unchanged":
-                # FIXME - I should insert this somewhere in retval...
-                if lines.get(diff_id_list, None) is None:
-                    if debug > 0:
-                        logger.info(
-                            "compress_dict_diffs() {0},{1} APPEND-02 {2}".format(
-                                diff_side, diff_word, line_dict
-                            )
-                        )
-                    retval.append(line_dict)
-                    lines[diff_id_list] = len(retval) - 1
-                else:
-                    if debug > 0:
-                        logger.info(
-                            "compress_dict_diffs() {0},{1} SKIP-02 {2}".format(
-                                diff_side, diff_word, line_dict
-                            )
-                        )
+    # This method is on ParseStats()
+    @ logger.catch(reraise=True)
+    def __init__(self, callback=None):
+        """
+        Initialize ParseStats().
 
-            elif diff_side == "after" and diff_word == "add":
+        Parameters
+        ----------
+        callback : callable
+            An optional function, which is called as ``callback(phase, seconds, lines)`` after each parse phase.  `lines` is the number of lines (or objects) the phase returned, or None.
+        """
+        if callback is not None and not callable(callback):
+            error = f"ParseStats(callback=`{callback}`) must be callable"
+            logger.error(error)
+            raise InvalidParameters(error)
 
-                if debug > 0:
-                    logger.info(
-                        "compress_dict_diffs() {0},{1} APPEND-03 {2}".format(
-                            diff_side, diff_word, line_dict
-                        )
-                    )
+        self.callback = callback
+        self.phase_seconds = {}
+        self.phase_calls = {}
+        self.line_counts = {}
+        self.class_histogram = {}
+        self.regex_cache = {}
+        self._cache_info_start = None
 
-                # Calculate values associated with lines...
-                line_id_len = len(line_dict["diff_id_list"])
-                line_id_csv = ",".join([str(ii) for ii in line_dict["diff_id_list"]])
+    # This method is on ParseStats()
+    def __repr__(self):
+        return f"<ParseStats phases={len(self.phase_seconds)} total_seconds={self.total_seconds:.6f}>"
 
-                # check retval and find where we should "add" the
-                # line_dict...
-                if debug > 1:
-                    logger.info(
-                        "compress_dict_diffs() looping through retval to find the correct place to ADD {0}".format(line_dict)
-                    )
-                for loop_idx, this_dict in enumerate(retval):
+    # This method is on ParseStats()
+    @property
+    def total_seconds(self):
+        """The sum of all phase times"""
+        return sum(self.phase_seconds.values())
+
+    # This method is on ParseStats()
+    # do NOT wrap with @logger.catch(...)
+    def record_phase(self, phase, seconds, lines=None):
+        """Add `seconds` to the time of `phase`, and call the callback"""
+        self.phase_seconds[phase] = self.phase_seconds.get(phase, 0.0) + seconds
+        self.phase_calls[phase] = self.phase_calls.get(phase, 0) + 1
+        if self.callback is not None:
+            self.callback(phase, seconds, lines)
+
+    # This method is on ParseStats()
+    # do NOT wrap with @logger.catch(...)
+    def record_classes(self, objs):
+        """Replace the class histogram with the class names of `objs`"""
+        histogram = {}
+        for obj in objs:
+            name = obj.__class__.__name__
+            histogram[name] = histogram.get(name, 0) + 1
+        self.class_histogram = histogram
+
+    # This method is on ParseStats()
+    # do NOT wrap with @logger.catch(...)
+    def _cache_info(self):
+        """Return a dict of the current regex cache statistics"""
+        # The re module cache is private; it is only reported if it exists
+        re_cache = getattr(re, "_cache", None)
+        keyword_info = _childspec_keyword.cache_info()
+        return {
+            "re_module": {
+                "currsize": len(re_cache) if re_cache is not None else None,
+                "maxsize": getattr(re, "_MAXCACHE", None),
+            },
+            "childspec_keyword": keyword_info._asdict(),
+        }
 
-                    if debug > 1:
-                        logger.info(
-                            "    compress_dict_diffs() retval[{0}] = {1}".format(
-                                loop_idx, this_dict
-                            )
-                        )
+    # This method is on ParseStats()
+    # do NOT wrap with @logger.catch(...)
+    def start_cache_info(self):
+        """Save the regex cache statistics at the start of a parse"""
+        self._cache_info_start = self._cache_info()
+
+    # This method is on ParseStats()
+    # do NOT wrap with @logger.catch(...)
+    def finish_cache_info(self):
+        """Record the regex cache statistics at the end of a parse; 'hits' and 'misses' only count this parse"""
+        retval = self._cache_info()
+        start = self._cache_info_start
+        if start is not None:
+            for key in ("hits", "misses"):
+                retval["childspec_keyword"][key] -= start["childspec_keyword"][key]
+        self.regex_cache = retval
+
+    # This method is on ParseStats()
+    @ logger.catch(reraise=True)
+    def as_dict(self):
+        """Return the statistics as a dict of plain python values (i.e. for json.dumps())"""
+        return {
+            "phase_seconds": dict(self.phase_seconds),
+            "phase_calls": dict(self.phase_calls),
+            "total_seconds": self.total_seconds,
+            "line_counts": dict(self.line_counts),
+            "class_histogram": dict(self.class_histogram),
+            "regex_cache": {key: dict(value) for key, value in self.regex_cache.items()},
+        }
 
-                    this_id_len = len(this_dict["diff_id_list"])
-                    this_id_csv = ",".join(
-                        [str(ii) for ii in this_dict["diff_id_list"]]
-                    )
 
-                    # if this_dict (as a string csv) is a substring of line's csv,
-                    # check whether this_dict should be line's parent...
-                    if this_id_csv in line_id_csv:
-
-                        # If the length of this_dict["diff_id_list"] is one element
-                        # longer than line_dict["diff_id_list"], it's a pretty
-                        # safe assumption that this_dict is line_dict's parent...
-                        if (this_id_len + 1) == line_id_len:
-                            if debug > 1:
-                                logger.info(
-                                    "    compress_dict_diffs() INSERT at retval[{0}] -> {1}".format(
-                                        loop_idx + 1, this_dict
-                                    )
-                                )
-                            retval.insert(loop_idx + 1, line_dict)
-                            lines[diff_id_list] = len(retval) - 1
-                            break
-                else:
-                    # If there's no match above, assume we add line_dict as a
-                    # completely new element at the bottom of retval
-                    if debug > 0:
-                        logger.info(
-                            "compress_dict_diffs() {0},{1} APPEND-04 {2}".format(
-                                diff_side, diff_word, line_dict
-                            )
-                        )
-                    retval.append(line_dict)
-                    lines[diff_id_list] = len(retval) - 1
+class QueryProfiler(object):
+    r"""An opt-in query profiler for one :class:`~ciscoconfparse.CiscoConfParse` instance; use it as a context manager from :meth:`~ciscoconfparse.CiscoConfParse.profile_queries`.
 
-            else:
-                raise ValueError(line_dict)
+    Inside the ``with`` block, each call of the ``find_*()`` query methods (and the other methods in ``QUERY_METHODS``) and of :meth:`~ccp_abc.BaseCfgLine.re_match_iter_typed` on this config's objects is recorded with its linespec, elapsed time, the number of objects scanned and the number of matches returned.  Queries which are called by another query are included in the outer query's time, and are not recorded separately.
 
-            if line_dict["diff_word"] != "remove":
-                try:
-                    if tuple(line_dict["diff_id_list"]) not in lines.keys():
-                        raise RequirementFailure()
-                except BaseException:
-                    raise ValueError(line_dict)
+    Objects scanned is the size of the candidate pool: the whole config for ``CiscoConfParse()`` queries, and the searched children for ``re_match_iter_typed()`` on a config object.  Matches is the length of the returned list; ``re_match_iter_typed()`` returns one match, or zero if it returned the default.
 
-        # FIXME - undo this after I work out all bugs
-        for line_dict in retval:
-            del line_dict["diff_id_list"]
+    The query methods are only wrapped inside the ``with`` block; the profiler costs nothing when it is not active.  Profilers of different configs may be active at the same time, and may exit in any order; only one profiler per config may be active.
 
-        return retval
+    Examples
+    --------
+    >>> from ciscoconfparse import CiscoConfParse
+    >>> parse = CiscoConfParse(['interface Vlan1', ' ip address 192.0.2.1 255.255.255.0', 'interface Vlan2'])
+    >>> with parse.profile_queries() as profiler:
+    ...     for obj in parse.find_objects(r'^interface'):
+    ...         addr = obj.re_match_iter_typed(r'ip\s+address\s+(\S+)')
+    ...
+    >>> [(row['method'], row['spec'], row['calls'], row['scanned'], row['matches']) for row in profiler.report(sort_by='calls')]
+    [('re_match_iter_typed', 'ip\\s+address\\s+(\\S+)', 2, 1, 1), ('find_objects', '^interface', 1, 3, 2)]
+    >>>
+    """
+
+    # CiscoConfParse() methods, which are profiled
+    QUERY_METHODS = (
+        "find_objects",
+        "find_lines",
+        "find_children",
+        "find_all_children",
+        "find_blocks",
+        "find_object_branches",
+        "find_interface_objects",
+        "find_objects_dna",
+        "find_objects_w_child",
+        "find_objects_wo_child",
+        "find_parent_objects",
+        "find_parent_objects_wo_child",
+        "find_parents_w_child",
+        "find_parents_wo_child",
+        "find_objects_w_all_children",
+        "find_objects_w_missing_children",
+        "find_children_w_parents",
+        "find_objects_w_parents",
+        "find_child_objects",
+        "find_lineage",
+        "has_line_with",
+        "query",
+        "re_search_children",
+        "re_match_iter_typed",
+    )
+
+    # The arguments which are reported as the linespec, in this order
+    SPEC_ARGUMENTS = (
+        "linespec",
+        "parentspec",
+        "childspec",
+        "branchspec",
+        "intfspec",
+        "dnaspec",
+        "regexspec",
+        "regex",
+        "query",
+    )
+
+    REPORT_KEYS = ("seconds", "calls", "max_seconds", "scanned", "matches")
+
+    # Config objects share their class methods, so all active profilers
+    #     share one BaseCfgLine().re_match_iter_typed() wrapper; the wrapper
+    #     dispatches each call to the profiler of the object's config (keyed
+    #     by id() of the CiscoConfParse() instance).  The original method is
+    #     restored when the last profiler exits, in any order.
+    _line_profilers = {}
+    _saved_line_method = None
+    _line_profilers_lock = threading.Lock()
+
+    # This method is on QueryProfiler()
+    @ logger.catch(reraise=True)
+    def __init__(self, parse=None):
+        """
+        Initialize QueryProfiler().
+
+        Parameters
+        ----------
+        parse : :class:`~ciscoconfparse.CiscoConfParse`
+            The parsed config whose queries are profiled.
+        """
+        if not isinstance(parse, CiscoConfParse):
+            error = f"QueryProfiler(parse=`{parse}`) must be a CiscoConfParse() instance"
+            logger.error(error)
+            raise InvalidParameters(error)
+
+        self.parse = parse
+        # records is a list of dicts, one per profiled query call...
+        self.records = []
+        self._depth = 0
+        self._signatures = {}
+        self.active = False
+
+    # This method is on QueryProfiler()
+    def __repr__(self):
+        return f"<QueryProfiler records={len(self.records)} active={self.active}>"
+
+    # This method is on QueryProfiler()
+    def __enter__(self):
+        if self.active is True:
+            error = "QueryProfiler() is already active"
+            logger.error(error)
+            raise RequirementFailure(error)
+
+        parse = self.parse
+        cls = QueryProfiler
+        with cls._line_profilers_lock:
+            if id(parse) in cls._line_profilers:
+                error = "Another QueryProfiler() is already active on this config"
+                logger.error(error)
+                raise RequirementFailure(error)
+
+            if not cls._line_profilers:
+                cls._saved_line_method = BaseCfgLine.__dict__["re_match_iter_typed"]
+                BaseCfgLine.re_match_iter_typed = cls._wrap_line_method(cls._saved_line_method)
+            cls._line_profilers[id(parse)] = self
+
+        for name in self.QUERY_METHODS:
+            # An instance attribute shadows the CiscoConfParse() method...
+            setattr(parse, name, self._wrap(name, getattr(parse, name), scanned=self._config_size))
+        self.active = True
+        return self
+
+    # This method is on QueryProfiler()
+    def __exit__(self, exc_type, exc_value, traceback):
+        parse = self.parse
+        for name in self.QUERY_METHODS:
+            if name in parse.__dict__:
+                delattr(parse, name)
+
+        cls = QueryProfiler
+        with cls._line_profilers_lock:
+            if cls._line_profilers.get(id(parse), None) is self:
+                del cls._line_profilers[id(parse)]
+            if not cls._line_profilers and cls._saved_line_method is not None:
+                BaseCfgLine.re_match_iter_typed = cls._saved_line_method
+                cls._saved_line_method = None
+        self.active = False
+        return False
+
+    # This method is on QueryProfiler()
+    def _config_size(self, arguments):
+        """Return the number of objects which a CiscoConfParse() query scans"""
+        return len(self.parse.ConfigObjs)
+
+    # This method is on QueryProfiler()
+    def _signature(self, name, func):
+        """Return the cached inspect.signature() of `func`"""
+        signature = self._signatures.get(name, None)
+        if signature is None:
+            signature = inspect.signature(func)
+            self._signatures[name] = signature
+        return signature
+
+    # This method is on QueryProfiler()
+    def _spec(self, arguments):
+        """Return the linespec text of a query call"""
+        specs = []
+        for key in self.SPEC_ARGUMENTS:
+            value = arguments.get(key, None)
+            if value is None:
+                continue
+            if isinstance(value, re.Pattern):
+                value = value.pattern
+            specs.append(str(value))
+        return " / ".join(specs)
+
+    # This method is on QueryProfiler()
+    def _count_matches(self, result, arguments):
+        """Return the number of matches in the `result` of a query"""
+        if isinstance(result, bool):
+            return int(result)
+        elif isinstance(result, (Sequence, set, Mapping)) and not isinstance(result, str):
+            return len(result)
+        elif result is None:
+            return 0
+        elif "default" in arguments:
+            # re_match_iter_typed() returns the default if nothing matched
+            default = arguments["default"]
+            if result == default:
+                return 0
+            try:
+                if result == arguments.get("result_type", str)(default):
+                    return 0
+            except (TypeError, ValueError):
+                pass
+        return 1
+
+    # This method is on QueryProfiler()
+    def _record(self, name, func, signature_name, args, kwargs, scanned):
+        """Call `func`, and record the call"""
+        try:
+            arguments = self._signature(signature_name, func).bind(*args, **kwargs)
+        except TypeError:
+            # Let the query raise its own error for bad arguments...
+            return func(*args, **kwargs)
+        arguments.apply_defaults()
+        arguments = arguments.arguments
+
+        self._depth += 1
+        try:
+            start = time.perf_counter()
+            result = func(*args, **kwargs)
+            seconds = time.perf_counter() - start
+        finally:
+            self._depth -= 1
+
+        self.records.append({
+            "method": name,
+            "spec": self._spec(arguments),
+            "seconds": seconds,
+            "scanned": scanned(arguments),
+            "matches": self._count_matches(result, arguments),
+        })
+        return result
+
+    # This method is on QueryProfiler()
+    def _wrap(self, name, method, scanned):
+        """Return a wrapper around the bound CiscoConfParse() `method`"""
+        def wrapper(*args, **kwargs):
+            if self._depth > 0:
+                return method(*args, **kwargs)
+            return self._record(name, method, name, args, kwargs, scanned)
+        return wrapper
+
+    # This method is on QueryProfiler()
+    @classmethod
+    def _wrap_line_method(cls, func):
+        """Return the shared wrapper around the BaseCfgLine().re_match_iter_typed() function"""
+        profilers = cls._line_profilers
+
+        def re_match_iter_typed(obj, *args, **kwargs):
+            parse = getattr(obj.confobj, "ccp_ref", None)
+            self = profilers.get(id(parse), None)
+            if self is None or self.parse is not parse or self._depth > 0:
+                return func(obj, *args, **kwargs)
+
+            def scanned(arguments):
+                if arguments["recurse"] is True:
+                    return len(obj.all_children)
+                candidates = obj._keyword_candidate_children(arguments["regex"])
+                return len(obj.children) if candidates is None else len(candidates)
+
+            return self._record("re_match_iter_typed", func, "BaseCfgLine.re_match_iter_typed", (obj,) + args, kwargs, scanned)
+
+        return re_match_iter_typed
+
+    # This method is on QueryProfiler()
+    @ logger.catch(reraise=True)
+    def report(self, sort_by="seconds"):
+        """Return a list of dicts, one per query method and linespec, sorted by `sort_by` (largest first).  The dict keys are 'method', 'spec', 'calls', 'seconds', 'max_seconds', 'scanned' and 'matches'; the last two are totals over all calls.
+
+        Parameters
+        ----------
+        sort_by : str
+            One of 'seconds', 'calls', 'max_seconds', 'scanned' or 'matches'.  Default: 'seconds'
+        """
+        if sort_by not in self.REPORT_KEYS:
+            error = f"report(sort_by=`{sort_by}`) must be one of {self.REPORT_KEYS}"
+            logger.error(error)
+            raise InvalidParameters(error)
+
+        rows = {}
+        for record in self.records:
+            key = (record["method"], record["spec"])
+            row = rows.get(key, None)
+            if row is None:
+                row = {
+                    "method": record["method"],
+                    "spec": record["spec"],
+                    "calls": 0,
+                    "seconds": 0.0,
+                    "max_seconds": 0.0,
+                    "scanned": 0,
+                    "matches": 0,
+                }
+                rows[key] = row
+            row["calls"] += 1
+            row["seconds"] += record["seconds"]
+            row["max_seconds"] = max(row["max_seconds"], record["seconds"])
+            row["scanned"] += record["scanned"]
+            row["matches"] += record["matches"]
+
+        # sorted() is stable; equal rows stay in the order they were first called
+        return sorted(rows.values(), key=itemgetter(sort_by), reverse=True)
+
+    # This method is on QueryProfiler()
+    @ logger.catch(reraise=True)
+    def format_report(self, sort_by="seconds", limit=None):
+        """Return :meth:`report` as a text table, with at most `limit` rows."""
+        rows = self.report(sort_by=sort_by)
+        if limit is not None:
+            rows = rows[:limit]
+        lines = [f"{'seconds':>10} {'calls':>7} {'scanned':>10} {'matches':>9}  method  spec"]
+        for row in rows:
+            lines.append(
+                f"{row['seconds']:>10.6f} {row['calls']:>7} {row['scanned']:>10} {row['matches']:>9}  {row['method']}  {row['spec']}"
+            )
+        return "\n".join(lines)
 
 
 class ConfigList(MutableSequence):
     """A custom list to hold :class:`~ccp_abc.BaseCfgLine` objects.  Most people will never need to use this class directly."""
-    CiscoConfParse = None
     ccp_ref = None
     comment_delimiter = None
     factory = None
@@ -4965,11 +6272,10 @@ class ConfigList(MutableSequence):
         #
         # as of python 3.9, getattr() below is slightly faster than
         #     isinstance(initlist, Sequence)
-        self._list = self.bootstrap_obj_init_ng(initlist, debug=debug)
-
-        # Removed this portion of __init__() in 1.7.16...
+        #
+        # bootstrap_obj_init_ng() is the whole parse; only call it once
         if getattr(initlist, "__iter__", False) is not False:
-            self._list = self.bootstrap_obj_init_ng(initlist)
+            self._list = self.bootstrap_obj_init_ng(initlist, debug=debug)
 
         else:
             self._list = []
@@ -5126,28 +6432,35 @@ class ConfigList(MutableSequence):
         self._list[0].confobj.CiscoConfParse.atomic()
 
     # This method is on ConfigList()
-    @ logger.catch(reraise=True)
-    def __getattribute__(self, arg):
-        """Call arg on ConfigList() object, and if that fails, call arg from the ccp_ref attribute"""
-        # Try a method call on ASAConfigList()
+    # do NOT wrap with @logger.catch(...)
+    def __getattr__(self, arg):
+        """Call arg from the ccp_ref attribute; python only calls __getattr__() if ``arg`` is not a ConfigList() attribute"""
+        # __getattribute__() was overridden before; that ran on every
+        #     attribute access, and called inspect.stack() twice on a miss
+        ccp_ref = object.__getattribute__(self, "ccp_ref")
+        if ccp_ref is None:
+            error = f"ConfigList() doesn't have an attribute named '{arg}'"
+            raise AttributeError(error)
+
+        ccp_method = getattr(ccp_ref, arg)
+        caller = sys._getframe(1)
+        message = """{2} doesn't have an attribute named "{3}". {0}() line {1} called `__getattr__('{4}')`. CiscoConfParse() is making this work with duct tape in __getattr__().""".format(
+            caller.f_code.co_name, caller.f_lineno, ccp_ref, ccp_method, arg
+        )
+        logger.warning(message)
+        return ccp_method
 
-        # Rewrite self.CiscoConfParse to self.ccp_ref
-        if arg == "CiscoConfParse":
-            arg = "ccp_ref"
+    # This method is on ConfigList()
+    @ property
+    def CiscoConfParse(self):
+        """Alias of the ccp_ref attribute"""
+        # FIXME - CiscoConfParse attribute should go away soon
+        return self.ccp_ref
 
-        try:
-            return object.__getattribute__(self, arg)
-        except BaseException:
-            calling_function = inspect.stack()[1].function
-            caller = inspect.getframeinfo(inspect.stack()[1][0])
-
-            ccp_ref = object.__getattribute__(self, "ccp_ref")
-            ccp_method = ccp_ref.__getattribute__(arg)
-            message = """{2} doesn't have an attribute named "{3}". {0}() line {1} called `__getattribute__('{4}')`. CiscoConfParse() is making this work with duct tape in __getattribute__().""".format(
-                calling_function, caller.lineno, ccp_ref, ccp_method, arg
-            )
-            logger.warning(message)
-            return ccp_method
+    # This method is on ConfigList()
+    @ CiscoConfParse.setter
+    def CiscoConfParse(self, value):
+        self.ccp_ref = value
 
     # This method is on ConfigList()
     @ junos_unsupported
@@ -5697,7 +7010,7 @@ class ConfigList(MutableSequence):
         return parents_cache, parent
 
     @ logger.catch(reraise=True)
-    def _build_bootstrap_parent_child(self, retval, parents_cache, parent, idx, indent, obj, debug,):
+    def _build_bootstrap_parent_child(self, retval, parents_cache, parent, idx, indent, obj, debug, config_line_stack=None,):
         candidate_parent = None
         candidate_parent_idx = None
         ## If indented, walk backwards and find the parent...
@@ -5708,6 +7021,21 @@ class ConfigList(MutableSequence):
         if (indent > 0) and (parent is not None):
             ## Add the line as a child (parent was cached)
             self._add_child_to_parent(retval, idx, indent, parent, obj)
+        elif (indent > 0) and (parent is None) and (config_line_stack is not None):
+            ## config_line_stack holds the previous config lines with
+            ##    strictly increasing indents, so the nearest config line
+            ##    indented less than this one is the parent.  This is
+            ##    the same parent as the backwards walk below, without
+            ##    rescanning the whole family after each dedent
+            for candidate_parent in reversed(config_line_stack):
+                if candidate_parent.indent < indent:
+                    parent = candidate_parent
+                    parents_cache[indent] = parent  # Cache the parent
+                    break
+
+            ## Add the line as a child...
+            self._add_child_to_parent(retval, idx, indent, parent, obj)
+
         elif (indent > 0) and (parent is None):
             ## Walk backwards to find parent, and add the line as a child
             candidate_parent_idx = idx - 1
@@ -5749,19 +7077,20 @@ class ConfigList(MutableSequence):
         retval = []
         idx = None
         syntax = self.syntax
+        # ParseStats() from CiscoConfParse(stats=True), or None...
+        stats = getattr(self.ccp_ref, "stats", None)
 
-        max_indent = 0
-        macro_parent_idx_list = []
-        # a dict of parents, indexed by int() child-indent...
-        parent = None
-        parents_cache = {}
+        if stats is not None:
+            start = time.perf_counter()
+
+        # Assign a custom *CfgLine() based on factory...
+        objs = []
         for idx, txt in enumerate(text_list):
             if self.debug >= 1:
                 logger.debug("    bootstrap_obj_init_ng() adding text cmd: '%s' at idx %s" % (txt, idx,))
             if not isinstance(txt, str):
                 raise ValueError
 
-            # Assign a custom *CfgLine() based on factory...
             obj = cfgobj_from_text(
                 text_list,
                 txt=txt,
@@ -5771,6 +7100,21 @@ class ConfigList(MutableSequence):
                 factory=self.factory,
             )
             obj.confobj = self
+            objs.append(obj)
+
+        if stats is not None:
+            stats.record_phase("classify", time.perf_counter() - start, len(objs))
+            stats.line_counts["objects"] = len(objs)
+            start = time.perf_counter()
+
+        max_indent = 0
+        macro_parent_idx_list = []
+        # a dict of parents, indexed by int() child-indent...
+        parent = None
+        parents_cache = {}
+        # The previous config lines, with strictly increasing indents...
+        config_line_stack = []
+        for idx, (txt, obj) in enumerate(zip(text_list, objs)):
             indent = obj.indent
             is_config_line = obj.is_config_line
 
@@ -5789,6 +7133,7 @@ class ConfigList(MutableSequence):
             ## 4.  Maintain oldest_ancestor
             retval, parents_cache, parent = self._build_bootstrap_parent_child(
                 retval, parents_cache, parent, idx, indent, obj, debug,
+                config_line_stack=config_line_stack,
             )
 
             ## Handle max_indent
@@ -5798,11 +7143,20 @@ class ConfigList(MutableSequence):
             elif indent > max_indent:
                 max_indent = indent
 
+            if is_config_line:
+                while config_line_stack and config_line_stack[-1].indent >= indent:
+                    config_line_stack.pop()
+                config_line_stack.append(obj)
+
             retval.append(obj)
 
         # Manually assign a parent on all closing braces
         self._list = assign_parent_to_closing_braces(input_list=retval)
 
+        if stats is not None:
+            stats.record_phase("link", time.perf_counter() - start, len(retval))
+            start = time.perf_counter()
+
         # Call _banner_mark_regex() to process banners in the returned obj
         # list.
         # Mark IOS banner begin and end config line objects...
@@ -5818,15 +7172,25 @@ class ConfigList(MutableSequence):
             #   banners call out a delimiter.
             self._macro_mark_children(macro_parent_idx_list)  # Process macros
 
+            if stats is not None:
+                stats.record_phase("banner_mark", time.perf_counter() - start, None)
+
         # change ignore_blank_lines behavior for Github Issue #229...
         #    Always allow a blank line if it's in a banner or macro...
         if self.ignore_blank_lines is True:
+            if stats is not None:
+                start = time.perf_counter()
             retval = [
                 obj
                 for obj in self._list
                 if obj.text.strip() != "" or obj.blank_line_keep is True
             ]
             self._list = retval
+            if stats is not None:
+                stats.record_phase("blank_filter", time.perf_counter() - start, len(retval))
+
+        if stats is not None:
+            stats.line_counts["parsed"] = len(retval)
 
         return retval
 
@@ -5910,6 +7274,81 @@ class ConfigList(MutableSequence):
         for idx, obj in enumerate(self._list):
             obj.linenum = idx
 
+    # This method is on ConfigList()
+    @ logger.catch(reraise=True)
+    def bulk_delete(self, objs=None, recurse=True):
+        """Delete all config objects in `objs` with one pass over the list, and reassign line numbers in the same pass.  If `recurse` is True, all children (children, grand children, etc...) of each object are also deleted.  Return the number of deleted objects.
+
+        Deleting one object at a time is O(N) per object; deleting 20k ACL entries with one call is O(N) in total."""
+        if objs is None:
+            objs = []
+
+        # Mark the victims by id(), walking each subtree once...
+        victims = set()
+        stack = list(objs)
+        while stack:
+            obj = stack.pop()
+            if id(obj) in victims:
+                continue
+            victims.add(id(obj))
+            if recurse is True:
+                stack.extend(obj.children)
+
+        if self.debug >= 1:
+            logger.debug(f"ConfigList().bulk_delete(recurse={recurse}) marked {len(victims)} objects")
+
+        # Compact the list and reassign line numbers...
+        kept = []
+        append = kept.append
+        for obj in self._list:
+            if id(obj) not in victims:
+                obj.linenum = len(kept)
+                append(obj)
+        deleted = len(self._list) - len(kept)
+        self._list[:] = kept
+        return deleted
+
+    # This method is on ConfigList()
+    @ logger.catch(reraise=True)
+    def bulk_re_sub(self, objs, regex, replacergx, ignore_rgx=None):
+        """Apply one compiled ``re.sub(regex, replacergx)`` to the text of all config objects in `objs`; objects whose text matches `ignore_rgx` are skipped.  Return a list with the new text of each object, in the same order as `objs` (None for objects whose new text is blank; they are deleted, as with :func:`~models_cisco.IOSCfgLine.re_sub`).
+
+        Only objects whose text actually changed pay for the line_id, comment and keyword index updates; all blank objects are deleted with one :func:`~ciscoconfparse.ConfigList.bulk_delete` call."""
+        regex_re = re.compile(regex)
+        ignore_re = None
+        if ignore_rgx:
+            ignore_re = re.compile(ignore_rgx)
+
+        retval = []
+        delete_these = []
+        for obj in objs:
+            text = obj._text
+            if ignore_re is not None and ignore_re.search(text):
+                retval.append(text)
+                continue
+
+            newtext = regex_re.sub(replacergx, text)
+            if newtext.strip() == "":
+                delete_these.append(obj)
+                retval.append(None)
+                continue
+
+            if newtext == text:
+                # Skip the line_id and comment work for unchanged text...
+                retval.append(text)
+                continue
+
+            obj._text = newtext
+            obj.line_id = obj.calculate_line_id()
+            if obj.parent is not None:
+                obj.parent._child_keyword_cache = None
+            obj.set_comment_bool()
+            retval.append(newtext)
+
+        if len(delete_these) > 0:
+            self.bulk_delete(delete_these, recurse=True)
+        return retval
+
     # This method is on ConfigList()
     @ property
     @ logger.catch(reraise=True)
@@ -2315,9 +2315,9 @@ class BaseIOSRouteLine(BaseCfgLine):
     def network_object(self):
         try:
             if self._address_family == "ip":
-                return IPv4Obj("%s/%s" % (self.network, self.netmask), strict=False)
+                return IPv4Obj.from_parts(self.network, self.netmask)
             elif self._address_family == "ipv6":
-                return IPv6Obj("%s/%s" % (self.network, self.masklen))
+                return IPv6Obj.from_parts(self.network, self.masklen)
         except BaseException:
             logger.critical("Found _address_family = '{}''".format(self._address_family))
             return None
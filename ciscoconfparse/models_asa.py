@@ -38,6 +38,7 @@ import ipaddress
 from ciscoconfparse.protocol_values import ASA_IP_PROTOCOLS
 from ciscoconfparse.ccp_util import L4Object
 from ciscoconfparse.ccp_util import IPv4Obj, IPv6Obj
+from ciscoconfparse.ccp_util import IPAddressSpace
 
 from ciscoconfparse.ccp_abc import BaseCfgLine
 
@@ -765,6 +766,15 @@ class ASAObjGroupNetwork(ASACfgLine):
 
         return retval
 
+    @property
+    @logger.catch(reraise=True)
+    def address_space(self):
+        """Return an :class:`~ciscoconfparse.ccp_util.IPAddressSpace` which
+        represents the merged address space allowed by this object-group.
+        Use ``address_space.collapse()`` for the minimal covering prefixes and
+        ``address_space.coverage()`` for address counts."""
+        return IPAddressSpace(self.network_strings)
+
 
 ##
 ##-------------  ASA object-group service
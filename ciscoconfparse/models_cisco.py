@@ -1392,7 +1392,7 @@ class BaseIOSIntfLine(IOSCfgLine):
         elif retval["v4addr"] == "negotiated":
             return self.default_ipv4_addr_object
         else:
-            return IPv4Obj(f"{retval['v4addr']}/{retval['v4netmask']}")
+            return IPv4Obj.from_parts(retval["v4addr"], retval["v4netmask"])
 
     # This method is on BaseIOSIntfLine()
     @property
@@ -1413,7 +1413,7 @@ class BaseIOSIntfLine(IOSCfgLine):
         elif retval["v6addr"] == "negotiated":
             return self.default_ipv6_addr_object
         else:
-            return IPv6Obj(f"{retval['v6addr']}/{retval['v6masklength']}")
+            return IPv6Obj.from_parts(retval["v6addr"], retval["v6masklength"])
 
     # This method is on BaseIOSIntfLine()
     @property
@@ -3063,9 +3063,9 @@ class IOSRouteLine(IOSCfgLine):
     def network_object(self):
         try:
             if self._address_family == "ip":
-                return IPv4Obj("%s/%s" % (self.network, self.netmask), strict=False)
+                return IPv4Obj.from_parts(self.network, self.netmask)
             elif self._address_family == "ipv6":
-                return IPv6Obj("%s/%s" % (self.network, self.masklen))
+                return IPv6Obj.from_parts(self.network, self.masklen)
         except BaseException:
             logger.critical("Found _address_family = '{}''".format(self._address_family))
             return None
@@ -0,0 +1,19 @@
+r"""benchmarks - Repeatable ciscoconfparse benchmarks with JSON results
+
+Run the benchmarks from the dev_tools directory, and compare the results
+of two commits...
+
+    $ cd dev_tools
+    $ python -m benchmarks run --sizes 1000 10000 --output before.json
+    $ git checkout my_branch
+    $ python -m benchmarks run --sizes 1000 10000 --output after.json
+    $ python -m benchmarks compare before.json after.json --threshold 0.10
+
+`compare` exits non-zero if any benchmark is slower than the baseline by
+more than `--threshold`.
+
+`generate` writes seeded synthetic configs for any supported syntax (and
+before / after pairs for HDiff); see benchmarks.generator.ConfigGenerator...
+
+    $ python -m benchmarks generate --syntax junos --lines 100000 -o big.junos
+"""
@@ -0,0 +1,169 @@
+import argparse
+import sys
+
+from loguru import logger
+
+from benchmarks.inputs import REPO_DIR
+from benchmarks.cases import BENCHMARKS, DEFAULT_SIZES
+from benchmarks.generator import ConfigGenerator, SYNTAXES
+from benchmarks.runner import run_benchmarks, compare_results, load_results, write_results
+
+
+def parse_cli_args(sys_argv1):
+    """
+    Reference: https://docs.python.org/3/library/argparse.html
+    """
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks",
+        description="Run ciscoconfparse benchmarks, or compare two benchmark result files",
+        add_help=True,
+    )
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    parser_run = subparsers.add_parser("run", help="Run the benchmarks and write JSON results")
+    parser_run.add_argument(
+        "-s",
+        "--sizes",
+        nargs="+",
+        type=int,
+        default=list(DEFAULT_SIZES),
+        help="Config sizes (lines) to benchmark; default: %(default)s",
+    )
+    parser_run.add_argument(
+        "-b",
+        "--benchmarks",
+        nargs="+",
+        default=None,
+        help="Only run benchmarks matching these fnmatch patterns, such as 'parse_*'",
+    )
+    parser_run.add_argument(
+        "-r",
+        "--repeat",
+        type=int,
+        default=3,
+        help="Time each benchmark this many times and keep the fastest; default: %(default)s",
+    )
+    parser_run.add_argument(
+        "-o",
+        "--output",
+        default="-",
+        help="Write JSON results to this file; default: stdout",
+    )
+    parser_run.add_argument(
+        "--repo",
+        default=str(REPO_DIR),
+        help="Benchmark the ciscoconfparse package in this git checkout (such as a worktree of the baseline commit); the inputs always come from this checkout.  Default: %(default)s",
+    )
+    parser_run.add_argument(
+        "-l",
+        "--list",
+        default=False,
+        action="store_true",
+        help="List the benchmark names and exit",
+    )
+
+    parser_generate = subparsers.add_parser("generate", help="Write a synthetic config, or a before / after pair of configs")
+    parser_generate.add_argument(
+        "--syntax",
+        choices=SYNTAXES,
+        default="ios",
+        help="Config syntax; default: %(default)s",
+    )
+    parser_generate.add_argument(
+        "-n",
+        "--lines",
+        type=int,
+        default=10000,
+        help="Approximate number of config lines; default: %(default)s",
+    )
+    parser_generate.add_argument(
+        "--seed",
+        type=int,
+        default=0,
+        help="Random seed; the same seed always builds the same config.  Default: %(default)s",
+    )
+    parser_generate.add_argument(
+        "--diff-pair",
+        default=None,
+        metavar="AFTER_FILENAME",
+        help="Also write a changed copy of the config to AFTER_FILENAME, for HDiff() tests",
+    )
+    parser_generate.add_argument(
+        "--change-ratio",
+        type=float,
+        default=0.02,
+        help="Fraction of families changed in the --diff-pair config; default: %(default)s",
+    )
+    parser_generate.add_argument(
+        "-o",
+        "--output",
+        default="-",
+        help="Write the config to this file; default: stdout",
+    )
+
+    parser_compare = subparsers.add_parser("compare", help="Compare two JSON result files")
+    parser_compare.add_argument("baseline", help="JSON results from the baseline commit")
+    parser_compare.add_argument("current", help="JSON results from the commit under test")
+    parser_compare.add_argument(
+        "-t",
+        "--threshold",
+        type=float,
+        default=0.10,
+        help="Fail if a benchmark is this fraction slower than the baseline; default: %(default)s",
+    )
+
+    return parser.parse_args(sys_argv1)
+
+
+def main(sys_argv1):
+    args = parse_cli_args(sys_argv1)
+
+    if args.command == "run":
+        # Benchmark the ciscoconfparse in args.repo, not an installed copy...
+        sys.path.insert(0, args.repo)
+        # Import ciscoconfparse before logger.remove(); the import adds
+        #     a loguru sink
+        import ciscoconfparse
+        logger.remove()
+
+        if args.list is True:
+            for name, _, max_size in BENCHMARKS:
+                print(f"{name:<32} max size {max_size}")
+            return 0
+
+        def log(message):
+            print(message, file=sys.stderr)
+
+        results = run_benchmarks(args.sizes, names=args.benchmarks, repeat=args.repeat, repo_dir=args.repo, log=log)
+        write_results(results, args.output)
+        return 0
+
+    if args.command == "generate":
+        generator = ConfigGenerator(args.syntax, seed=args.seed)
+        if args.diff_pair is None:
+            configs = [(args.output, generator.lines(args.lines))]
+        else:
+            before, after = generator.diff_pair(args.lines, change_ratio=args.change_ratio)
+            configs = [(args.output, before), (args.diff_pair, after)]
+        for filename, config in configs:
+            if filename == "-":
+                sys.stdout.write("\n".join(config) + "\n")
+                continue
+            with open(filename, "w", encoding="utf-8") as fh:
+                fh.write("\n".join(config) + "\n")
+        return 0
+
+    rows, regressions = compare_results(
+        load_results(args.baseline), load_results(args.current), threshold=args.threshold
+    )
+    for name, size, before, after, ratio in rows:
+        flag = "REGRESSION" if ratio > 1.0 + args.threshold else ""
+        print(f"{name:<32} {size:>9} {before:>10.4f} -> {after:>10.4f} sec {ratio:>7.2f}x {flag}")
+    if regressions:
+        print(f"{len(regressions)} benchmarks regressed more than {args.threshold:.0%}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
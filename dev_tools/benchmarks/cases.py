@@ -0,0 +1,443 @@
+from benchmarks.generator import ConfigGenerator
+from benchmarks.inputs import scaled_config, changed_config
+
+# Sizes are config lines; find_* queries run against a config of that size,
+#     and CiscoRange / IPv4Obj benchmarks build size // 10 objects
+DEFAULT_SIZES = (1000, 10000, 100000)
+
+PARSE_SYNTAXES = ("ios", "nxos", "iosxr", "asa", "junos")
+
+# HDiff() only builds diffs for these syntaxes
+HDIFF_SYNTAXES = ("ios", "nxos")
+
+
+def _parse_setup(syntax, factory):
+    def setup(size):
+        from ciscoconfparse import CiscoConfParse
+
+        config = ConfigGenerator(syntax).lines(size)
+
+        def run():
+            CiscoConfParse(config, syntax=syntax, factory=factory)
+
+        return run, len(config)
+
+    return setup
+
+
+def _query_setup(method, *args, **kwargs):
+    def setup(size):
+        from ciscoconfparse import CiscoConfParse
+
+        config = scaled_config(size)
+        parse = CiscoConfParse(config)
+        query = getattr(parse, method)
+
+        def run():
+            query(*args, **kwargs)
+
+        return run, len(config)
+
+    return setup
+
+
+def _re_match_iter_typed_setup(size):
+    from ciscoconfparse import CiscoConfParse
+
+    config = scaled_config(size)
+    intf_objs = CiscoConfParse(config).find_objects(r"^interface")
+
+    def run():
+        for obj in intf_objs:
+            obj.re_match_iter_typed(r"^\s+switchport\s+access\s+vlan\s+(\d+)", result_type=int, default=0)
+
+    return run, len(config)
+
+
+def _hdiff_setup(syntax):
+    def setup(size):
+        from ciscoconfparse import HDiff
+
+        before_config, after_config = ConfigGenerator(syntax).diff_pair(size, change_ratio=0.02)
+
+        def run():
+            HDiff(before_config, after_config, syntax=syntax).unified_diffs()
+
+        return run, len(before_config)
+
+    return setup
+
+
+def _sync_diff_setup(size):
+    from ciscoconfparse import CiscoConfParse
+
+    before_config = scaled_config(size)
+    after_config = changed_config(before_config)
+    parse = CiscoConfParse(before_config)
+
+    def run():
+        parse.sync_diff(after_config, r"switchport", r"switchport.*")
+
+    return run, len(before_config)
+
+
+def _commit_setup(size):
+    from ciscoconfparse import CiscoConfParse
+
+    config = scaled_config(size)
+
+    # Each run() commits the same one-line change to a fresh parse; a
+    #     shared parse would grow on every call
+    def prepare():
+        parse = CiscoConfParse(config)
+        parse.ConfigObjs[-1].append_to_family(" description benchmark")
+        return parse
+
+    def run(parse):
+        parse.commit()
+
+    return run, len(config), prepare
+
+
+def _mutate_setup(method, *args, **kwargs):
+    """Time a CiscoConfParse() method which changes the config; each call gets a fresh parse of the same generated ios config"""
+    def setup(size):
+        from ciscoconfparse import CiscoConfParse
+
+        config = ConfigGenerator("ios").lines(size)
+
+        def prepare():
+            return CiscoConfParse(config)
+
+        def run(parse):
+            getattr(parse, method)(*args, **kwargs)
+
+        return run, len(config), prepare
+
+    return setup
+
+
+def _delete_objects_setup(size):
+    from ciscoconfparse import CiscoConfParse
+
+    config = ConfigGenerator("ios").lines(size)
+
+    def prepare():
+        parse = CiscoConfParse(config)
+        return parse, parse.find_objects(r"^\s+deny")
+
+    def run(parse_objs):
+        parse, objs = parse_objs
+        parse.delete_objects(objs)
+
+    return run, len(config), prepare
+
+
+def _re_sub_objects_setup(size):
+    from ciscoconfparse import CiscoConfParse
+
+    config = ConfigGenerator("ios").lines(size)
+
+    def prepare():
+        parse = CiscoConfParse(config)
+        return parse, parse.find_objects(r"service-policy")
+
+    def run(parse_objs):
+        parse, objs = parse_objs
+        parse.re_sub_objects(objs, r"CUST_IN_", "CUSTOMER_IN_")
+
+    return run, len(config), prepare
+
+
+def _generated_query_setup(method, *args, **kwargs):
+    """Time a read-only CiscoConfParse() query against a generated ios config"""
+    def setup(size):
+        from ciscoconfparse import CiscoConfParse
+
+        config = ConfigGenerator("ios").lines(size)
+        query = getattr(CiscoConfParse(config), method)
+
+        def run():
+            query(*args, **kwargs)
+
+        return run, len(config)
+
+    return setup
+
+
+def _chained_parent_queries_setup(size):
+    """Three find_parent_objects() calls and set logic; compare with the query benchmark"""
+    from ciscoconfparse import CiscoConfParse
+
+    config = ConfigGenerator("ios").lines(size)
+    parse = CiscoConfParse(config)
+
+    def run():
+        helpers = set(parse.find_parent_objects(r"^interface", r"^\s+ip\s+helper-address"))
+        redirects = set(parse.find_parent_objects(r"^interface", r"^\s+no\s+ip\s+redirects"))
+        up = set(parse.find_parent_objects(r"^interface", r"^\s+no\s+shutdown"))
+        sorted((helpers - redirects) & up)
+
+    return run, len(config)
+
+
+def _has_child_with_setup(size):
+    from ciscoconfparse import CiscoConfParse
+
+    config = ConfigGenerator("ios").lines(size)
+    intf_objs = CiscoConfParse(config).find_objects(r"^interface")
+
+    def run():
+        for obj in intf_objs:
+            obj.has_child_with(r"^\s+no\s+shutdown")
+
+    return run, len(config)
+
+
+def _configlist_attr_setup(attr):
+    """Read a ConfigList() attribute `size` times; some attributes are delegated to CiscoConfParse()"""
+    def setup(size):
+        from ciscoconfparse import CiscoConfParse
+
+        objs = CiscoConfParse(ConfigGenerator("ios").lines(100)).ConfigObjs
+        calls = range(size)
+
+        def run():
+            for _ in calls:
+                getattr(objs, attr)
+
+        return run, size
+
+    return setup
+
+
+def _junos_setup(size):
+    from ciscoconfparse.ciscoconfparse import convert_junos_to_ios
+
+    config = ConfigGenerator("junos").lines(size)
+
+    def run():
+        convert_junos_to_ios(config, comment_delimiter="#")
+
+    return run, len(config)
+
+
+def _object_branches_setup(regex_groups):
+    def setup(size):
+        from ciscoconfparse import CiscoConfParse
+
+        config = ConfigGenerator("junos").lines(size)
+        parse = CiscoConfParse(config, syntax="junos", comment="#")
+        branchspec = (r"^interfaces", r"^\s+(\S+)", r"(unit\s+\d+)", r"family\s+(inet)", r"address\s+(\S+)")
+
+        def run():
+            parse.find_object_branches(branchspec, regex_groups=regex_groups)
+
+        return run, len(config)
+
+    return setup
+
+
+def _hdiff_ordered_setup(size):
+    from ciscoconfparse import HDiff
+
+    before_config, after_config = ConfigGenerator("ios").diff_pair(size, change_ratio=0.02)
+
+    def run():
+        HDiff(before_config, after_config, syntax="ios", ordered_diff=True).all_output_dicts
+
+    return run, len(before_config)
+
+
+def _myers_matches_setup(size):
+    from ciscoconfparse.ciscoconfparse import _myers_matches
+
+    before_config, after_config = ConfigGenerator("ios").diff_pair(size, change_ratio=0.02)
+
+    def run():
+        _myers_matches(before_config, after_config)
+
+    return run, len(before_config)
+
+
+def _hdiff_template_setup(size):
+    """Diff one prepared after config against a fleet of before configs"""
+    from ciscoconfparse import HDiff
+
+    num_devices = 4
+    before_config, after_config = ConfigGenerator("ios").diff_pair(size, change_ratio=0.02)
+    template = HDiff.prepare_after(after_config, syntax="ios")
+    fleet = {f"rtr{ii}": before_config for ii in range(num_devices)}
+
+    def run():
+        template.diff_many(fleet, output_format="unified")
+
+    return run, num_devices * len(before_config)
+
+
+def _hdiff_family_diffs_setup(size):
+    from ciscoconfparse import HDiff
+
+    before_config, after_config = ConfigGenerator("ios").diff_pair(size, change_ratio=0.02)
+
+    def run():
+        HDiff.family_diffs(before_config, after_config, syntax="ios")
+
+    return run, len(before_config)
+
+
+def _req_cfgspec_setup(method):
+    """req_cfgspec_*() are deprecated, but they are still timed until they are removed"""
+    def setup(size):
+        from ciscoconfparse import CiscoConfParse
+
+        config = ConfigGenerator("ios").lines(size)
+        query = getattr(CiscoConfParse(config), method)
+        # Keep every other top-level line, and add new vlans...
+        cfgspec = [line for line in config if line[:1] not in (" ", "!")][::2]
+        cfgspec.extend(f"vlan {4000 + ii % 90}" for ii in range(max(size // 100, 1)))
+        if method == "req_cfgspec_excl_diff":
+            args = (r"^vlan\s", r"^vlan\s+\d+", cfgspec)
+        else:
+            args = (cfgspec,)
+
+        def run():
+            query(*args)
+
+        return run, len(config)
+
+    return setup
+
+
+def _ip_object_setup(builder, intern_cache=0):
+    """Build size // 10 IPv4Obj() / IPv6Obj() instances with the callable returned by `builder()`; run() enables a fresh intern cache of `intern_cache` strings, and disables it afterwards"""
+    def setup(size):
+        from ciscoconfparse.ccp_util import configure_ip_intern_cache
+
+        num_objects = max(size // 10, 1)
+        build = builder()
+        calls = range(num_objects)
+
+        def run():
+            configure_ip_intern_cache(intern_cache)
+            for ii in calls:
+                build(ii)
+            configure_ip_intern_cache(0)
+
+        return run, num_objects
+
+    return setup
+
+
+def _ipv4obj_interned():
+    from ciscoconfparse.ccp_util import IPv4Obj
+    addrs = [f"10.0.{ii % 256}.1/24" for ii in range(512)]
+    return lambda ii: IPv4Obj(addrs[ii % 512])
+
+
+def _ipv4obj_from_int():
+    from ciscoconfparse.ccp_util import IPv4Obj
+    return lambda ii: IPv4Obj.from_int(167772160 + ii, 24)
+
+
+def _ipv6obj():
+    from ciscoconfparse.ccp_util import IPv6Obj
+    return lambda ii: IPv6Obj(f"2001:db8::{ii % 65536:x}/64")
+
+
+def _ipv6obj_from_int():
+    from ciscoconfparse.ccp_util import IPv6Obj
+    return lambda ii: IPv6Obj.from_int(42540766411282592856903984951653826560 + ii, 64)
+
+
+def _collapse_addresses_setup(size):
+    from ipaddress import IPv4Network
+    from ciscoconfparse.ccp_util import collapse_addresses
+
+    num_objects = max(size // 10, 1)
+    nets = [IPv4Network(((0x0A000000 + 256 * ii * 3) % 2**32, 24)) for ii in range(num_objects)]
+
+    def run():
+        list(collapse_addresses(nets))
+
+    return run, num_objects
+
+
+def _cisco_range_setup(size):
+    from ciscoconfparse.ccp_util import CiscoRange
+
+    num_objects = max(size // 10, 1)
+
+    def run():
+        for ii in range(num_objects):
+            CiscoRange(f"Ethernet{ii % 8}/1-{ii % 48 + 1}")
+
+    return run, num_objects
+
+
+def _ipv4obj_setup(size):
+    from ciscoconfparse.ccp_util import IPv4Obj
+
+    num_objects = max(size // 10, 1)
+    addrs = [f"10.{(ii // 65536) % 256}.{(ii // 256) % 256}.{ii % 256}/24" for ii in range(num_objects)]
+
+    def run():
+        for addr in addrs:
+            IPv4Obj(addr)
+
+    return run, num_objects
+
+
+# Each benchmark is (name, setup function, maximum size).  setup(size)
+#     returns (a zero-argument callable to time, the number of lines or
+#     objects it processes); sizes above the maximum are skipped.  setup()
+#     may return a third item, prepare(); then prepare() builds a new input
+#     outside of the timer, and the timed call is run(prepare())
+BENCHMARKS = []
+for _syntax in PARSE_SYNTAXES:
+    BENCHMARKS.append((f"parse_{_syntax}", _parse_setup(_syntax, False), 1000000))
+    BENCHMARKS.append((f"parse_{_syntax}_factory", _parse_setup(_syntax, True), 100000))
+
+for _syntax in HDIFF_SYNTAXES:
+    BENCHMARKS.append((f"hdiff_{_syntax}", _hdiff_setup(_syntax), 100000))
+
+BENCHMARKS.extend([
+    ("hdiff_ordered_ios", _hdiff_ordered_setup, 100000),
+    ("hdiff_template_ios", _hdiff_template_setup, 100000),
+    ("hdiff_family_diffs_ios", _hdiff_family_diffs_setup, 100000),
+    ("myers_matches", _myers_matches_setup, 100000),
+])
+
+BENCHMARKS.extend([
+    ("find_objects", _query_setup("find_objects", r"^interface\s+Vlan"), 1000000),
+    ("find_parent_objects", _query_setup("find_parent_objects", r"^interface", r"^\s+switchport\s+mode\s+trunk"), 1000000),
+    ("find_child_objects", _query_setup("find_child_objects", r"^interface", r"^\s+switchport\s+access\s+vlan"), 1000000),
+    ("find_parent_objects_wo_child", _query_setup("find_parent_objects_wo_child", r"^interface", r"^\s+spanning-tree"), 1000000),
+    ("re_match_iter_typed", _re_match_iter_typed_setup, 1000000),
+    ("find_objects_w_child", _generated_query_setup("find_objects_w_child", r"^interface", r"^\s+no\s+shutdown"), 1000000),
+    ("find_objects_w_all_children", _generated_query_setup("find_objects_w_all_children", r"^interface", [r"^\s+no\s+shutdown", r"^\s+ip\s+helper-address"]), 1000000),
+    ("has_child_with", _has_child_with_setup, 1000000),
+    ("find_parent_objects_x3", _chained_parent_queries_setup, 1000000),
+    ("query", _generated_query_setup("query", parentspec=r"^interface", required=[r"^\s+no\s+shutdown"], forbidden=[r"^\s+no\s+ip\s+redirects"], optional={"helper": r"^\s+ip\s+helper-address\s+(\S+)"}), 1000000),
+    ("find_object_branches", _object_branches_setup(False), 1000000),
+    ("find_object_branches_groups", _object_branches_setup(True), 1000000),
+    ("convert_junos_to_ios", _junos_setup, 1000000),
+    ("req_cfgspec_all_diff", _req_cfgspec_setup("req_cfgspec_all_diff"), 100000),
+    ("req_cfgspec_excl_diff", _req_cfgspec_setup("req_cfgspec_excl_diff"), 100000),
+    ("delete_lines", _mutate_setup("delete_lines", r"^\s+deny"), 100000),
+    ("delete_objects", _delete_objects_setup, 100000),
+    ("replace_lines", _mutate_setup("replace_lines", r"permit", "allow"), 100000),
+    ("replace_all_children", _mutate_setup("replace_all_children", r"^interface", r"CUST_IN_", "CUSTOMER_IN_"), 100000),
+    ("re_sub_objects", _re_sub_objects_setup, 100000),
+    ("configlist_attr", _configlist_attr_setup("syntax"), 1000000),
+    ("configlist_attr_delegated", _configlist_attr_setup("finished_config_parse"), 1000000),
+    ("sync_diff", _sync_diff_setup, 100000),
+    ("commit", _commit_setup, 100000),
+    ("cisco_range", _cisco_range_setup, 1000000),
+    ("ipv4obj", _ipv4obj_setup, 1000000),
+    ("ipv4obj_interned", _ip_object_setup(_ipv4obj_interned, intern_cache=4096), 1000000),
+    ("ipv4obj_from_int", _ip_object_setup(_ipv4obj_from_int), 1000000),
+    ("ipv6obj", _ip_object_setup(_ipv6obj), 1000000),
+    ("ipv6obj_from_int", _ip_object_setup(_ipv6obj_from_int), 1000000),
+    ("collapse_addresses", _collapse_addresses_setup, 1000000),
+])
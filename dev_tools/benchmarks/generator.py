@@ -0,0 +1,673 @@
+import random
+import re
+
+# Each syntax is a list of (section name, weight); the weights split the
+#     target line count between sections
+SECTIONS = {
+    "ios": [
+        ("ios_banner", 0.0),
+        ("ios_vlan", 0.06),
+        ("ios_svi", 0.14),
+        ("ios_subinterface", 0.16),
+        ("ios_acl", 0.22),
+        ("ios_object_group", 0.08),
+        ("ios_route_map", 0.08),
+        ("ios_policy_map", 0.08),
+        ("ios_macro", 0.02),
+        ("ios_bgp", 0.16),
+    ],
+    "nxos": [
+        ("nxos_banner", 0.0),
+        ("nxos_vlan", 0.06),
+        ("nxos_svi", 0.16),
+        ("nxos_ethernet", 0.16),
+        ("nxos_acl", 0.22),
+        ("nxos_object_group", 0.08),
+        ("nxos_route_map", 0.08),
+        ("nxos_policy_map", 0.08),
+        ("nxos_bgp", 0.16),
+    ],
+    "iosxr": [
+        ("iosxr_banner", 0.0),
+        ("iosxr_subinterface", 0.28),
+        ("iosxr_acl", 0.24),
+        ("iosxr_prefix_set", 0.08),
+        ("iosxr_route_policy", 0.12),
+        ("iosxr_policy_map", 0.10),
+        ("iosxr_bgp", 0.18),
+    ],
+    "asa": [
+        ("asa_banner", 0.0),
+        ("asa_name", 0.04),
+        ("asa_subinterface", 0.14),
+        ("asa_object", 0.14),
+        ("asa_object_group", 0.18),
+        ("asa_acl", 0.34),
+        ("asa_policy_map", 0.08),
+        ("asa_tunnel_group", 0.08),
+    ],
+    "junos": [
+        ("junos_system", 0.0),
+        ("junos_interfaces", 0.30),
+        ("junos_vlans", 0.08),
+        ("junos_firewall", 0.22),
+        ("junos_policy_options", 0.20),
+        ("junos_bgp", 0.20),
+    ],
+}
+
+SYNTAXES = tuple(SECTIONS)
+
+# Sections which are limited by the platform (i.e. 4094 vlans) stop at
+#     this many families, even for very large configs
+MAX_FAMILIES = {
+    "ios_vlan": 4000,
+    "ios_svi": 4000,
+    "nxos_vlan": 3900,
+    "nxos_svi": 3900,
+    "junos_vlans": 4000,
+}
+
+# junos families are wrapped in a top-level block
+JUNOS_WRAPPERS = {
+    "junos_interfaces": (["interfaces {"], ["}"]),
+    "junos_vlans": (["vlans {"], ["}"]),
+    "junos_firewall": (["firewall {", "    family inet {"], ["    }", "}"]),
+    "junos_policy_options": (["policy-options {"], ["}"]),
+    "junos_bgp": (["protocols {", "    bgp {"], ["    }", "}"]),
+}
+
+_NUMBER_RE = re.compile(r"\d+")
+
+
+class ConfigGenerator(object):
+    """Generate seeded, realistic configs for ios, nxos, iosxr, asa and junos.  The same `syntax` and `seed` always build the same config.
+
+    Examples
+    --------
+
+    >>> generator = ConfigGenerator("nxos", seed=1)
+    >>> config = generator.lines(100000)
+    >>> before, after = ConfigGenerator("ios", seed=1).diff_pair(10000, change_ratio=0.02)
+    """
+
+    def __init__(self, syntax="ios", seed=0):
+        if syntax not in SECTIONS:
+            raise ValueError(f"syntax must be one of {SYNTAXES}")
+        self.syntax = syntax
+        self.seed = seed
+
+    def __repr__(self):
+        return f"<ConfigGenerator syntax: {self.syntax} seed: {self.seed}>"
+
+    def families(self, num_lines):
+        """Return a list of sections for a config of about `num_lines` lines; each section is (section name, list of families), and each family is a list of lines"""
+        rng = random.Random(self.seed)
+        retval = []
+        carry = 0
+        for name, weight in SECTIONS[self.syntax]:
+            build_family = getattr(self, "_" + name)
+            budget = int(num_lines * weight) + carry
+            max_families = MAX_FAMILIES.get(name, None)
+            families = []
+            section_lines = 0
+            idx = 0
+            # Weight 0.0 sections (banners, system) are built once...
+            while idx == 0 or section_lines < budget:
+                if max_families is not None and idx >= max_families:
+                    break
+                family = build_family(rng, idx)
+                families.append(family)
+                section_lines += len(family)
+                idx += 1
+            # Pass any unused budget from a capped section to the next one
+            carry = max(budget - section_lines, 0)
+            retval.append((name, families))
+        return retval
+
+    def lines(self, num_lines):
+        """Return a list of about `num_lines` config lines; families are never split, so the result may be slightly longer"""
+        return self.render(self.families(num_lines))
+
+    def render(self, sections):
+        """Return config lines for `sections` from families()"""
+        retval = []
+        for name, families in sections:
+            header, footer = JUNOS_WRAPPERS.get(name, ([], []))
+            retval.extend(header)
+            for family in families:
+                retval.extend(family)
+            retval.extend(footer)
+        if self.syntax != "junos":
+            retval.append("end")
+        return retval
+
+    def diff_pair(self, num_lines, change_ratio=0.02):
+        """Return (before, after) config lines for HDiff() benchmarks.  About `change_ratio` of the families in after are changed; a third of the changes modify a number in one child line, a third delete the family, and a third add a new family"""
+        rng = random.Random(self.seed + 1)
+        before = self.families(num_lines)
+        after = []
+        for name, families in before:
+            build_family = getattr(self, "_" + name)
+            changed = []
+            next_idx = len(families)
+            for family in families:
+                if rng.random() >= change_ratio:
+                    changed.append(family)
+                    continue
+                action = rng.randrange(3)
+                if action == 0:
+                    changed.append(self._modify_family(rng, family))
+                elif action == 1:
+                    # Delete the family...
+                    continue
+                else:
+                    changed.append(family)
+                    changed.append(build_family(rng, next_idx))
+                    next_idx += 1
+            after.append((name, changed))
+        return self.render(before), self.render(after)
+
+    def _modify_family(self, rng, family):
+        """Return a copy of `family` with one number changed in a child line"""
+        candidates = [idx for idx, line in enumerate(family) if idx > 0 and _NUMBER_RE.search(line)]
+        if not candidates:
+            return list(family)
+        retval = list(family)
+        idx = rng.choice(candidates)
+        retval[idx] = _NUMBER_RE.sub(lambda mm: str(int(mm.group(0)) + 1), retval[idx], count=1)
+        return retval
+
+    ##########################################################################
+    # ios
+    ##########################################################################
+
+    def _ios_banner(self, rng, idx):
+        return [
+            "hostname synthetic-ios",
+            "!",
+            "banner motd ^C",
+            "  Authorized access only.",
+            "  This device is monitored; disconnect now if you are not",
+            "  an authorized user.",
+            "^C",
+            "!",
+        ]
+
+    def _ios_vlan(self, rng, idx):
+        vlan = idx % 4000 + 2
+        return [f"vlan {vlan}", f" name VLAN_{vlan:04d}", "!"]
+
+    def _ios_svi(self, rng, idx):
+        vlan = idx % 4000 + 2
+        retval = [
+            f"interface Vlan{vlan}",
+            f" description SVI for vlan {vlan} site {idx // 4000}",
+        ]
+        if rng.random() < 0.4:
+            retval.append(f" vrf forwarding VRF_{idx % 32}")
+        retval.extend([
+            f" ip address {_ipv4(idx, 1)} 255.255.255.0",
+            f" ip helper-address 10.255.{idx % 4}.10",
+            f" standby {vlan % 255} ip {_ipv4(idx, 254)}",
+            f" standby {vlan % 255} priority {rng.choice([90, 110])}",
+            " no ip redirects",
+            " no shutdown",
+            "!",
+        ])
+        return retval
+
+    def _ios_subinterface(self, rng, idx):
+        slot, unit = idx // 4000, idx % 4000 + 1
+        return [
+            f"interface GigabitEthernet0/{slot % 4}/{slot // 4}.{unit}",
+            f" description customer {idx} circuit {rng.randint(100000, 999999)}",
+            f" encapsulation dot1Q {unit}",
+            f" ip address {_ipv4(idx, 1, base=172)} 255.255.255.252",
+            f" service-policy input CUST_IN_{idx % 16}",
+            "!",
+        ]
+
+    def _ios_acl(self, rng, idx):
+        retval = [f"ip access-list extended ACL_{idx:05d}"]
+        for seq in range(rng.randint(50, 400)):
+            retval.append(
+                f" {rng.choice(['permit', 'permit', 'deny'])} {rng.choice(['tcp', 'udp'])} {_ipv4(seq, 0)} 0.0.0.255 host {_ipv4(idx, seq % 254 + 1)} eq {rng.choice([22, 53, 80, 443, 8443])}"
+            )
+        retval.append("!")
+        return retval
+
+    def _ios_object_group(self, rng, idx):
+        retval = [f"object-group network OG_{idx:05d}", f" description object group {idx}"]
+        for seq in range(rng.randint(20, 200)):
+            retval.append(f" host {_ipv4(idx, seq % 254 + 1)}")
+        retval.append("!")
+        return retval
+
+    def _ios_route_map(self, rng, idx):
+        retval = []
+        for seq in range(10, 10 * rng.randint(2, 6) + 1, 10):
+            retval.extend([
+                f"route-map RM_{idx:05d} {rng.choice(['permit', 'permit', 'deny'])} {seq}",
+                f" match ip address prefix-list PL_{idx}_{seq}",
+                f" set local-preference {rng.choice([80, 100, 120, 200])}",
+                f" set community 65000:{seq} additive",
+            ])
+        retval.append("!")
+        return retval
+
+    def _ios_policy_map(self, rng, idx):
+        retval = [f"policy-map CUST_IN_{idx:05d}"]
+        for cls in ("VOICE", "VIDEO", "CRITICAL", "class-default"):
+            retval.extend([
+                f" class {cls}",
+                f"  police cir {rng.randint(1, 100) * 1000000}",
+                "   conform-action transmit",
+                "   exceed-action drop",
+            ])
+        retval.append("!")
+        return retval
+
+    def _ios_macro(self, rng, idx):
+        return [
+            f"macro name ACCESS_PORT_{idx}",
+            " switchport mode access",
+            f" switchport access vlan {idx % 4000 + 2}",
+            " spanning-tree portfast",
+            "@",
+            "!",
+        ]
+
+    def _ios_bgp(self, rng, idx):
+        retval = []
+        if idx == 0:
+            retval.extend(["router bgp 65000", " bgp log-neighbor-changes"])
+        retval.extend([
+            f" neighbor {_ipv4(idx, 2, base=192)} remote-as {65100 + idx % 800}",
+            f" neighbor {_ipv4(idx, 2, base=192)} description peer {idx}",
+            f" address-family ipv4 vrf VRF_{idx}",
+            f"  neighbor {_ipv4(idx, 2, base=192)} activate",
+            f"  neighbor {_ipv4(idx, 2, base=192)} route-map RM_{idx:05d} in",
+            f"  network {_ipv4(idx, 0)} mask 255.255.255.0",
+            " exit-address-family",
+        ])
+        return retval
+
+    ##########################################################################
+    # nxos
+    ##########################################################################
+
+    def _nxos_banner(self, rng, idx):
+        return [
+            "hostname synthetic-nxos",
+            "feature bgp",
+            "feature interface-vlan",
+            "feature hsrp",
+            "banner motd #",
+            "Authorized access only.",
+            "#",
+        ]
+
+    def _nxos_vlan(self, rng, idx):
+        vlan = idx % 3900 + 2
+        return [f"vlan {vlan}", f"  name VLAN_{vlan:04d}"]
+
+    def _nxos_svi(self, rng, idx):
+        vlan = idx % 3900 + 2
+        return [
+            f"interface Vlan{vlan}",
+            f"  description SVI for vlan {vlan} site {idx // 3900}",
+            "  no shutdown",
+            f"  vrf member VRF_{idx % 32}",
+            "  no ip redirects",
+            f"  ip address {_ipv4(idx, 2)}/24",
+            f"  hsrp {vlan % 255}",
+            f"    priority {rng.choice([90, 110])}",
+            f"    ip {_ipv4(idx, 1)}",
+        ]
+
+    def _nxos_ethernet(self, rng, idx):
+        retval = [
+            f"interface Ethernet{idx // 48 + 1}/{idx % 48 + 1}",
+            f"  description server {idx} port {rng.randint(1, 4)}",
+        ]
+        if rng.random() < 0.5:
+            retval.extend([
+                "  switchport",
+                "  switchport mode trunk",
+                f"  switchport trunk allowed vlan {idx % 3900 + 2}-{idx % 3900 + 20}",
+            ])
+        else:
+            retval.extend([
+                "  switchport",
+                f"  switchport access vlan {idx % 3900 + 2}",
+                "  spanning-tree port type edge",
+            ])
+        retval.extend(["  mtu 9216", "  no shutdown"])
+        return retval
+
+    def _nxos_acl(self, rng, idx):
+        retval = [f"ip access-list ACL_{idx:05d}"]
+        for seq in range(rng.randint(50, 400)):
+            retval.append(
+                f"  {10 * (seq + 1)} {rng.choice(['permit', 'permit', 'deny'])} {rng.choice(['tcp', 'udp'])} {_ipv4(seq, 0)}/24 {_ipv4(idx, seq % 254 + 1)}/32 eq {rng.choice([22, 53, 80, 443, 8443])}"
+            )
+        return retval
+
+    def _nxos_object_group(self, rng, idx):
+        retval = [f"object-group ip address OG_{idx:05d}"]
+        for seq in range(rng.randint(20, 200)):
+            retval.append(f"  {10 * (seq + 1)} host {_ipv4(idx, seq % 254 + 1)}")
+        return retval
+
+    def _nxos_route_map(self, rng, idx):
+        retval = []
+        for seq in range(10, 10 * rng.randint(2, 6) + 1, 10):
+            retval.extend([
+                f"route-map RM_{idx:05d} {rng.choice(['permit', 'permit', 'deny'])} {seq}",
+                f"  match ip address prefix-list PL_{idx}_{seq}",
+                f"  set local-preference {rng.choice([80, 100, 120, 200])}",
+            ])
+        return retval
+
+    def _nxos_policy_map(self, rng, idx):
+        retval = [f"policy-map type qos CUST_IN_{idx:05d}"]
+        for cls in ("VOICE", "VIDEO", "CRITICAL", "class-default"):
+            retval.extend([
+                f"  class {cls}",
+                f"    set qos-group {rng.randint(1, 6)}",
+                f"    police cir {rng.randint(1, 100)} mbps bc 200 ms conform transmit violate drop",
+            ])
+        return retval
+
+    def _nxos_bgp(self, rng, idx):
+        retval = []
+        if idx == 0:
+            retval.extend(["router bgp 65000", "  log-neighbor-changes"])
+        retval.extend([
+            f"  vrf VRF_{idx}",
+            "    address-family ipv4 unicast",
+            f"      network {_ipv4(idx, 0)}/24",
+            f"    neighbor {_ipv4(idx, 2, base=192)}",
+            f"      remote-as {65100 + idx % 800}",
+            f"      description peer {idx}",
+            "      address-family ipv4 unicast",
+            f"        route-map RM_{idx:05d} in",
+            "        send-community both",
+        ])
+        return retval
+
+    ##########################################################################
+    # iosxr
+    ##########################################################################
+
+    def _iosxr_banner(self, rng, idx):
+        return [
+            "hostname synthetic-iosxr",
+            "banner motd ^",
+            "Authorized access only.",
+            "^",
+            "!",
+        ]
+
+    def _iosxr_subinterface(self, rng, idx):
+        slot, unit = idx // 4000, idx % 4000 + 1
+        return [
+            f"interface GigabitEthernet0/0/{slot % 8}/{slot // 8}.{unit}",
+            f" description customer {idx} circuit {rng.randint(100000, 999999)}",
+            f" vrf VRF_{idx % 32}",
+            f" ipv4 address {_ipv4(idx, 1, base=172)} 255.255.255.252",
+            f" encapsulation dot1q {unit}",
+            f" service-policy input CUST_IN_{idx % 16:05d}",
+            "!",
+        ]
+
+    def _iosxr_acl(self, rng, idx):
+        retval = [f"ipv4 access-list ACL_{idx:05d}"]
+        for seq in range(rng.randint(50, 400)):
+            retval.append(
+                f" {10 * (seq + 1)} {rng.choice(['permit', 'permit', 'deny'])} {rng.choice(['tcp', 'udp'])} {_ipv4(seq, 0)}/24 host {_ipv4(idx, seq % 254 + 1)} eq {rng.choice([22, 53, 80, 443, 8443])}"
+            )
+        retval.append("!")
+        return retval
+
+    def _iosxr_prefix_set(self, rng, idx):
+        entries = [f"  {_ipv4(idx * 7 + seq, 0)}/24 le 32" for seq in range(rng.randint(10, 80))]
+        return [f"prefix-set PS_{idx:05d}"] + [entry + "," for entry in entries[:-1]] + [entries[-1], "end-set", "!"]
+
+    def _iosxr_route_policy(self, rng, idx):
+        return [
+            f"route-policy RP_{idx:05d}",
+            f"  if destination in PS_{idx:05d} then",
+            f"    set local-preference {rng.choice([80, 100, 120, 200])}",
+            f"    set community (65000:{idx % 65535}) additive",
+            "    pass",
+            "  elseif as-path neighbor-is '65100' then",
+            "    drop",
+            "  else",
+            "    pass",
+            "  endif",
+            "end-policy",
+            "!",
+        ]
+
+    def _iosxr_policy_map(self, rng, idx):
+        retval = [f"policy-map CUST_IN_{idx:05d}"]
+        for cls in ("VOICE", "VIDEO", "CRITICAL", "class-default"):
+            retval.extend([
+                f" class {cls}",
+                f"  police rate {rng.randint(1, 100)} mbps",
+                "  !",
+                " !",
+            ])
+        retval.extend([" end-policy-map", "!"])
+        return retval
+
+    def _iosxr_bgp(self, rng, idx):
+        retval = []
+        if idx == 0:
+            retval.extend(["router bgp 65000", " bgp router-id 10.255.255.1"])
+        retval.extend([
+            f" vrf VRF_{idx}",
+            f"  rd 65000:{idx}",
+            "  address-family ipv4 unicast",
+            "   redistribute connected",
+            "  !",
+            f"  neighbor {_ipv4(idx, 2, base=192)}",
+            f"   remote-as {65100 + idx % 800}",
+            f"   description peer {idx}",
+            "   address-family ipv4 unicast",
+            f"    route-policy RP_{idx:05d} in",
+            "    route-policy PASS_ALL out",
+            "   !",
+            "  !",
+            " !",
+        ])
+        return retval
+
+    ##########################################################################
+    # asa
+    ##########################################################################
+
+    def _asa_banner(self, rng, idx):
+        return [
+            ": Saved",
+            "ASA Version 9.12(4)",
+            "!",
+            "hostname synthetic-asa",
+            "banner motd Authorized access only.",
+            "banner motd This device is monitored.",
+            "!",
+        ]
+
+    def _asa_name(self, rng, idx):
+        return [f"name {_ipv4(idx, 10)} HOST_{idx:05d} description host {idx}"]
+
+    def _asa_subinterface(self, rng, idx):
+        unit = idx % 4000 + 1
+        return [
+            f"interface GigabitEthernet0/{idx // 4000 % 8}.{unit}",
+            f" description segment {idx}",
+            f" vlan {unit}",
+            f" nameif SEG_{idx:05d}",
+            f" security-level {rng.choice([0, 50, 100])}",
+            f" ip address {_ipv4(idx, 1)} 255.255.255.0 standby {_ipv4(idx, 2)}",
+            "!",
+        ]
+
+    def _asa_object(self, rng, idx):
+        retval = [f"object network OBJ_{idx:05d}"]
+        if rng.random() < 0.5:
+            retval.append(f" host {_ipv4(idx, 10)}")
+        else:
+            retval.append(f" subnet {_ipv4(idx, 0)} 255.255.255.0")
+        retval.append(f" description object {idx}")
+        return retval
+
+    def _asa_object_group(self, rng, idx):
+        retval = [f"object-group network OG_{idx:05d}", f" description object group {idx}"]
+        for seq in range(rng.randint(20, 200)):
+            if seq % 5 == 0:
+                retval.append(f" network-object object OBJ_{(idx + seq) % 1000:05d}")
+            else:
+                retval.append(f" network-object host {_ipv4(idx, seq % 254 + 1)}")
+        return retval
+
+    def _asa_acl(self, rng, idx):
+        retval = []
+        for seq in range(rng.randint(50, 400)):
+            retval.append(
+                f"access-list ACL_{idx:05d} extended {rng.choice(['permit', 'permit', 'deny'])} {rng.choice(['tcp', 'udp'])} object-group OG_{seq % 100:05d} host {_ipv4(idx, seq % 254 + 1)} eq {rng.choice([22, 53, 80, 443, 8443])}"
+            )
+        return retval
+
+    def _asa_policy_map(self, rng, idx):
+        return [
+            f"policy-map POLICY_{idx:05d}",
+            " class inspection_default",
+            "  inspect dns preset_dns_map",
+            "  inspect ftp",
+            "  inspect icmp",
+            f" class CLASS_{idx:05d}",
+            f"  set connection conn-max {rng.randint(100, 10000)}",
+            "!",
+        ]
+
+    def _asa_tunnel_group(self, rng, idx):
+        return [
+            f"tunnel-group {_ipv4(idx, 5, base=198)} type ipsec-l2l",
+            f"tunnel-group {_ipv4(idx, 5, base=198)} general-attributes",
+            f" default-group-policy GP_{idx:05d}",
+            f"tunnel-group {_ipv4(idx, 5, base=198)} ipsec-attributes",
+            " ikev2 remote-authentication pre-shared-key *****",
+            " ikev2 local-authentication pre-shared-key *****",
+        ]
+
+    ##########################################################################
+    # junos
+    ##########################################################################
+
+    def _junos_system(self, rng, idx):
+        return [
+            "system {",
+            "    host-name synthetic-junos;",
+            "    login {",
+            '        message "Authorized access only.\\nThis device is monitored.";',
+            "    }",
+            "    services {",
+            "        ssh;",
+            "        netconf {",
+            "            ssh;",
+            "        }",
+            "    }",
+            "}",
+        ]
+
+    def _junos_interfaces(self, rng, idx):
+        retval = [
+            f"    ge-{idx // 480}/{idx // 48 % 10}/{idx % 48} {{",
+            f'        description "server {idx}";',
+            "        vlan-tagging;",
+        ]
+        for unit in range(rng.randint(1, 4)):
+            vlan = (idx * 4 + unit) % 4000 + 1
+            retval.extend([
+                f"        unit {vlan} {{",
+                f"            vlan-id {vlan};",
+                "            family inet {",
+                f"                address {_ipv4(idx * 4 + unit, 1)}/24;",
+                "            }",
+                "        }",
+            ])
+        retval.append("    }")
+        return retval
+
+    def _junos_vlans(self, rng, idx):
+        vlan = idx % 4000 + 2
+        return [
+            f"    VLAN_{idx:05d} {{",
+            f"        vlan-id {vlan};",
+            f"        l3-interface irb.{vlan};",
+            "    }",
+        ]
+
+    def _junos_firewall(self, rng, idx):
+        retval = [f"        filter FILTER_{idx:05d} {{"]
+        for term in range(rng.randint(10, 60)):
+            retval.extend([
+                f"            term T{term} {{",
+                "                from {",
+                f"                    source-address {_ipv4(term, 0)}/24;",
+                f"                    destination-address {_ipv4(idx, term % 254 + 1)}/32;",
+                f"                    protocol {rng.choice(['tcp', 'udp'])};",
+                f"                    destination-port {rng.choice([22, 53, 80, 443, 8443])};",
+                "                }",
+                f"                then {rng.choice(['accept', 'accept', 'discard'])};",
+                "            }",
+            ])
+        retval.append("        }")
+        return retval
+
+    def _junos_policy_options(self, rng, idx):
+        retval = [f"    prefix-list PL_{idx:05d} {{"]
+        for seq in range(rng.randint(5, 30)):
+            retval.append(f"        {_ipv4(idx * 7 + seq, 0)}/24;")
+        retval.extend([
+            "    }",
+            f"    policy-statement PS_{idx:05d} {{",
+            "        term MATCH {",
+            "            from {",
+            f"                prefix-list PL_{idx:05d};",
+            "            }",
+            "            then {",
+            f"                local-preference {rng.choice([80, 100, 120, 200])};",
+            f"                community add C_{idx % 64};",
+            "                accept;",
+            "            }",
+            "        }",
+            "        then reject;",
+            "    }",
+        ])
+        return retval
+
+    def _junos_bgp(self, rng, idx):
+        return [
+            f"        group PEERS_{idx:05d} {{",
+            "            type external;",
+            f"            import PS_{idx:05d};",
+            f"            peer-as {65100 + idx % 800};",
+            f"            neighbor {_ipv4(idx, 2, base=192)} {{",
+            f'                description "peer {idx}";',
+            "            }",
+            "        }",
+        ]
+
+
+def _ipv4(idx, host, base=10):
+    """Return a dotted-quad address for `idx` with `host` as the last octet; addresses repeat after 2**21 values of `idx`"""
+    return f"{base + (idx // 65536) % 32}.{(idx // 256) % 256}.{idx % 256}.{host}"
+
+
+def generate_config(syntax="ios", num_lines=10000, seed=0):
+    """Return a list of about `num_lines` config lines in `syntax`"""
+    return ConfigGenerator(syntax, seed=seed).lines(num_lines)
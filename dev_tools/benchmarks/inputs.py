@@ -0,0 +1,76 @@
+from contextlib import redirect_stdout
+from functools import lru_cache
+import random
+import runpy
+import pathlib
+import sys
+import io
+
+REPO_DIR = pathlib.Path(__file__).resolve().parent.parent.parent
+BUILD_BIG_CONFIG = REPO_DIR / "tests" / "fixtures" / "configs" / "build_big_config.py"
+
+# build_big_config.py styles: "1" is vlans, switchports and SVIs; "5" is
+#     large extended ACLs
+BUILD_BIG_CONFIG_STYLES = ("1", "5")
+
+
+@lru_cache(maxsize=8)
+def build_big_config(style="1", seed=0):
+    """Run tests/fixtures/configs/build_big_config.py with a seeded random module and return its config lines as a tuple"""
+    if style not in BUILD_BIG_CONFIG_STYLES:
+        raise ValueError(f"style must be one of {BUILD_BIG_CONFIG_STYLES}")
+
+    random.seed(seed)
+    saved_argv = sys.argv
+    output = io.StringIO()
+    try:
+        sys.argv = [str(BUILD_BIG_CONFIG), style]
+        with redirect_stdout(output):
+            runpy.run_path(str(BUILD_BIG_CONFIG), run_name="__main__")
+    finally:
+        sys.argv = saved_argv
+    return tuple(output.getvalue().splitlines())
+
+
+@lru_cache(maxsize=8)
+def interleaved_families(seed=0):
+    """Return the top-level families from all build_big_config.py styles, interleaved round-robin by their first two words (i.e. 'vlan', 'interface GigabitEthernet', 'ip access-list'), so any prefix of the result has a mix of family kinds"""
+    groups = {}
+    for style in BUILD_BIG_CONFIG_STYLES:
+        family = None
+        for line in build_big_config(style=style, seed=seed):
+            if line[:1] == " " and family is not None:
+                family.append(line)
+                continue
+            family = [line]
+            words = line.split()
+            kind = " ".join(words[:2]) if words[:1] in (["interface"], ["ip"]) else " ".join(words[:1])
+            groups.setdefault(kind, []).append(family)
+
+    retval = []
+    group_lists = [groups[kind] for kind in sorted(groups)]
+    for idx in range(max(len(group) for group in group_lists)):
+        for group in group_lists:
+            if idx < len(group):
+                retval.append(tuple(group[idx]))
+    return tuple(retval)
+
+
+def scaled_config(num_lines, seed=0):
+    """Return a list of at least `num_lines` IOS-style config lines built from the build_big_config.py output; the families are repeated as needed and never split"""
+    families = interleaved_families(seed=seed)
+    retval = []
+    idx = 0
+    while len(retval) < num_lines:
+        retval.extend(families[idx % len(families)])
+        idx += 1
+    return retval
+
+
+def changed_config(config, every=50):
+    """Return a copy of `config` with every `every`-th child line changed; use it as the after config for sync_diff() benchmarks"""
+    retval = list(config)
+    for idx in range(0, len(retval), every):
+        if retval[idx][:1] == " ":
+            retval[idx] = retval[idx] + " changed"
+    return retval
@@ -0,0 +1,154 @@
+from statistics import median
+from time import perf_counter
+import subprocess
+import datetime
+import platform
+import fnmatch
+import json
+import sys
+import gc
+
+from benchmarks.cases import BENCHMARKS
+from benchmarks.inputs import REPO_DIR
+
+# Bump this if the JSON result layout changes
+RESULTS_FORMAT = 1
+
+# Fast benchmarks are called repeatedly until one timing takes at least
+#     this many seconds; "min", "median" and "max" are seconds per call
+MIN_TIMING = 0.2
+
+# prepare() is not timed, but it can be much slower than run(); stop
+#     calibrating before the next round of calls would take longer than
+#     this many seconds of wall time
+MAX_PREPARE_TIMING = 2.0
+
+
+def git_commit(repo_dir=REPO_DIR):
+    """Return the git commit hash of `repo_dir`, or None if git is not available"""
+    try:
+        output = subprocess.run(
+            ["git", "rev-parse", "HEAD"],
+            cwd=repo_dir,
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return output.stdout.strip()
+
+
+def time_calls(run, number, prepare=None):
+    """Return the seconds taken by `number` calls of `run`.  If `prepare` is set, each call is `run(prepare())`, and `prepare()` is not timed"""
+    if prepare is None:
+        start = perf_counter()
+        for _ in range(number):
+            run()
+        return perf_counter() - start
+
+    seconds = 0.0
+    for _ in range(number):
+        arg = prepare()
+        start = perf_counter()
+        run(arg)
+        seconds += perf_counter() - start
+    return seconds
+
+
+def calibrate(run, prepare=None):
+    """Return how many calls of `run` take at least MIN_TIMING seconds, like timeit.Timer().autorange(); the first call also warms up caches"""
+    number = 1
+    while True:
+        start = perf_counter()
+        if time_calls(run, number, prepare) >= MIN_TIMING:
+            return number
+        if prepare is not None and 10 * (perf_counter() - start) > MAX_PREPARE_TIMING:
+            return number
+        number *= 10
+
+
+def run_benchmarks(sizes, names=None, repeat=3, repo_dir=REPO_DIR, log=None):
+    """Run all benchmarks whose name matches one of the fnmatch patterns in `names` (default: all) at each size in `sizes`, and return the results as a dict.  `repo_dir` is only recorded in the results; the caller must put its ciscoconfparse on sys.path"""
+    from ciscoconfparse.ciscoconfparse import get_version_number
+
+    results = []
+    for name, setup, max_size in BENCHMARKS:
+        if names and not any(fnmatch.fnmatch(name, pattern) for pattern in names):
+            continue
+        for size in sizes:
+            if size > max_size:
+                continue
+
+            # setup() may also return a prepare() callable, which builds a
+            #     fresh input for each run() call outside of the timer
+            run, num_items, *prepare = setup(size)
+            prepare = prepare[0] if prepare else None
+            number = calibrate(run, prepare)
+            timings = []
+            for _ in range(repeat):
+                gc.collect()
+                timings.append(time_calls(run, number, prepare) / number)
+
+            result = {
+                "name": name,
+                "size": size,
+                "items": num_items,
+                "repeat": repeat,
+                "number": number,
+                "min": min(timings),
+                "median": median(timings),
+                "max": max(timings),
+                "items_per_second": num_items / min(timings) if min(timings) > 0 else None,
+            }
+            results.append(result)
+            if log is not None:
+                log(f"{name:<32} {size:>9} {result['min']:>10.4f} sec {int(result['items_per_second'] or 0):>12} items/sec")
+
+    return {
+        "format": RESULTS_FORMAT,
+        "created": datetime.datetime.now(datetime.timezone.utc).isoformat(),
+        "repo": str(repo_dir),
+        "git_commit": git_commit(repo_dir),
+        "ciscoconfparse_version": get_version_number(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "results": results,
+    }
+
+
+def compare_results(baseline, current, threshold=0.10):
+    """Compare the `min` timings of two result dicts, and return a tuple: (a list of rows, a list of regressed rows).  A row is (name, size, baseline seconds, current seconds, current / baseline); it regressed if the ratio exceeds 1 + `threshold`"""
+    for results in (baseline, current):
+        if results.get("format") != RESULTS_FORMAT:
+            raise ValueError(f"Cannot compare benchmark results with format={results.get('format')}")
+
+    baseline_timings = {(row["name"], row["size"]): row["min"] for row in baseline["results"]}
+    rows = []
+    regressions = []
+    for row in current["results"]:
+        key = (row["name"], row["size"])
+        if key not in baseline_timings:
+            continue
+        before = baseline_timings[key]
+        ratio = row["min"] / before if before > 0 else float("inf")
+        compared = (row["name"], row["size"], before, row["min"], ratio)
+        rows.append(compared)
+        if ratio > 1.0 + threshold:
+            regressions.append(compared)
+    return rows, regressions
+
+
+def load_results(filename):
+    with open(filename, encoding="utf-8") as fh:
+        return json.load(fh)
+
+
+def write_results(results, filename):
+    if filename == "-":
+        json.dump(results, sys.stdout, indent=2)
+        sys.stdout.write("\n")
+        return
+    with open(filename, "w", encoding="utf-8") as fh:
+        json.dump(results, fh, indent=2)
+        fh.write("\n")
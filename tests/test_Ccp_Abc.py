@@ -554,3 +554,56 @@ policy-map SHAPE_HEIR
     # Check that base assumption is True... we are checking the right parent
     assert obj.text == "interface GigabitEthernet 1/1"
     assert uut_result["vlan"] == 911
+
+
+def testVal_diff_id_list_cache_invalidation():
+    """Test that the cached diff_id_list follows text and parent changes"""
+    config = [
+        "interface GigabitEthernet 1/1",
+        " description uplink",
+        "interface GigabitEthernet 1/2",
+    ]
+    cfg = CiscoConfParse(config, factory=False)
+    parent, child, other = cfg.objs[0], cfg.objs[1], cfg.objs[2]
+
+    uut = child.diff_id_list
+    assert uut == [child.line_id, parent.line_id]
+    assert child.diff_id_list == uut
+
+    parent.text = "interface GigabitEthernet 1/3"
+    assert child.diff_id_list != uut
+    assert child.diff_id_list == [child.line_id, parent.line_id]
+
+    child.parent = other
+    assert child.diff_id_list == [child.line_id, other.line_id]
+
+
+def testVal_child_keyword_index_01():
+    """Test the children keyword index and keyword-bucket child searches"""
+    config = [
+        "interface GigabitEthernet 1/1",
+        " description shutdown port",
+        " switchport mode access",
+        " shutdown",
+        " switchport access vlan 10",
+        " shutdown-delay 5",
+    ]
+    cfg = CiscoConfParse(config, factory=False)
+    parent = cfg.objs[0]
+
+    uut = parent.child_keyword_index()
+    assert sorted(uut.keys()) == ["description", "shutdown", "shutdown-delay", "switchport"]
+    assert [obj.linenum for obj in uut["switchport"]] == [2, 4]
+
+    assert [obj.linenum for obj in parent.re_search_children(r"^\s+shutdown")] == [3, 5]
+    assert [obj.linenum for obj in parent.re_search_children(r"^\s+shutdown$")] == [3]
+    assert parent.has_child_with(r"^\s+switchport\s+mode\s+access") is True
+    assert parent.re_match_iter_typed(r"^\s+switchport\saccess\svlan\s(\d+)", result_type=int, recurse=False) == 10
+    # Unanchored regex still search every child
+    assert [obj.linenum for obj in parent.re_search_children(r"shutdown")] == [1, 3, 5]
+
+    # The index is rebuilt after text changes or children are removed...
+    cfg.objs[2].text = " no shutdown"
+    assert [obj.linenum for obj in parent.re_search_children(r"^\s+switchport")] == [4]
+    parent.children.remove(cfg.objs[3])
+    assert [obj.linenum for obj in parent.re_search_children(r"^\s+shutdown")] == [5]
@@ -38,13 +38,18 @@ r""" test_Ccp_Util.py - Parse, Query, Build, and Modify IOS-style configs
 
 import ipaddress
 from ipaddress import IPv4Network, IPv6Network, IPv4Address, IPv6Address
+from operator import attrgetter
 from loguru import logger
 import pytest
 from ciscoconfparse.ccp_util import CiscoRange
 from ciscoconfparse.ccp_util import CiscoIOSInterface, CiscoIOSXRInterface
+from ciscoconfparse.ccp_util import FrozenCiscoIOSInterface
 from ciscoconfparse.ccp_util import _RGX_IPV4ADDR, _RGX_IPV6ADDR
 from ciscoconfparse.ccp_util import IPv6Obj, IPv4Obj, L4Object, ip_factory
 from ciscoconfparse.ccp_util import dns_lookup, reverse_dns_lookup, collapse_addresses
+from ciscoconfparse.ccp_util import IPPrefixTrie, IPAddressSpace
+from ciscoconfparse.ccp_util import configure_ip_intern_cache, ip_intern_cache_info
+from ciscoconfparse.ciscoconfparse import CiscoConfParse
 import sys
 
 sys.path.insert(0, "..")
@@ -490,6 +495,76 @@ def testIPv4Obj_from_int():
     assert IPv4Obj(2886729984).ip == IPv4Address('172.16.1.0')
 
 
+def testIPv4Obj_from_int_prefixlen():
+    """Check the IPv4Obj().from_int() fast-path constructor"""
+    uut = IPv4Obj.from_int(3221225985, 24)
+    assert uut == IPv4Obj("192.0.2.1/24")
+    assert uut.network == IPv4Network("192.0.2.0/24")
+    with pytest.raises(ipaddress.AddressValueError):
+        IPv4Obj.from_int(3221225985, 33)
+
+
+@pytest.mark.parametrize(
+    "addr, mask", [("192.0.2.1", "255.255.255.0"), ("192.0.2.1", "24"), ("192.0.2.1", "0.0.0.255"),]
+)
+def testIPv4Obj_from_parts(addr, mask):
+    """Check the IPv4Obj().from_parts() fast-path constructor"""
+    assert IPv4Obj.from_parts(addr, mask) == IPv4Obj(f"{addr}/{mask}")
+    assert IPv4Obj.from_parts(addr, mask).prefixlen == 24
+
+
+def testIPv6Obj_from_int_and_parts():
+    """Check the IPv6Obj() fast-path constructors"""
+    assert IPv6Obj.from_int(42540766411282592856903984951653826561, 64) == IPv6Obj("2001:db8::1/64")
+    assert IPv6Obj.from_parts("2001:db8::1", "64") == IPv6Obj("2001:db8::1/64")
+    with pytest.raises(ipaddress.AddressValueError):
+        IPv6Obj.from_parts("2001:db8::1", "129")
+
+
+def testIPv4Obj_intern_cache():
+    """Check that interned address strings are parsed once, but still return independent objects"""
+    configure_ip_intern_cache(maxsize=16)
+    try:
+        obj01 = IPv4Obj("192.0.2.1/24")
+        obj02 = IPv4Obj("192.0.2.1/24")
+        obj02.prefixlen = 30
+        assert ip_intern_cache_info()["ipv4"].hits == 1
+        assert obj01 == IPv4Obj.from_int(3221225985, 24)
+        assert obj02 == IPv4Obj.from_int(3221225985, 30)
+    finally:
+        configure_ip_intern_cache(maxsize=0)
+    assert ip_intern_cache_info()["ipv4"] is None
+
+
+def testIPv4Obj_integer_storage():
+    """IPv4Obj() only stores integers and derives the stdlib objects on demand"""
+    uut = IPv4Obj("192.0.2.5/24")
+    assert not hasattr(uut, "__dict__")
+    assert uut._ip == 3221225989
+    assert uut.ip_object == IPv4Address("192.0.2.5")
+    assert uut.network_object == IPv4Network("192.0.2.0/24")
+    assert uut.netmask == IPv4Address("255.255.255.0")
+    assert uut.hostmask == IPv4Address("0.0.0.255")
+    assert uut.broadcast == IPv4Address("192.0.2.255")
+    assert uut.as_decimal_network == 3221225984
+    assert hash(uut) == hash(IPv4Obj.from_int(3221225989, 24))
+    uut.prefixlen = "255.255.0.0"
+    assert uut.as_cidr_addr == "192.0.2.5/16"
+
+
+def testIPv6Obj_integer_storage():
+    """IPv6Obj() only stores integers and derives the stdlib objects on demand"""
+    uut = IPv6Obj("2001:db8::5/64")
+    assert not hasattr(uut, "__dict__")
+    assert uut.network_object == IPv6Network("2001:db8::/64")
+    assert uut.netmask == IPv6Address("ffff:ffff:ffff:ffff::")
+    assert uut.as_decimal_network_maxint == int(IPv6Address("2001:db8::ffff:ffff:ffff:ffff"))
+    assert sorted([IPv6Obj("2001:db8::5/64"), IPv6Obj("2001:db8::/32")]) == [
+        IPv6Obj("2001:db8::/32"),
+        IPv6Obj("2001:db8::5/64"),
+    ]
+
+
 def testIPv4Obj_neq_01():
     """Simple in-equality test fail (ref - Github issue #180)"""
     assert IPv4Obj("1.1.1.1/24") != ""
@@ -605,6 +680,29 @@ def testIPv6Obj_lt_01():
     assert IPv6Obj("::1") < IPv6Obj("::2")
 
 
+def testIPv4Obj_IPv6Obj_compat_attributes_01():
+    """Test the read-only finished_parsing / v6addr_prefixlen compatibility properties, and the network_object setter warning"""
+    assert IPv4Obj("192.0.2.1/24").finished_parsing is True
+    assert IPv4Obj().finished_parsing is False
+    assert IPv6Obj("2001:db8::1/64").finished_parsing is True
+
+    with pytest.raises(AttributeError):
+        IPv4Obj("192.0.2.1/24").finished_parsing = False
+
+    with pytest.warns(DeprecationWarning):
+        assert IPv6Obj("2001:db8::1/64").v6addr_prefixlen == "2001:db8::1/64"
+
+    obj = IPv4Obj("192.0.2.1/24")
+    # The network of this address at the new prefixlen; no warning...
+    obj.network_object = IPv4Network("192.0.2.0/25")
+    assert obj.as_cidr_addr == "192.0.2.1/25"
+    # A different network only sets the prefixlen...
+    with pytest.warns(DeprecationWarning):
+        obj.network_object = IPv4Network("10.0.0.0/8")
+    assert obj.as_cidr_net == "192.0.0.0/8"
+    assert str(obj.ip) == "192.0.2.1"
+
+
 def testIPv6Obj_IPv4_embedded_in_IPv6_01():
     """Test IPv6Obj with an IPv4 address (192.168.1.254) embedded in an IPv6 address"""
     assert IPv6Obj("::192.168.1.254") == IPv6Obj("::c0a8:1fe")
@@ -640,6 +738,116 @@ def test_collapse_addresses_02():
     assert collapsed_list[1].network_address == IPv4Obj('192.0.2.128/25').ip
 
 
+def test_collapse_addresses_03():
+    """Check collapse_addresses() with mixed IPv4 / IPv6 input and adjacent, non-aligned prefixes"""
+    net_list = [
+        IPv6Obj("2001:db8:8000::/33"),
+        IPv4Network("192.0.2.0/25"),
+        IPv4Obj("192.0.2.128/25"),
+        IPv4Obj("192.0.3.0/24"),
+        IPv4Obj("192.0.4.0/24"),
+        IPv6Network("2001:db8::/33"),
+    ]
+    assert list(collapse_addresses(net_list)) == [
+        IPv4Network("192.0.2.0/23"),
+        IPv4Network("192.0.4.0/24"),
+        IPv6Network("2001:db8::/32"),
+    ]
+
+
+def testIPAddressSpace_01():
+    """Check IPAddressSpace() merging, membership and coverage"""
+    uut = IPAddressSpace(["10.0.0.0/25", "10.0.0.128 255.255.255.128", "10.0.0.64/26", "2001:db8::/64"])
+    uut.add_range("10.0.1.1", "10.0.1.6")
+    assert uut.ranges(4) == [(167772160, 167772415), (167772417, 167772422)]
+    assert uut.collapse() == [
+        IPv4Obj("10.0.0.0/24"),
+        IPv4Obj("10.0.1.1/32"),
+        IPv4Obj("10.0.1.2/31"),
+        IPv4Obj("10.0.1.4/31"),
+        IPv4Obj("10.0.1.6/32"),
+        IPv6Obj("2001:db8::/64"),
+    ]
+    assert uut.num_addresses(version=4) == 262
+    assert "10.0.0.200" in uut
+    assert IPv4Obj("10.0.1.2/31") in uut
+    assert "10.0.1.0" not in uut
+    assert "2001:db8::1" in uut
+    assert uut.coverage()["ipv4_prefixes"] == 5
+    assert uut.coverage()["ipv6_addresses"] == 2**64
+    with pytest.raises(ValueError):
+        uut.add_range("10.0.1.6", "10.0.1.1")
+
+
+def testIPPrefixTrie_longest_match_01():
+    """Check longest-prefix-match for IPv4 and IPv6 prefixes"""
+    uut = IPPrefixTrie(["0.0.0.0/0", "10.0.0.0/8", "10.1.2.0/24", "10.1.2.0/25", "2001:db8::/32"])
+    assert len(uut) == 5
+    assert uut.longest_match("10.1.2.3") == IPv4Obj("10.1.2.0/25")
+    assert uut.longest_match("10.1.2.200") == IPv4Obj("10.1.2.0/24")
+    assert uut.longest_match(IPv4Obj("10.9.0.0/16")) == IPv4Obj("10.0.0.0/8")
+    assert uut.longest_match("192.0.2.1") == IPv4Obj("0.0.0.0/0")
+    assert uut.longest_match("2001:db8::1") == IPv6Obj("2001:db8::/32")
+    assert uut.longest_match("2001:db9::1") is None
+
+
+def testIPPrefixTrie_lookup_01():
+    """Check that values are stored per-prefix and batch lookups align with their inputs"""
+    uut = IPPrefixTrie()
+    uut.insert(IPv4Network("192.0.2.0/24"), "first")
+    uut.insert(IPv4Obj("192.0.2.0/24"), "second")
+    uut.insert("192.0.2.128/25", "third")
+    assert IPv4Obj("192.0.2.0/24") in uut
+    assert IPv4Obj("192.0.2.0/26") not in uut
+    assert uut.get("192.0.2.0/24") == ["first", "second"]
+    assert uut.lookup_many(["192.0.2.1", "192.0.2.129", "198.51.100.1"]) == [
+        ["first", "second"],
+        ["third"],
+        None,
+    ]
+    assert [ii[0] for ii in uut.all_matches("192.0.2.129")] == [
+        IPv4Obj("192.0.2.0/24"),
+        IPv4Obj("192.0.2.128/25"),
+    ]
+
+
+def testIPPrefixTrie_overlaps_01():
+    """Check overlapping, duplicate and shadowed prefix detection"""
+    uut = IPPrefixTrie(["10.0.0.0/8", "10.1.0.0/16", "10.1.0.0/17", "10.1.128.0/17", "10.1.0.0/16"])
+    assert list(uut) == [
+        IPv4Obj("10.0.0.0/8"),
+        IPv4Obj("10.1.0.0/16"),
+        IPv4Obj("10.1.0.0/17"),
+        IPv4Obj("10.1.128.0/17"),
+    ]
+    assert uut.overlapping_prefixes() == [
+        (IPv4Obj("10.0.0.0/8"), IPv4Obj("10.1.0.0/16")),
+        (IPv4Obj("10.1.0.0/16"), IPv4Obj("10.1.0.0/17")),
+        (IPv4Obj("10.1.0.0/16"), IPv4Obj("10.1.128.0/17")),
+    ]
+    assert [ii[0] for ii in uut.duplicate_prefixes()] == [IPv4Obj("10.1.0.0/16")]
+    assert uut.shadowed_prefixes() == [IPv4Obj("10.1.0.0/16")]
+
+
+def testIPPrefixTrie_from_config_01():
+    """Build an IPPrefixTrie from IOS static routes"""
+    config = [
+        "ip route 0.0.0.0 0.0.0.0 192.0.2.1",
+        "ip route 10.0.0.0 255.0.0.0 192.0.2.2",
+        "ip route vrf RED 10.1.0.0 255.255.0.0 192.0.2.3",
+        "ipv6 route 2001:db8::/32 Null0",
+    ]
+    parse = CiscoConfParse(config, syntax="ios", factory=True)
+    uut = IPPrefixTrie.from_config(parse)
+    assert len(uut) == 4
+    assert uut.lookup("10.1.1.1")[0].text == "ip route vrf RED 10.1.0.0 255.255.0.0 192.0.2.3"
+    assert uut.lookup("2001:db8::1")[0].text == "ipv6 route 2001:db8::/32 Null0"
+
+    uut = IPPrefixTrie.from_config(parse, vrf="")
+    assert len(uut) == 3
+    assert uut.lookup("10.1.1.1")[0].text == "ip route 10.0.0.0 255.0.0.0 192.0.2.2"
+
+
 def test_dns_lookup():
     # Use my hostname to test...
     test_hostname = "pennington.net"
@@ -810,6 +1018,43 @@ def test_CiscoIOSInterface_10():
     assert uut.interface_class == "multipoint"
 
 
+def test_CiscoIOSInterface_parse_cache_01():
+    """Check that cached interface name parses do not share state between CiscoIOSInterface() instances"""
+    uut_01 = CiscoIOSInterface("Serial2/1/8.3:6 point-to-point")
+    uut_01.port = 9
+    uut_02 = CiscoIOSInterface("Serial2/1/8.3:6 point-to-point")
+    assert uut_02.port == 8
+    assert str(uut_01) == "Serial2/1/9.3:6 point-to-point"
+    assert str(uut_02) == "Serial2/1/8.3:6 point-to-point"
+
+
+def test_FrozenCiscoIOSInterface_01():
+    """Check that FrozenCiscoIOSInterface() is shared, immutable and equal to CiscoIOSInterface()"""
+    uut = FrozenCiscoIOSInterface.intern("GigabitEthernet1/0/1")
+    assert uut is FrozenCiscoIOSInterface.intern("GigabitEthernet1/0/1")
+    assert uut == CiscoIOSInterface("GigabitEthernet1/0/1")
+    assert hash(uut) == hash(CiscoIOSInterface("GigabitEthernet1/0/1"))
+    assert uut.sort_list == [1, 0, 1, None, None, None]
+    assert str(uut) == "GigabitEthernet1/0/1"
+    with pytest.raises(AttributeError):
+        uut.port = 2
+    assert uut.port == 1
+    assert sorted([FrozenCiscoIOSInterface.intern("Gi1/0/10"), uut]) == [uut, FrozenCiscoIOSInterface.intern("Gi1/0/10")]
+
+
+def test_CiscoIOSInterface_sort_key_01():
+    """Check that CiscoIOSInterface().sort_key orders interfaces like sort_list and follows attribute changes"""
+    uut = CiscoIOSInterface("Serial1/0.5:3 point-to-point")
+    assert uut.sort_key == (1, -1, 0, 5, 3, "point-to-point")
+    uut.port = 7
+    assert uut.sort_key == (1, -1, 7, 5, 3, "point-to-point")
+    intfs = [CiscoIOSInterface(ii) for ii in ("Gi1/0/10", "Gi1/0/2", "Gi2/0/1", "Gi1/0/2.100")]
+    result_correct = ["Gi1/0/2", "Gi1/0/2.100", "Gi1/0/10", "Gi2/0/1"]
+    assert [str(ii) for ii in sorted(intfs, key=attrgetter("sort_key"))] == result_correct
+    assert [str(ii) for ii in sorted(intfs)] == result_correct
+    assert str(min(intfs)) == "Gi1/0/2"
+
+
 def test_CiscoRange_01():
     """Basic vlan range test"""
     result_correct = {1, 2, 3}
@@ -1013,6 +1258,41 @@ def test_CiscoRange_compressed_str_02():
     assert CiscoRange(uut_str, result_type=int).as_compressed_str() == "1-3,6-9,911"
 
 
+def test_CiscoRange_intervals_01():
+    """Check integer CiscoRange() membership and compression without expanding the intervals"""
+    uut = CiscoRange("1-4094", result_type=int)
+    assert uut._intervals == [(1, 4094)]
+    assert len(uut) == 4094
+    assert 911 in uut
+    assert 4095 not in uut
+    assert uut.as_compressed_str() == "1-4094"
+    assert uut._members is None
+    # Indexing expands the intervals into a list
+    assert uut[2] == 3
+    assert uut._intervals is None
+    assert 911 in uut
+
+
+def test_CiscoRange_intervals_02():
+    """Check integer CiscoRange() union(), intersection() and difference()"""
+    uut_01 = CiscoRange("1-100,200", result_type=int)
+    uut_02 = CiscoRange("50-150,199", result_type=int)
+    assert uut_01.union(uut_02).as_compressed_str() == "1-150,199,200"
+    assert uut_01.intersection(uut_02).as_compressed_str() == "50-100"
+    assert uut_01.difference(uut_02).as_compressed_str() == "1-49,200"
+    assert (uut_01 - uut_02) == CiscoRange("1-49,200", result_type=int)
+    assert CiscoRange(result_type=int).append(5).append(6).remove(5).as_list() == [6]
+
+
+def test_CiscoRange_set_operations_01():
+    """Check CiscoRange() union(), intersection() and difference() with interfaces"""
+    uut_01 = CiscoRange("Eth1/1-5")
+    uut_02 = CiscoRange("Eth1/3-9")
+    assert uut_01.intersection(uut_02).as_list(result_type=str) == ["Eth1/3", "Eth1/4", "Eth1/5"]
+    assert uut_01.difference(uut_02).as_list(result_type=str) == ["Eth1/1", "Eth1/2"]
+    assert len(uut_01.union(uut_02)) == 9
+
+
 def test_CiscoRange_contains_01():
     """Check that the exact results are correct that a CiscoRange() contains an input"""
     uut_str = "Ethernet1/1-20"
@@ -27,14 +27,21 @@ import pytest
 from ciscoconfparse.ciscoconfparse import CiscoConfParse
 from ciscoconfparse.ciscoconfparse import IOSCfgLine, IOSIntfLine
 from ciscoconfparse.ciscoconfparse import parse_line_braces
+from ciscoconfparse.ciscoconfparse import _tokenize_brace_line
+from ciscoconfparse.ciscoconfparse import _parse_line_braces_regex
 from ciscoconfparse.ciscoconfparse import CiscoPassword
 from ciscoconfparse.ciscoconfparse import HDiff
+from ciscoconfparse.ciscoconfparse import HDiffTemplate
+from ciscoconfparse.ciscoconfparse import ConfigQuery
+from ciscoconfparse.ciscoconfparse import ParseStats
+from ciscoconfparse.ciscoconfparse import QueryProfiler
+from ciscoconfparse.ciscoconfparse import _myers_matches
 from ciscoconfparse.ciscoconfparse import Diff
 from ciscoconfparse.models_junos import JunosCfgLine
 from ciscoconfparse.ccp_util import IPv4Obj
 from ciscoconfparse.ccp_abc import BaseCfgLine
 
-from ciscoconfparse.errors import InvalidParameters
+from ciscoconfparse.errors import InvalidParameters, RequirementFailure
 
 from operator import attrgetter
 from itertools import repeat
@@ -191,6 +198,27 @@ def testParse_parse_line_braces_02():
     assert uut == (-1, -1, "")
 
 
+@pytest.mark.parametrize(
+    "filename",
+    [
+        "sample_01.junos",
+        "sample_02.junos",
+        "sample_03.junos",
+        "sample_04.junos",
+        "sample_01.f5",
+        "sample_02.f5",
+    ],
+)
+def testParse_parse_line_braces_tokenizer_parity_01(filename):
+    """Ensure the brace tokenizer returns the same values as the brace regex for every line of the brace-delimited fixtures"""
+    with open(f"{THIS_TEST_PATH}/fixtures/configs/{filename}") as fh:
+        lines = fh.read().splitlines()
+    extra_lines = ["} else {", "foo { }", "foo {};", "## comment", "# foo # bar", "}}", ";", ""]
+    for line in lines + extra_lines:
+        for comment_delimiter in ["#", "!"]:
+            assert _tokenize_brace_line(line, comment_delimiter) == _parse_line_braces_regex(line, comment_delimiter)
+
+
 def testParse_parse_syntax_f5_as_junos_nofactory_ioscfg_01():
     """Parse fixtures/configs/sample_01.f5 as `syntax='junos'`, `factory=False` and test rendering as Cisco-IOS"""
     result_correct_ioscfg = [
@@ -1753,6 +1781,49 @@ def testValues_find_object_branches_05():
     assert test_result[1][2].text.strip() == "matchthis"
 
 
+def testValues_find_object_branches_06():
+    """Test find_object_branches() with a one-term branchspec, shared branch prefixes and regex_flags"""
+    config = [
+        "interfaces {",
+        "    ge-0/0/0 {",
+        "        unit 0 {",
+        "            family inet {",
+        "                address 192.0.2.1/31;",
+        "                address 192.0.2.3/31;",
+        "            }",
+        "        }",
+        "    }",
+        "    ge-0/0/1 {",
+        "        unit 0 {",
+        "            family inet6;",
+        "        }",
+        "    }",
+        "}",
+    ]
+    parse = CiscoConfParse(config, syntax="junos", comment="#")
+
+    test_result = parse.find_object_branches((r"^interfaces",))
+    assert [[obj.linenum for obj in branch] for branch in test_result] == [[0]]
+
+    branchspec = (r"^interfaces", r"^\s+(\S+)", r"(UNIT\s+\d+)", r"family\s+(inet)\s*$", r"address\s+(\S+)")
+    test_result = parse.find_object_branches(branchspec, regex_flags=re.IGNORECASE)
+    assert [[getattr(obj, "linenum", None) for obj in branch] for branch in test_result] == [
+        [0, 1, 2, 3, 4],
+        [0, 1, 2, 3, 5],
+        [0, 9, 10, None, None],
+    ]
+    # Branches which share a prefix must not share a list
+    assert test_result[0] is not test_result[1]
+
+    branchspec = (r"^interfaces", r"^\s+(\S+)", r"(unit\s+\d+)", r"family\s+(inet)\s*$", r"address\s+(\S+)")
+    test_result = parse.find_object_branches(branchspec, regex_groups=True)
+    assert test_result == [
+        [("interfaces",), ("ge-0/0/0",), ("unit 0",), ("inet",), ("192.0.2.1/31",)],
+        [("interfaces",), ("ge-0/0/0",), ("unit 0",), ("inet",), ("192.0.2.3/31",)],
+        [("interfaces",), ("ge-0/0/1",), ("unit 0",), (None,), (None,)],
+    ]
+
+
 def testValues_find_objects_w_parents(parse_c01):
     correct_result = [
         " switchport",
@@ -1764,6 +1835,56 @@ def testValues_find_objects_w_parents(parse_c01):
     assert correct_result == test_result
 
 
+def testValues_query_01(parse_c01):
+    """Test that CiscoConfParse().query() matches chained find_parent_objects() / find_parent_objects_wo_child() calls"""
+    required = [r"^\s+switchport", r"^\s+power\s+inline"]
+    forbidden = [r"^\s+shutdown"]
+    correct_result = set(parse_c01.find_parent_objects(r"^interface", required[0]))
+    correct_result &= set(parse_c01.find_parent_objects(r"^interface", required[1]))
+    correct_result &= set(parse_c01.find_parent_objects_wo_child(r"^interface", forbidden[0]))
+
+    results = parse_c01.query(ConfigQuery(r"^interface\s+(\S+)", required=required, forbidden=forbidden))
+    assert [result["parent"] for result in results] == sorted(correct_result)
+    assert results[0]["parent_groups"] == (results[0]["parent"].text.split()[1],)
+    assert results[0]["children"][r"^\s+power\s+inline"] == results[0]["parent"].re_search_children(r"^\s+power\s+inline")
+
+
+def testValues_query_02():
+    """Test ConfigQuery() named regexes, optional capture groups and recurse=True"""
+    config = [
+        "policy-map QOS_1",
+        " class GOLD",
+        "  priority percent 10",
+        " class SILVER",
+        "  bandwidth 30",
+        "  random-detect",
+        " class default",
+        "policy-map QOS_2",
+        " class GOLD",
+        "  bandwidth 5",
+    ]
+    parse = CiscoConfParse(config)
+    query = ConfigQuery(
+        r"^policy-map\s+(\S+)",
+        required={"bandwidth": r"^\s+bandwidth\s+(\d+)"},
+        forbidden=[r"^\s+priority"],
+        optional={"wred": r"^\s+random-detect"},
+        recurse=True,
+    )
+    results = parse.query(query)
+    assert len(results) == 1
+    assert results[0]["parent_groups"] == ("QOS_2",)
+    assert results[0]["groups"] == {"bandwidth": ("5",), "wred": None}
+    assert results[0]["children"]["wred"] == []
+
+    # Keyword arguments build the ConfigQuery()...
+    results = parse.query(parentspec=r"^\s+class", required=[r"^\s+bandwidth"], optional={"wred": r"^\s+random-detect"})
+    assert [(result["parent"].linenum, result["groups"]["wred"]) for result in results] == [(3, ()), (8, None)]
+
+    with pytest.raises(InvalidParameters):
+        ConfigQuery(r"^interface", required=3)
+
+
 def testValues_find_objects_w_all_children(parse_c01):
     correct_result = parse_c01.find_objects(r"^interface GigabitEthernet4/[12]")
     test_result = parse_c01.find_objects_w_all_children(
@@ -1897,6 +2018,53 @@ def testValues_delete_lines_03():
     assert parse.ioscfg == correct_result
 
 
+def testValues_delete_objects_01():
+    """Test delete_objects() with overlapping parents / children and a blank line that shifts linenums"""
+    config = [
+        "",
+        "interface FastEthernet0/2",
+        " switchport mode access",
+        " switchport port-security",
+        "!",
+        "interface FastEthernet0/3",
+        " switchport mode access",
+        "!",
+        "end",
+    ]
+    parse = CiscoConfParse(config, syntax="ios")
+    victims = parse.find_objects(r"FastEthernet0/2") + parse.find_objects(r"port-security")
+    assert parse.delete_objects(victims) == 3
+    assert parse.ioscfg == ["!", "interface FastEthernet0/3", " switchport mode access", "!", "end"]
+    assert [obj.linenum for obj in parse.ConfigObjs] == [0, 1, 2, 3, 4]
+
+    # recurse=False leaves the children in place...
+    parse.find_objects(r"^interface")[0].delete(recurse=False)
+    assert parse.ioscfg == ["!", " switchport mode access", "!", "end"]
+
+    with pytest.raises(ValueError):
+        parse.delete_objects(victims, recurse=None)
+
+
+def testValues_re_sub_objects_01():
+    """Test re_sub_objects() on changed, unchanged, ignored and blanked lines"""
+    config = [
+        "interface Serial1/0",
+        " description Serial1/0 uplink",
+        " ip address 192.0.2.1 255.255.255.252",
+        "interface Serial1/1",
+        " shutdown",
+    ]
+    parse = CiscoConfParse(config, syntax="ios")
+    objs = parse.find_objects(r"")
+    unchanged_line_id = objs[2].line_id
+    results = parse.re_sub_objects(objs, r"Serial1/", "Se0/", ignore_rgx=r"description")
+    assert results == ["interface Se0/0", " description Serial1/0 uplink", " ip address 192.0.2.1 255.255.255.252", "interface Se0/1", " shutdown"]
+    assert parse.re_sub_objects(objs[3:], r"^\s+shutdown", "") == ["interface Se0/1", None]
+    assert parse.ioscfg == ["interface Se0/0", " description Serial1/0 uplink", " ip address 192.0.2.1 255.255.255.252", "interface Se0/1"]
+    assert objs[0].line_id == hash("interface Se0/0")
+    assert objs[2].line_id == unchanged_line_id
+
+
 def testValues_replace_lines_01(parse_c01):
     c01_replace_gige_no_exactmatch = [
         "interface GigabitEthernet8/1",
@@ -2682,6 +2850,313 @@ interface Ethernet109/1/4
     assert test_result == correct_result
 
 
+def testValues_HDiff_ios_unified_diffs_contents_02():
+    """Test HDiff() with several added children under the same parent and a duplicate after line"""
+    BEFORE = [
+        "logging trap debugging",
+        "interface GigabitEthernet0",
+        " ip address 1.1.1.1 255.255.255.0",
+        "interface GigabitEthernet1",
+        " shutdown",
+    ]
+    AFTER = [
+        "interface GigabitEthernet0",
+        " no ip proxy-arp",
+        " no ip redirects",
+        " no ip proxy-arp",
+        "interface GigabitEthernet1",
+        " shutdown",
+        "logging 172.28.26.15",
+    ]
+    correct_result = [
+        "-logging trap debugging",
+        " interface GigabitEthernet0",
+        "+ no ip redirects",
+        "+ no ip proxy-arp",
+        "- ip address 1.1.1.1 255.255.255.0",
+        " interface GigabitEthernet1",
+        "  shutdown",
+        "+logging 172.28.26.15",
+    ]
+    test_result = HDiff(BEFORE, AFTER, syntax="ios").unified_diffs_contents()
+
+    assert test_result == correct_result
+
+
+def testValues_HDiff_ios_unified_diffs_contents_03():
+    """Test that HDiff() adds children after their own parent; an after line whose text is an orphan line in the before config (or a child of another parent) is not moved in front of its parent"""
+    BEFORE = [
+        " ip address 1.1.1.1 255.0.0.0",
+        "interface Gi0/1",
+    ]
+    AFTER = [
+        "line vty 0 4",
+        " ip address 1.1.1.1 255.0.0.0",
+    ]
+    correct_result = [
+        "- ip address 1.1.1.1 255.0.0.0",
+        "-interface Gi0/1",
+        "+line vty 0 4",
+        "+ ip address 1.1.1.1 255.0.0.0",
+    ]
+    assert HDiff(BEFORE, AFTER, syntax="ios").unified_diffs(header=False) == correct_result
+
+    BEFORE = [
+        "interface Gi0/2",
+    ]
+    AFTER = [
+        " shutdown",
+        "line vty 0 4",
+        " description x",
+        " shutdown",
+        "interface Gi0/2",
+        "interface Gi0/1",
+    ]
+    correct_result = [
+        " interface Gi0/2",
+        "+ shutdown",
+        "+line vty 0 4",
+        "+ shutdown",
+        "+ description x",
+        "+interface Gi0/1",
+    ]
+    assert HDiff(BEFORE, AFTER, syntax="ios").unified_diffs(header=False) == correct_result
+
+
+def testValues_HDiff_iter_unified_diffs_01():
+    """Test that HDiff().iter_unified_diffs() streams the same lines as HDiff().unified_diffs()"""
+    BEFORE = [
+        "logging trap debugging",
+        "interface GigabitEthernet0",
+        " ip address 1.1.1.1 255.255.255.0",
+        "interface GigabitEthernet1",
+        " shutdown",
+    ]
+    AFTER = [
+        "interface GigabitEthernet0",
+        " no ip proxy-arp",
+        "interface GigabitEthernet2",
+        " shutdown",
+        "logging 172.28.26.15",
+    ]
+    diff = HDiff(BEFORE, AFTER, syntax="ios")
+    uut = diff.iter_unified_diffs(header=False)
+    assert next(uut) == "-logging trap debugging"
+    assert ["-logging trap debugging"] + list(uut) == HDiff(BEFORE, AFTER, syntax="ios").unified_diffs(header=False)
+
+    # The output dicts are not rendered until they are needed...
+    assert diff._all_output_dicts is None
+    assert list(diff.iter_diff_dicts()) == diff.all_output_dicts
+    assert list(diff.iter_unified_diffs(header=False)) == diff.unified_diffs(header=False)
+
+
+def testValues_HDiff_ordered_diff_01():
+    """Test that HDiff(ordered_diff=True) removes and adds reordered ACL and prefix-list entries in place"""
+    BEFORE = [
+        "ip access-list extended FOO",
+        " permit tcp any any eq 22",
+        " permit tcp any any eq 80",
+        " deny ip any any",
+        "ip prefix-list PL seq 5 permit 10.0.0.0/8",
+        "ip prefix-list PL seq 10 permit 172.16.0.0/12",
+        "interface GigabitEthernet0",
+        " shutdown",
+    ]
+    AFTER = [
+        "ip access-list extended FOO",
+        " permit tcp any any eq 80",
+        " permit tcp any any eq 22",
+        " permit tcp any any eq 443",
+        " deny ip any any",
+        "ip prefix-list PL seq 10 permit 172.16.0.0/12",
+        "ip prefix-list PL seq 5 permit 10.0.0.0/8",
+        "interface GigabitEthernet0",
+        " shutdown",
+    ]
+    correct_result = [
+        " ip access-list extended FOO",
+        "- permit tcp any any eq 22",
+        "  permit tcp any any eq 80",
+        "+ permit tcp any any eq 22",
+        "+ permit tcp any any eq 443",
+        "  deny ip any any",
+        "-ip prefix-list PL seq 5 permit 10.0.0.0/8",
+        " ip prefix-list PL seq 10 permit 172.16.0.0/12",
+        "+ip prefix-list PL seq 5 permit 10.0.0.0/8",
+        " interface GigabitEthernet0",
+        "  shutdown",
+    ]
+    test_result = HDiff(BEFORE, AFTER, syntax="ios", ordered_diff=True).unified_diffs(header=False)
+    assert test_result == correct_result
+
+    # Without ordered_diff, only the new ACL entry is added...
+    test_result = HDiff(BEFORE, AFTER, syntax="ios").unified_diffs(header=False)
+    assert [ii for ii in test_result if ii[0] in "+-"] == ["+ permit tcp any any eq 443"]
+
+
+def test_myers_matches_01():
+    """Test that _myers_matches() returns a longest common subsequence"""
+    aa = list("ABCABBA")
+    bb = list("CBABAC")
+    uut = _myers_matches(aa, bb)
+    assert len(uut) == 4
+    assert all(aa[ii] == bb[jj] for ii, jj in uut)
+    assert uut == sorted(uut)
+    assert _myers_matches([], bb) == []
+    assert _myers_matches(aa, aa) == [(ii, ii) for ii in range(len(aa))]
+
+
+def testValues_HDiff_family_diffs_01():
+    """Test that HDiff.family_diffs() merges per-family diffs in the same order as HDiff()"""
+    BEFORE = [
+        "!",
+        "logging trap debugging",
+        "interface GigabitEthernet0",
+        " ip address 1.1.1.1 255.255.255.0",
+        "!",
+        "router bgp 65000",
+        " neighbor 10.1.1.1 remote-as 65001",
+        "interface GigabitEthernet1",
+        " shutdown",
+        "",
+        "router bgp 65000",
+        " neighbor 10.1.1.2 remote-as 65001",
+        "! old comment",
+    ]
+    AFTER = [
+        "interface GigabitEthernet0",
+        " no ip proxy-arp",
+        "!",
+        "router bgp 65000",
+        " neighbor 10.1.1.2 remote-as 65001",
+        " neighbor 10.1.1.3 remote-as 65001",
+        "interface GigabitEthernet2",
+        " shutdown",
+        "! new comment",
+        "logging 172.28.26.15",
+    ]
+    correct_result = HDiff(BEFORE, AFTER, syntax="ios").all_output_dicts
+    for executor in ["thread", "process"]:
+        test_result = HDiff.family_diffs(BEFORE, AFTER, syntax="ios", processes=2, executor=executor)
+        assert test_result == correct_result
+
+    test_result = HDiff.family_diffs(BEFORE, AFTER, processes=2, executor="thread", output_format="unified")
+    assert test_result == HDiff(BEFORE, AFTER, syntax="ios").unified_diffs(header=False)
+
+    # Banners are diffed in a single partition...
+    BANNER = ["banner motd ^", "hello", "^"] + BEFORE
+    test_result = HDiff.family_diffs(BANNER, AFTER, processes=2, executor="thread")
+    assert test_result == HDiff(BANNER, AFTER, syntax="ios").all_output_dicts
+
+
+def testValues_HDiff_prepare_after_diff_many_01():
+    """Test that an HDiff.prepare_after() template gives the same diffs as HDiff() for each device"""
+    AFTER = [
+        "logging 172.28.26.15",
+        "interface GigabitEthernet0",
+        " no ip  proxy-arp",
+    ]
+    BEFORE_CONFIGS = {
+        "rtr1": [
+            "logging trap debugging",
+            "interface GigabitEthernet0",
+            " ip address 1.1.1.1 255.255.255.0",
+        ],
+        "rtr2": AFTER,
+        "rtr3": [
+            "interface GigabitEthernet0",
+            " no ip proxy-arp",
+        ],
+    }
+    template = HDiff.prepare_after(AFTER, syntax="ios")
+    assert isinstance(template, HDiffTemplate)
+
+    correct_result = {
+        name: HDiff(config, AFTER, syntax="ios").unified_diffs_contents()
+        for name, config in BEFORE_CONFIGS.items()
+    }
+    # Diff twice to ensure that template state does not leak between diffs...
+    assert template.diff_many(BEFORE_CONFIGS, output_format="unified") == correct_result
+    assert template.diff_many(BEFORE_CONFIGS, output_format="unified") == correct_result
+    assert template.diff_many(list(BEFORE_CONFIGS.values()), output_format="unified") == list(correct_result.values())
+    assert template.diff(BEFORE_CONFIGS["rtr1"]).unified_diffs_contents() == correct_result["rtr1"]
+
+    # Worker processes parse the template once each...
+    assert template.diff_many(BEFORE_CONFIGS, output_format="unified", processes=2) == correct_result
+
+
+def testValues_HDiff_prepare_after_shared_state_01():
+    """Test that HDiff() instances of the same template keep their own output, even if they are rendered after a later diff of the template"""
+    AFTER = [
+        "interface GigabitEthernet0",
+        " shutdown",
+        "logging 172.28.26.15",
+    ]
+    BEFORE_01 = [
+        "interface GigabitEthernet0",
+        " no shutdown",
+    ]
+    BEFORE_02 = [
+        "logging 172.28.26.15",
+        "hostname rtr2",
+    ]
+    template = HDiff.prepare_after(AFTER, syntax="ios")
+    diff_01 = HDiff(BEFORE_01, template, syntax="ios")
+    diff_02 = HDiff(BEFORE_02, template, syntax="ios")
+    assert diff_01.all_output_dicts == HDiff(BEFORE_01, AFTER, syntax="ios").all_output_dicts
+    assert diff_02.unified_diffs(header=False) == HDiff(BEFORE_02, AFTER, syntax="ios").unified_diffs(header=False)
+
+
+def testValues_HDiff_indented_comment_parent_01():
+    """Test that HDiff() and HDiffTemplate() diffs make indented comments their own parent, so a moved comment is unchanged"""
+    BEFORE = [
+        "interface Gi0/1",
+        " !",
+        " shutdown",
+        "interface Gi0/2",
+        " shutdown",
+    ]
+    AFTER = [
+        "interface Gi0/1",
+        " shutdown",
+        "interface Gi0/2",
+        " !",
+        " shutdown",
+    ]
+    correct_result = [
+        " interface Gi0/1",
+        "  !",
+        "  shutdown",
+        " interface Gi0/2",
+        "  shutdown",
+    ]
+    assert HDiff(BEFORE, AFTER, syntax="ios").unified_diffs(header=False) == correct_result
+
+    template = HDiff.prepare_after(AFTER, syntax="ios")
+    assert template.diff(BEFORE).unified_diffs(header=False) == correct_result
+    assert HDiff(BEFORE, template, syntax="ios").unified_diffs(header=False) == correct_result
+    assert template.diff_many({"rtr1": BEFORE}, output_format="unified") == {"rtr1": correct_result}
+
+
+def testValues_HDiff_input_parse_unchanged_01():
+    """Test that HDiff() does not change the CiscoConfParse() instances which it diffs"""
+    before = CiscoConfParse(["interface  Gi0/1", "  description   foo  ", " ! uplink", " shutdown"])
+    after = CiscoConfParse(["interface Gi0/1", " description bar", " ! uplink"])
+    parses = (before, after)
+    ioscfgs = [parse.ioscfg for parse in parses]
+    parents = [[obj.parent for obj in parse.objs] for parse in parses]
+    children = [[list(obj.children) for obj in parse.objs] for parse in parses]
+
+    HDiff(before, after, syntax="ios").unified_diffs()
+
+    assert [parse.ioscfg for parse in parses] == ioscfgs
+    assert [[obj.parent for obj in parse.objs] for parse in parses] == parents
+    assert [[list(obj.children) for obj in parse.objs] for parse in parses] == children
+    for parse in parses:
+        for obj in parse.objs:
+            assert (obj.diff_side, obj.diff_word, obj.diff_rendered) == ("", "", None)
+
+
 def testValues_req_cfgspec_excl_diff(parse_c01):
     ## test req_cfgspec_excl_diff
     correct_result = [
@@ -2721,6 +3196,27 @@ def testValues_req_cfgspec_all_diff_02(parse_c01):
     assert correct_result == test_result
 
 
+def testValues_req_cfgspec_all_diff_03():
+    """Test that req_cfgspec_all_diff(ignore_ws=True) matches both normalized lines and cfgspec regexes"""
+    config = [
+        "logging    1.1.3.4",
+        "logging 1x1.3.5",
+        "ntp server 10.0.0.1 prefer",
+    ]
+    cfg = CiscoConfParse(config)
+    test_result = cfg.req_cfgspec_all_diff(
+        [
+            "logging 1.1.3.4",
+            # '.' is a regex wildcard in cfgspec lines...
+            "logging 1.1.3.5",
+            "ntp server 10.0.0.1 (prefer|burst)",
+            "ntp server 10.0.0.2",
+        ],
+        ignore_ws=True,
+    )
+    assert test_result == ["ntp server 10.0.0.2"]
+
+
 def testValues_ignore_ws():
     ## test find_lines with ignore_ws flag
     config = ["set snmp community read-only     myreadonlystring"]
@@ -3792,6 +4288,130 @@ def testValues_ConfigList_insert02(parse_c02):
     assert test_result == correct_result
 
 
+def testValues_ConfigList_getattr01(parse_c02):
+    """Test the ConfigList() CiscoConfParse alias and the fallback to ccp_ref attributes"""
+    configlist = parse_c02.ConfigObjs
+    assert configlist.CiscoConfParse is parse_c02
+    assert configlist.ccp_ref is parse_c02
+    assert configlist.ioscfg == parse_c02.ioscfg
+
+    with pytest.raises(AttributeError):
+        configlist.this_attribute_does_not_exist
+
+
+def testValues_ParseStats_01():
+    """Test the CiscoConfParse(stats=...) phase timing, line counts and class histogram"""
+    config = [
+        "hostname Router01",
+        "",
+        "interface GigabitEthernet0/1",
+        " ip address 192.0.2.1 255.255.255.0",
+        "banner motd ^",
+        "",
+        "^",
+    ]
+    assert CiscoConfParse(config).stats is None
+
+    calls = []
+    parse = CiscoConfParse(config, factory=True, stats=lambda phase, seconds, lines: calls.append((phase, lines)))
+    stats = parse.stats
+    assert isinstance(stats, ParseStats)
+    assert [phase for phase, _ in calls] == ["read", "brace_conversion", "input_check", "classify", "link", "banner_mark", "blank_filter"]
+    assert stats.phase_calls == dict.fromkeys(stats.phase_calls, 1)
+    assert stats.line_counts == {"input": 7, "config": 7, "objects": 7, "parsed": 6}
+    assert stats.class_histogram == {"IOSHostnameLine": 1, "IOSCfgLine": 4, "IOSIntfLine": 1}
+
+    results = stats.as_dict()
+    assert set(results) == {"phase_seconds", "phase_calls", "total_seconds", "line_counts", "class_histogram", "regex_cache"}
+    assert results["total_seconds"] == pytest.approx(sum(results["phase_seconds"].values()))
+    assert "childspec_keyword" in results["regex_cache"]
+
+    # commit() re-parses the config; the phase times are added...
+    parse.commit()
+    assert stats.phase_calls["classify"] == 2
+
+    with pytest.raises(InvalidParameters):
+        CiscoConfParse(config, stats="yes")
+
+
+def testValues_QueryProfiler_01(parse_c03):
+    """Test the CiscoConfParse().profile_queries() records and report"""
+    find_objects = parse_c03.find_objects
+    line_method = BaseCfgLine.__dict__["re_match_iter_typed"]
+
+    with parse_c03.profile_queries() as profiler:
+        assert isinstance(profiler, QueryProfiler)
+        for obj in parse_c03.find_objects(r"^interface\s+GigabitEthernet4/[12]$"):
+            obj.re_match_iter_typed(r"switchport\s+access\s+vlan\s+(\d+)", recurse=False)
+            obj.re_match_iter_typed(r"no-such-command\s+(\S+)")
+        # find_parent_objects() calls other queries; only the outer call is recorded...
+        parse_c03.find_parent_objects(r"^interface", r"^\s+shutdown")
+
+    # The query methods are restored after the with block...
+    assert parse_c03.find_objects == find_objects
+    assert "find_objects" not in parse_c03.__dict__
+    assert BaseCfgLine.__dict__["re_match_iter_typed"] is line_method
+
+    assert [record["method"] for record in profiler.records] == [
+        "find_objects",
+        "re_match_iter_typed",
+        "re_match_iter_typed",
+        "re_match_iter_typed",
+        "re_match_iter_typed",
+        "find_parent_objects",
+    ]
+    rows = {(row["method"], row["spec"]): row for row in profiler.report(sort_by="calls")}
+    assert rows[("find_objects", r"^interface\s+GigabitEthernet4/[12]$")]["matches"] == 2
+    assert rows[("find_objects", r"^interface\s+GigabitEthernet4/[12]$")]["scanned"] == len(parse_c03.ConfigObjs)
+    assert rows[("re_match_iter_typed", r"switchport\s+access\s+vlan\s+(\d+)")]["matches"] == 2
+    assert rows[("re_match_iter_typed", r"no-such-command\s+(\S+)")]["matches"] == 0
+    assert rows[("re_match_iter_typed", r"no-such-command\s+(\S+)")]["calls"] == 2
+    assert rows[("find_parent_objects", r"^interface / ^\s+shutdown")]["calls"] == 1
+
+    report = profiler.report()
+    assert report == sorted(report, key=lambda row: row["seconds"], reverse=True)
+    assert "find_parent_objects" in profiler.format_report(limit=10)
+
+    with pytest.raises(InvalidParameters):
+        profiler.report(sort_by="no-such-key")
+
+
+def testValues_QueryProfiler_unordered_exit_01(parse_c02, parse_c03):
+    """Test QueryProfiler() instances of two configs, which do not exit in LIFO order"""
+    line_method = BaseCfgLine.__dict__["re_match_iter_typed"]
+    obj_a = parse_c02.find_objects(r"^interface\s+GigabitEthernet4/1$")[0]
+    obj_b = parse_c03.find_objects(r"^interface\s+GigabitEthernet4/1$")[0]
+
+    profiler_a = parse_c02.profile_queries()
+    profiler_b = parse_c03.profile_queries()
+    profiler_a.__enter__()
+    profiler_b.__enter__()
+    obj_a.re_match_iter_typed(r"switchport\s+access\s+vlan\s+(\d+)")
+    obj_b.re_match_iter_typed(r"switchport\s+access\s+vlan\s+(\d+)")
+    assert len(profiler_a.records) == 1
+    assert len(profiler_b.records) == 1
+
+    # Only one profiler per config...
+    with pytest.raises(RequirementFailure):
+        QueryProfiler(parse_c02).__enter__()
+
+    profiler_a.__exit__(None, None, None)
+    # The inactive profiler stops recording, the other one still records...
+    obj_a.re_match_iter_typed(r"switchport\s+access\s+vlan\s+(\d+)")
+    obj_b.re_match_iter_typed(r"switchport\s+access\s+vlan\s+(\d+)")
+    assert len(profiler_a.records) == 1
+    assert len(profiler_b.records) == 2
+    assert BaseCfgLine.__dict__["re_match_iter_typed"] is not line_method
+
+    profiler_b.__exit__(None, None, None)
+    # The original method is restored after the last profiler exits...
+    assert BaseCfgLine.__dict__["re_match_iter_typed"] is line_method
+    obj_b.re_match_iter_typed(r"switchport\s+access\s+vlan\s+(\d+)")
+    assert len(profiler_b.records) == 2
+    assert "find_objects" not in parse_c02.__dict__
+    assert "find_objects" not in parse_c03.__dict__
+
+
 def test_BaseCfgLine_has_child_with(parse_c03):
     correct_result = [
         'interface GigabitEthernet4/1',
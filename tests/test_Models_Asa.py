@@ -142,6 +142,27 @@ def testVal_object_group_network_02():
     assert obj.networks == result_correct_01
 
 
+def testVal_object_group_network_address_space_01():
+    """Test the merged address space of an object group network"""
+    conf = [
+        "!",
+        "name 1.1.2.20 loghost01",
+        "!",
+        "object-group network INSIDE_addrs",
+        " network-object host loghost01",
+        " network-object host 1.1.3.1",
+        " network-object 1.1.2.2 255.255.255.255",
+        " network-object 1.1.2.0 255.255.255.0",
+        "!",
+    ]
+    cfg_factory = CiscoConfParse(conf, syntax="asa", factory=True)
+    obj = cfg_factory.find_objects(r"object-group\snetwork")[0]
+
+    assert obj.address_space.collapse() == [IPv4Obj("1.1.2.0/24"), IPv4Obj("1.1.3.1/32")]
+    assert obj.address_space.num_addresses() == 257
+    assert "1.1.2.20" in obj.address_space
+
+
 def testVal_ipv4_addr_01():
     conf = [
         "hostname MYASA",